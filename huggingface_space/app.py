@@ -1,81 +1,132 @@
+import asyncio
 import gradio as gr
 import numpy as np
-import pandas as pd
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.preprocessing import StandardScaler
-from sklearn.datasets import load_breast_cancer
+import os
+import threading
 import time
-import json
+
+import sorting_demo
+from batching import MicroBatcher
+from execution import ExecutionLayer
+from result_cache import ResultCache, quantize
+
+# Fast start (the default): pandas, sklearn and the model are loaded in a
+# background thread while the UI already serves; FAST_START=0 loads them
+# before the app starts, as it used to
+FAST_START = os.environ.get('FAST_START', '1') != '0'
+# How long a prediction request waits for a model that is still warming up
+MODEL_WAIT_SECONDS = 60
+# Requests waiting in Gradio's queue beyond which new ones are turned away,
+# and how many calls of a handler without its own limit may run at once
+QUEUE_MAX_SIZE = 256
+DEFAULT_CONCURRENCY_LIMIT = 4
+# Step of each Task 3 slider; predictions are cached per step, not per float
+PREDICTION_STEPS = (0.1, 0.1, 1.0, 10.0)
 
 # Initialize models and data
-scaler = StandardScaler()
+scaler = None
 model = None
-class_names = ['Low Priority', 'Medium Priority', 'High Priority']
+model_key = None
+inference = None
+class_names = None
+_model_ready = threading.Event()
+_warmup_lock = threading.Lock()
+_warmup_thread = None
+_warmup_error = None
+# (label, probabilities) per model key and quantized inputs; a few hundred
+# bytes each. Comparisons are timings, so they are only kept for a while
+# and always shown as cached, with their age.
+prediction_cache = ResultCache(max_bytes=8 * 2**20, ttl=24 * 3600)
+comparison_cache = ResultCache(max_bytes=4 * 2**20, ttl=600)
 
 def initialize_model():
-    """Load and train the model on startup"""
-    global model, scaler
-    
-    data = load_breast_cancer()
-    df = pd.DataFrame(data.data, columns=data.feature_names)
-    df['priority'] = pd.cut(df[data.feature_names[0]], bins=3, labels=[0, 1, 2]).astype(int)
-    
-    X = df[data.feature_names]
-    y = df['priority']
-    
-    X_scaled = scaler.fit_transform(X)
-    
-    model = RandomForestClassifier(n_estimators=100, random_state=42)
-    model.fit(X_scaled, y)
+    """Load the cached model for the current data, training it only on a cache miss"""
+    global model, scaler, model_key, inference, class_names
+    # Imported here: together they cost seconds that the UI should not wait for
+    from forest_compiler import compile_forest
+    from inference import CLASS_NAMES, InferenceContext, load_model
+    
+    model, scaler, model_key = load_model()
+    class_names = CLASS_NAMES
+    # Requests run on the flattened forest; probabilities match sklearn exactly
+    inference = InferenceContext(model, scaler, compiled=compile_forest(model))
+    # Predictions of any previous model are dropped
+    prediction_cache.set_version(model_key)
     
     return "Model initialized successfully"
 
+def _warm_model():
+    global _warmup_thread, _warmup_error
+    try:
+        initialize_model()
+    except BaseException as e:
+        # Waiting requests are released with the error, and the next
+        # request starts a new warm-up instead of failing forever
+        with _warmup_lock:
+            _warmup_error = e
+            _warmup_thread = None
+            _model_ready.set()
+        raise
+    _model_ready.set()
+
+def warm_model_async():
+    """Start loading the model in a background thread, unless loaded or loading; returns the thread"""
+    global _warmup_thread, _warmup_error
+    with _warmup_lock:
+        if _warmup_thread is None and inference is None:
+            _warmup_error = None
+            _model_ready.clear()
+            _warmup_thread = threading.Thread(target=_warm_model, name='model-warmup', daemon=True)
+            _warmup_thread.start()
+    return _warmup_thread
+
+def wait_for_model(timeout=MODEL_WAIT_SECONDS):
+    """The InferenceContext, once warm-up has finished (None if it failed or timed out)"""
+    if inference is None:
+        warm_model_async()
+        _model_ready.wait(timeout)
+    return inference
+
+def model_unavailable():
+    """The Task 3 results text when wait_for_model() returned None"""
+    if _warmup_error is not None:
+        return (f"Error: loading the model failed ({type(_warmup_error).__name__}: {_warmup_error}). "
+                f"The next prediction tries again.")
+    return "The model is still loading; try again in a moment."
+
+def _predict_rows(rows):
+    """Batch function behind prediction_batcher: one (label, probabilities) per row"""
+    labels, probabilities = inference.predict_batch(rows)
+    return list(zip(labels, probabilities))
+
+# CPU-bound handlers run in worker processes, inference in its own threads
+execution = ExecutionLayer()
+
+# Concurrent predict_priority requests share one predict_proba call
+prediction_batcher = MicroBatcher(_predict_rows, max_batch_size=64, max_wait_ms=2.0,
+                                  executor=execution.inference_pool)
+
 # Task 1: Code Completion Demo
-def compare_sorting(data_size, sort_key):
-    """Compare manual vs AI sorting performance"""
-    
-    data = [
-        {'name': f'item_{i}', 'priority': np.random.randint(1, 100), 'value': np.random.random()}
-        for i in range(data_size)
-    ]
-    
-    # Manual bubble sort timing
-    start = time.perf_counter()
-    manual_data = data.copy()
-    n = len(manual_data)
-    for i in range(n):
-        for j in range(0, n - i - 1):
-            if manual_data[j][sort_key] > manual_data[j + 1][sort_key]:
-                manual_data[j], manual_data[j + 1] = manual_data[j + 1], manual_data[j]
-    manual_time = (time.perf_counter() - start) * 1000
-    
-    # AI-suggested sort timing
-    start = time.perf_counter()
-    ai_data = sorted(data, key=lambda x: x[sort_key])
-    ai_time = (time.perf_counter() - start) * 1000
-    
-    speedup = manual_time / ai_time if ai_time > 0 else 0
-    
-    result = f"""
-    Dataset Size: {data_size} items
-    Sort Key: {sort_key}
-    
-    Manual Implementation (Bubble Sort):
-    - Time: {manual_time:.4f} ms
-    - Algorithm: O(n²) complexity
-    
-    AI-Suggested Implementation (Timsort):
-    - Time: {ai_time:.4f} ms
-    - Algorithm: O(n log n) complexity
-    
-    Performance Improvement: {speedup:.2f}x faster
-    
-    Analysis: The AI-suggested implementation using Python's built-in sorted() 
-    function significantly outperforms manual bubble sort, especially as dataset 
-    size increases. This demonstrates the value of leveraging optimized libraries.
-    """
-    
-    return result
+async def compare_sorting(data_size, sort_key):
+    """Compare manual vs AI sorting performance, in the CPU worker pool"""
+    import pandas as pd
+    
+    key = (int(data_size), sort_key)
+    cached = comparison_cache.get(key)
+    if cached is None:
+        result, rows = await execution.run_cpu('compare_sorting', sorting_demo.compare_sorting, *key)
+        comparison_cache.put(key, (time.time(), result, rows))
+    else:
+        measured_at, result, rows = cached
+        age = int(time.time() - measured_at)
+        stamp = time.strftime('%H:%M:%S UTC', time.gmtime(measured_at))
+        result = (f"\n    Cached result: measured {age // 60} min {age % 60} s ago ({stamp}), "
+                  f"not re-run for this request.\n" + result)
+    # Both axes are log10 so the O(n²) and O(n log n) curves fit on one plot
+    curve = pd.DataFrame(rows)
+    curve['log10(size)'] = np.log10(curve['size'])
+    curve['log10(ms)'] = np.log10(np.maximum(curve['seconds'] * 1000, 1e-6))
+    return result, curve
 
 # Task 2: Test Automation Demo
 def simulate_test_automation(test_type, username, password):
@@ -129,23 +180,36 @@ def simulate_test_automation(test_type, username, password):
     return result
 
 # Task 3: Predictive Analytics Demo
-def predict_priority(mean_radius, mean_texture, mean_perimeter, mean_area):
-    """Predict issue priority based on features"""
-    
-    if model is None:
-        return "Error: Model not initialized. Please refresh the page."
+async def predict_priority(mean_radius, mean_texture, mean_perimeter, mean_area):
+    """Predict issue priority based on features; concurrent requests are micro-batched"""
     
-    # Create feature vector with zeros for unused features
-    data = load_breast_cancer()
-    features = np.zeros((1, len(data.feature_names)))
-    features[0, 0] = mean_radius
-    features[0, 1] = mean_texture
-    features[0, 2] = mean_perimeter
-    features[0, 3] = mean_area
-    
-    features_scaled = scaler.transform(features)
-    prediction = model.predict(features_scaled)[0]
-    probabilities = model.predict_proba(features_scaled)[0]
+    async with execution.track('predict_priority'):
+        # Waiting for warm-up happens off the event loop
+        if inference is None and await asyncio.to_thread(wait_for_model) is None:
+            return model_unavailable()
+        
+        inputs = (mean_radius, mean_texture, mean_perimeter, mean_area)
+        key = (model_key,) + quantize(inputs, PREDICTION_STEPS)
+        cached = prediction_cache.get(key)
+        if cached is None:
+            cached = await prediction_batcher.submit(inputs)
+            prediction_cache.put(key, cached)
+        prediction, probabilities = cached
+    
+    return format_prediction(mean_radius, mean_texture, mean_perimeter, mean_area,
+                             prediction, probabilities)
+
+def execution_metrics():
+    """Per-handler metrics, the prediction batcher's histograms and cache counters"""
+    return {
+        **execution.stats(),
+        'batching': prediction_batcher.stats(),
+        'caches': {'predictions': prediction_cache.stats(), 'comparisons': comparison_cache.stats()},
+    }
+
+def format_prediction(mean_radius, mean_texture, mean_perimeter, mean_area,
+                      prediction, probabilities):
+    """Render a prediction as the Task 3 results text"""
     
     result = f"""
     PRIORITY PREDICTION RESULTS
@@ -175,158 +239,187 @@ def predict_priority(mean_radius, mean_texture, mean_perimeter, mean_area):
     
     return result
 
-# Create Gradio interface
-with gr.Blocks(title="AI Software Engineering Demo", theme=gr.themes.Soft()) as demo:
-    
-    gr.Markdown("# AI in Software Engineering - Interactive Demo")
-    gr.Markdown("Explore practical applications of AI in software development workflows")
-    
-    with gr.Tabs():
+def build_demo():
+    """Create the Gradio interface; cheap, as no model is needed to build it"""
+    with gr.Blocks(title="AI Software Engineering Demo") as demo:
         
-        # Task 1 Tab
-        with gr.TabItem("Task 1: Code Completion"):
-            gr.Markdown("## Compare Manual vs AI-Assisted Code Implementation")
-            gr.Markdown("See how AI-suggested code performs against manual implementations")
-            
-            with gr.Row():
-                with gr.Column():
-                    size_input = gr.Slider(
-                        minimum=10, maximum=1000, value=100, step=10,
-                        label="Dataset Size"
-                    )
-                    key_input = gr.Dropdown(
-                        choices=['priority', 'value'],
-                        value='priority',
-                        label="Sort Key"
-                    )
-                    sort_btn = gr.Button("Run Comparison", variant="primary")
-                
-                with gr.Column():
-                    sort_output = gr.Textbox(
-                        label="Results",
-                        lines=20,
-                        max_lines=25
-                    )
-            
-            sort_btn.click(
-                compare_sorting,
-                inputs=[size_input, key_input],
-                outputs=sort_output
-            )
+        gr.Markdown("# AI in Software Engineering - Interactive Demo")
+        gr.Markdown("Explore practical applications of AI in software development workflows")
         
-        # Task 2 Tab
-        with gr.TabItem("Task 2: Automated Testing"):
-            gr.Markdown("## AI-Enhanced Test Automation")
-            gr.Markdown("Simulate automated login testing with AI capabilities")
+        with gr.Tabs():
             
-            with gr.Row():
-                with gr.Column():
-                    test_type = gr.Radio(
-                        choices=["Valid Login", "Invalid Login"],
-                        value="Valid Login",
-                        label="Test Type"
-                    )
-                    test_username = gr.Textbox(
-                        label="Username",
-                        placeholder="admin",
-                        value="admin"
-                    )
-                    test_password = gr.Textbox(
-                        label="Password",
-                        placeholder="password123",
-                        type="password",
-                        value="password123"
-                    )
-                    test_btn = gr.Button("Run Test", variant="primary")
+            # Task 1 Tab
+            with gr.TabItem("Task 1: Code Completion"):
+                gr.Markdown("## Compare Manual vs AI-Assisted Code Implementation")
+                gr.Markdown("See how AI-suggested code performs against manual implementations")
+                
+                with gr.Row():
+                    with gr.Column():
+                        size_input = gr.Slider(
+                            minimum=10, maximum=1_000_000, value=1000, step=10,
+                            label="Dataset Size (bubble sort is projected above 1,000)"
+                        )
+                        key_input = gr.Dropdown(
+                            choices=['priority', 'value'],
+                            value='priority',
+                            label="Sort Key"
+                        )
+                        sort_btn = gr.Button("Run Comparison", variant="primary")
                     
-                    gr.Markdown("**Valid Credentials:**\n- admin / password123\n- user1 / pass456")
+                    with gr.Column():
+                        sort_output = gr.Textbox(
+                            label="Results",
+                            lines=20,
+                            max_lines=25
+                        )
+                        sort_plot = gr.LinePlot(
+                            x='log10(size)', y='log10(ms)', color='method',
+                            title="Scaling curve", label="Scaling curve"
+                        )
                 
-                with gr.Column():
-                    test_output = gr.Textbox(
-                        label="Test Results",
-                        lines=20,
-                        max_lines=25
-                    )
+                # At most one running comparison per CPU worker; the rest queue
+                sort_btn.click(
+                    compare_sorting,
+                    inputs=[size_input, key_input],
+                    outputs=[sort_output, sort_plot],
+                    concurrency_limit=execution.cpu_workers,
+                    concurrency_id='cpu'
+                )
             
-            test_btn.click(
-                simulate_test_automation,
-                inputs=[test_type, test_username, test_password],
-                outputs=test_output
-            )
-        
-        # Task 3 Tab
-        with gr.TabItem("Task 3: Predictive Analytics"):
-            gr.Markdown("## Priority Prediction for Resource Allocation")
-            gr.Markdown("Use machine learning to predict issue priority levels")
-            
-            with gr.Row():
-                with gr.Column():
-                    radius_input = gr.Slider(
-                        minimum=5.0, maximum=30.0, value=14.0, step=0.1,
-                        label="Mean Radius"
-                    )
-                    texture_input = gr.Slider(
-                        minimum=5.0, maximum=40.0, value=19.0, step=0.1,
-                        label="Mean Texture"
-                    )
-                    perimeter_input = gr.Slider(
-                        minimum=40.0, maximum=200.0, value=92.0, step=1.0,
-                        label="Mean Perimeter"
-                    )
-                    area_input = gr.Slider(
-                        minimum=100.0, maximum=2500.0, value=655.0, step=10.0,
-                        label="Mean Area"
-                    )
-                    predict_btn = gr.Button("Predict Priority", variant="primary")
+            # Task 2 Tab
+            with gr.TabItem("Task 2: Automated Testing"):
+                gr.Markdown("## AI-Enhanced Test Automation")
+                gr.Markdown("Simulate automated login testing with AI capabilities")
                 
-                with gr.Column():
-                    predict_output = gr.Textbox(
-                        label="Prediction Results",
-                        lines=20,
-                        max_lines=25
-                    )
-            
-            predict_btn.click(
-                predict_priority,
-                inputs=[radius_input, texture_input, perimeter_input, area_input],
-                outputs=predict_output
-            )
-        
-        # About Tab
-        with gr.TabItem("About"):
-            gr.Markdown("""
-            ## About This Demo
-            
-            This interactive demonstration showcases three key applications of AI in software engineering:
-            
-            ### Task 1: Code Completion
-            Compares manual implementation vs AI-suggested code for sorting algorithms,
-            demonstrating performance improvements and best practices.
-            
-            ### Task 2: Automated Testing
-            Simulates AI-enhanced test automation for login functionality, showing how
-            automated testing improves coverage and efficiency.
-            
-            ### Task 3: Predictive Analytics
-            Uses Random Forest classification to predict issue priorities, enabling
-            intelligent resource allocation in software projects.
+                with gr.Row():
+                    with gr.Column():
+                        test_type = gr.Radio(
+                            choices=["Valid Login", "Invalid Login"],
+                            value="Valid Login",
+                            label="Test Type"
+                        )
+                        test_username = gr.Textbox(
+                            label="Username",
+                            placeholder="admin",
+                            value="admin"
+                        )
+                        test_password = gr.Textbox(
+                            label="Password",
+                            placeholder="password123",
+                            type="password",
+                            value="password123"
+                        )
+                        test_btn = gr.Button("Run Test", variant="primary")
+                        
+                        gr.Markdown("**Valid Credentials:**\n- admin / password123\n- user1 / pass456")
+                    
+                    with gr.Column():
+                        test_output = gr.Textbox(
+                            label="Test Results",
+                            lines=20,
+                            max_lines=25
+                        )
+                
+                test_btn.click(
+                    simulate_test_automation,
+                    inputs=[test_type, test_username, test_password],
+                    outputs=test_output
+                )
             
-            ### Technologies Used
-            - Python 3.8+
-            - Scikit-learn for machine learning
-            - Gradio for interactive interface
-            - Selenium for test automation
+            # Task 3 Tab
+            with gr.TabItem("Task 3: Predictive Analytics"):
+                gr.Markdown("## Priority Prediction for Resource Allocation")
+                gr.Markdown("Use machine learning to predict issue priority levels")
+                
+                with gr.Row():
+                    with gr.Column():
+                        radius_input = gr.Slider(
+                            minimum=5.0, maximum=30.0, value=14.0, step=0.1,
+                            label="Mean Radius"
+                        )
+                        texture_input = gr.Slider(
+                            minimum=5.0, maximum=40.0, value=19.0, step=0.1,
+                            label="Mean Texture"
+                        )
+                        perimeter_input = gr.Slider(
+                            minimum=40.0, maximum=200.0, value=92.0, step=1.0,
+                            label="Mean Perimeter"
+                        )
+                        area_input = gr.Slider(
+                            minimum=100.0, maximum=2500.0, value=655.0, step=10.0,
+                            label="Mean Area"
+                        )
+                        predict_btn = gr.Button("Predict Priority", variant="primary")
+                    
+                    with gr.Column():
+                        predict_output = gr.Textbox(
+                            label="Prediction Results",
+                            lines=20,
+                            max_lines=25
+                        )
+                
+                # No per-event concurrency limit, so simultaneous clicks can be batched
+                predict_btn.click(
+                    predict_priority,
+                    inputs=[radius_input, texture_input, perimeter_input, area_input],
+                    outputs=predict_output,
+                    concurrency_limit=None
+                )
+                
+                with gr.Accordion("Execution metrics", open=False):
+                    batch_stats = gr.JSON(label="Handler latencies, queue waits, batch sizes and cache hits")
+                    gr.Button("Refresh metrics").click(execution_metrics, outputs=batch_stats,
+                                                       concurrency_limit=None)
             
-            ### Repository
-            Find the complete code at: [GitHub Repository Link]
+            # About Tab
+            with gr.TabItem("About"):
+                gr.Markdown("""
+                ## About This Demo
+                
+                This interactive demonstration showcases three key applications of AI in software engineering:
+                
+                ### Task 1: Code Completion
+                Compares manual implementation vs AI-suggested code for sorting algorithms,
+                demonstrating performance improvements and best practices.
+                
+                ### Task 2: Automated Testing
+                Simulates AI-enhanced test automation for login functionality, showing how
+                automated testing improves coverage and efficiency.
+                
+                ### Task 3: Predictive Analytics
+                Uses Random Forest classification to predict issue priorities, enabling
+                intelligent resource allocation in software projects.
+                
+                ### Technologies Used
+                - Python 3.8+
+                - Scikit-learn for machine learning
+                - Gradio for interactive interface
+                - Selenium for test automation
+                
+                ### Repository
+                Find the complete code at: [GitHub Repository Link]
+                
+                ### Contact
+                [Your Name] - [Your Email]
+                """)
             
-            ### Contact
-            [Your Name] - [Your Email]
-            """)
+        # Apps launched some other way start warming up with the first page load
+        demo.load(lambda: warm_model_async() and None)
+    
+    # Bounded queue: excess requests are rejected instead of piling up
+    demo.queue(max_size=QUEUE_MAX_SIZE, default_concurrency_limit=DEFAULT_CONCURRENCY_LIMIT)
+    return demo
+
+demo = build_demo()
 
-# Initialize model on startup
-initialize_model()
+# Initialize model on startup, unless fast start defers it to a background thread
+if not FAST_START:
+    initialize_model()
+    _model_ready.set()
 
 # Launch the app
 if __name__ == "__main__":
-    demo.launch()
+    # Start the CPU workers now rather than on the first request
+    execution.start()
+    warm_model_async()
+    demo.launch(theme=gr.themes.Soft())
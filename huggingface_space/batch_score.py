@@ -0,0 +1,144 @@
+# huggingface_space/batch_score.py
+# Bulk scoring: stream a CSV or Parquet file through the fitted scaler and
+# forest in chunks, writing predictions and class probabilities as it goes.
+import argparse
+import difflib
+import os
+import warnings
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from inference import CLASS_NAMES, INPUT_COLUMNS, load_model
+
+DEFAULT_CHUNK_ROWS = 100_000
+PARQUET_SUFFIXES = ('.parquet', '.pq')
+
+
+def read_chunks(path, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """Yield DataFrames of at most ``chunk_rows`` rows from a CSV or Parquet file"""
+    if Path(path).suffix.lower() in PARQUET_SUFFIXES:
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_rows):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, chunksize=chunk_rows)
+
+@contextmanager
+def chunk_writer(path):
+    """Yield write(df), appending chunks to a CSV or Parquet file"""
+    if Path(path).suffix.lower() in PARQUET_SUFFIXES:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        writer = None
+        def write(df):
+            nonlocal writer
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema)
+            writer.write_table(table)
+        try:
+            yield write
+        finally:
+            if writer is not None:
+                writer.close()
+    else:
+        with open(path, 'w', newline='') as f:
+            first = True
+            def write(df):
+                nonlocal first
+                df.to_csv(f, header=first, index=False)
+                first = False
+            yield write
+
+def _did_you_mean(names, columns):
+    hints = [f"{name!r} (found {match[0]!r}?)" if match else repr(name)
+             for name in names for match in [difflib.get_close_matches(name, columns, n=1)]]
+    return ", ".join(hints)
+
+def select_features(chunk, feature_names, input_columns=INPUT_COLUMNS):
+    """
+    The model's feature columns of ``chunk``. The demo's slider features
+    are required. The others are zero-filled, as in the demo, when the
+    input has none of them; a partial set usually means a misspelled
+    header, so it is still scored but with a warning.
+    """
+    columns = [str(column) for column in chunk.columns]
+    missing = [name for name in feature_names if name not in chunk.columns]
+    required = {feature_names[i] for i in input_columns}
+    absent = [name for name in missing if name in required]
+    if absent:
+        raise ValueError(f"input is missing feature column(s) {_did_you_mean(absent, columns)}")
+    if missing and len(missing) < len(feature_names) - len(required):
+        warnings.warn(f"{len(missing)} feature column(s) are missing and scored as 0: "
+                      f"{_did_you_mean(missing, columns)}", stacklevel=2)
+    return chunk.reindex(columns=feature_names, fill_value=0.0)
+
+def score_chunk(model, scaler, chunk, keep=()):
+    """
+    Predictions for one chunk (features as in select_features); ``keep``
+    columns are copied through (e.g. an id).
+    """
+    features = select_features(chunk, list(scaler.feature_names_in_))
+    if len(features):
+        probabilities = model.predict_proba(scaler.transform(features))
+    else:
+        # sklearn rejects zero rows; a header-only file still gets its columns
+        probabilities = np.empty((0, len(model.classes_)))
+    labels = model.classes_.take(np.argmax(probabilities, axis=1))
+
+    scored = chunk.loc[:, list(keep)].reset_index(drop=True)
+    scored['priority'] = labels
+    scored['priority_name'] = np.asarray(CLASS_NAMES)[labels]
+    for i, label in enumerate(model.classes_):
+        scored[f'probability_{label}'] = probabilities[:, i]
+    return scored
+
+def score_file(src, dst, chunk_rows=DEFAULT_CHUNK_ROWS, n_jobs=1, keep=(), progress=None):
+    """
+    Score every row of ``src`` into ``dst`` (CSV or Parquet, by extension).
+    Up to ``n_jobs`` chunks are scored at once in threads (tree traversal
+    releases the GIL) and at most 2 * n_jobs chunks are held in memory;
+    output order matches input order. Returns the number of rows scored.
+    """
+    if n_jobs is None or n_jobs < 1:
+        n_jobs = os.cpu_count() or 1
+    model, scaler, _ = load_model()
+    model.n_jobs = 1  # parallelism comes from scoring chunks side by side
+
+    rows = 0
+    with ThreadPoolExecutor(max_workers=n_jobs) as pool, chunk_writer(dst) as write:
+        pending = deque()
+
+        def flush_one():
+            nonlocal rows
+            scored = pending.popleft().result()
+            write(scored)
+            rows += len(scored)
+            if progress:
+                progress(rows)
+
+        for chunk in read_chunks(src, chunk_rows):
+            pending.append(pool.submit(score_chunk, model, scaler, chunk, keep))
+            if len(pending) >= 2 * n_jobs:
+                flush_one()
+        while pending:
+            flush_one()
+    return rows
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Score a CSV or Parquet file with the priority model")
+    parser.add_argument('src', help="input .csv or .parquet with breast-cancer feature columns")
+    parser.add_argument('dst', help="output .csv or .parquet")
+    parser.add_argument('--chunk-rows', type=int, default=DEFAULT_CHUNK_ROWS)
+    parser.add_argument('--n-jobs', type=int, default=1, help="chunks scored in parallel; -1 for all cores")
+    parser.add_argument('--keep', nargs='*', default=[], help="input columns to copy to the output")
+    args = parser.parse_args()
+
+    total = score_file(args.src, args.dst, args.chunk_rows, args.n_jobs, args.keep,
+                       progress=lambda n: print(f"\rScored {n:,} rows", end='', flush=True))
+    print(f"\nWrote {total:,} predictions to {args.dst}")
@@ -0,0 +1,107 @@
+# huggingface_space/batching.py
+# Micro-batching for model inference: concurrent single-row requests are
+# collected for a few milliseconds and answered by one vectorized call,
+# since sklearn's per-call overhead dominates at batch size 1.
+import asyncio
+from collections import Counter
+
+
+def _bucket(value):
+    """Power-of-two histogram bucket: 0, 1, 2, 4, 8, ..."""
+    return 0 if value <= 0 else 1 << (value.bit_length() - 1)
+
+class MicroBatcher:
+    """
+    Queue in front of a batch function ``predict_batch(rows) -> results``
+    (one result per row). A batch is dispatched when ``max_batch_size``
+    requests are waiting or ``max_wait_ms`` after its first request
+    arrived, whichever comes first, and runs in ``executor`` (the default
+    thread pool if None) so the event loop keeps accepting requests.
+
+    The batcher starts lazily on the running event loop of the first
+    submit(), which is what Gradio's async handlers need.
+    """
+
+    def __init__(self, predict_batch, max_batch_size=64, max_wait_ms=2.0, executor=None):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self.predict_batch = predict_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.executor = executor
+        self._loop = None
+        self._queue = None
+        self._worker = None
+        self.requests = 0
+        self.batches = 0
+        self.batched_rows = 0
+        self.batch_sizes = Counter()
+        self.queue_depths = Counter()
+
+    async def submit(self, row):
+        """Queue one row and wait for its result"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._worker.done():
+            self._start(loop)
+        future = loop.create_future()
+        self.queue_depths[_bucket(self._queue.qsize())] += 1
+        self.requests += 1
+        self._queue.put_nowait((row, future))
+        return await future
+
+    def _start(self, loop):
+        self._loop = loop
+        self._queue = asyncio.Queue()
+        self._worker = loop.create_task(self._run())
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                    continue
+                except asyncio.QueueEmpty:
+                    pass
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            # Requests whose callers went away are not worth computing
+            batch = [(row, future) for row, future in batch if not future.done()]
+            if not batch:
+                continue
+            self.batches += 1
+            self.batched_rows += len(batch)
+            self.batch_sizes[_bucket(len(batch))] += 1
+            rows = [row for row, _ in batch]
+            try:
+                results = await loop.run_in_executor(self.executor, self.predict_batch, rows)
+            except Exception as exc:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+    def queue_depth(self):
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def stats(self):
+        """Counters and histograms (power-of-two buckets) for monitoring"""
+        return {
+            'requests': self.requests,
+            'batches': self.batches,
+            'mean_batch_size': self.batched_rows / self.batches if self.batches else 0.0,
+            'queue_depth': self.queue_depth(),
+            'batch_size_histogram': {str(k): v for k, v in sorted(self.batch_sizes.items())},
+            'queue_depth_histogram': {str(k): v for k, v in sorted(self.queue_depths.items())},
+        }
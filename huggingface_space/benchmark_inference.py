@@ -0,0 +1,127 @@
+# huggingface_space/benchmark_inference.py
+# Per-request latency of the predict_priority inference path: the original
+# implementation (dataset reload, scaler.transform, predict + predict_proba)
+# against the precomputed InferenceContext, and the throughput of
+# concurrent requests with and without the MicroBatcher.
+import argparse
+import asyncio
+import json
+import time
+import warnings
+
+import numpy as np
+from sklearn.datasets import load_breast_cancer
+
+from batching import MicroBatcher
+from inference import InferenceContext, load_model
+from timing_stats import format_ns, percentile
+from forest_compiler import compile_forest
+
+# The legacy path scales a bare array with a scaler fitted on a DataFrame
+warnings.filterwarnings('ignore', message='X does not have valid feature names')
+
+
+def legacy_predict(model, scaler, inputs):
+    """predict_priority's inference path before the InferenceContext"""
+    data = load_breast_cancer()
+    features = np.zeros((1, len(data.feature_names)))
+    features[0, :len(inputs)] = inputs
+    features_scaled = scaler.transform(features)
+    prediction = model.predict(features_scaled)[0]
+    probabilities = model.predict_proba(features_scaled)[0]
+    return prediction, probabilities
+
+def request_inputs(count, seed=0):
+    """Slider values spread over the demo's slider ranges"""
+    rng = np.random.default_rng(seed)
+    low = np.array([5.0, 5.0, 40.0, 100.0])
+    high = np.array([30.0, 40.0, 200.0, 2500.0])
+    return rng.uniform(low, high, size=(count, 4)).tolist()
+
+def request_latencies(predict, requests, warmup=20):
+    """Per-request wall time in ns, one call per request"""
+    for inputs in requests[:warmup]:
+        predict(inputs)
+    samples = []
+    for inputs in requests:
+        start = time.perf_counter_ns()
+        predict(inputs)
+        samples.append(time.perf_counter_ns() - start)
+    return samples
+
+def summarize(samples):
+    return {
+        'requests': len(samples),
+        'p50_ns': percentile(samples, 50),
+        'p99_ns': percentile(samples, 99),
+        'mean_ns': sum(samples) / len(samples),
+    }
+
+def throughput(context, requests, concurrency=64, max_batch_size=64, max_wait_ms=2.0):
+    """
+    Predictions per second for ``concurrency`` simultaneous clients, each
+    sending its share of ``requests`` one after another, through a
+    MicroBatcher. With max_batch_size=1 every request runs on its own.
+    """
+    batcher = MicroBatcher(lambda rows: list(zip(*context.predict_batch(rows))),
+                           max_batch_size=max_batch_size, max_wait_ms=max_wait_ms)
+
+    async def client(share):
+        for values in share:
+            await batcher.submit(values)
+
+    async def main():
+        start = time.perf_counter()
+        await asyncio.gather(*(client(requests[i::concurrency]) for i in range(concurrency)))
+        return time.perf_counter() - start
+
+    elapsed = asyncio.run(main())
+    return {
+        'requests': len(requests),
+        'concurrency': concurrency,
+        'max_batch_size': max_batch_size,
+        'predictions_per_second': len(requests) / elapsed,
+        'batching': batcher.stats(),
+    }
+
+def run(requests=1000, seed=0, concurrency=64):
+    model, scaler, _ = load_model()
+    context = InferenceContext(model, scaler)
+    compiled = InferenceContext(model, scaler, compiled=compile_forest(model))
+    inputs = request_inputs(requests, seed)
+
+    for values in inputs[:50]:
+        before, after = legacy_predict(model, scaler, values), context.predict(*values)
+        assert before[0] == after[0] and np.allclose(before[1], after[1])
+        assert np.array_equal(after[1], compiled.predict(*values)[1])
+
+    return {
+        'before': summarize(request_latencies(lambda v: legacy_predict(model, scaler, v), inputs)),
+        'after': summarize(request_latencies(lambda v: context.predict(*v), inputs)),
+        'compiled': summarize(request_latencies(lambda v: compiled.predict(*v), inputs)),
+        'unbatched': throughput(compiled, inputs, concurrency, max_batch_size=1),
+        'batched': throughput(compiled, inputs, concurrency),
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark predict_priority latency")
+    parser.add_argument('--requests', type=int, default=1000)
+    parser.add_argument('--concurrency', type=int, default=64,
+                        help="simultaneous clients for the throughput runs")
+    parser.add_argument('--output', default=None, help="write the results as JSON")
+    args = parser.parse_args()
+
+    results = run(args.requests, concurrency=args.concurrency)
+    for name in ('before', 'after', 'compiled'):
+        stats = results[name]
+        print(f"{name:<9} p50={format_ns(stats['p50_ns'])}  p99={format_ns(stats['p99_ns'])}  "
+              f"({stats['requests']} requests)")
+    print(f"p50 speedup: {results['before']['p50_ns'] / results['after']['p50_ns']:.1f}x")
+    for name in ('unbatched', 'batched'):
+        stats = results[name]
+        print(f"{name:<9} {stats['predictions_per_second']:,.0f} predictions/s "
+              f"(mean batch {stats['batching']['mean_batch_size']:.1f}, "
+              f"{stats['concurrency']} clients)")
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
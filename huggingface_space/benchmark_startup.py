@@ -0,0 +1,143 @@
+# huggingface_space/benchmark_startup.py
+# Cold-start profile of the Space: where import time goes (python -X
+# importtime on a fresh interpreter) and how long a new replica takes to
+# answer its first HTTP request, with and without fast start.
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from collections import defaultdict
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+
+
+def parse_importtime(stderr):
+    """
+    Entries of a -X importtime report as dicts with module, self_us,
+    cumulative_us and depth, leaving out the interpreter's own startup
+    imports. Depth 0 marks the modules the profiled statement imported
+    directly.
+    """
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|', 2)
+        if not self_us.strip().isdigit():
+            continue  # the header line
+        entries.append({
+            'module': name.strip(),
+            'indent': len(name) - len(name.lstrip()),
+            'self_us': int(self_us),
+            'cumulative_us': int(cumulative_us),
+        })
+    # site is the last module imported before the interpreter runs any code
+    starts = [i for i, e in enumerate(entries) if e['module'] == 'site']
+    entries = entries[starts[0] + 1:] if starts else entries
+    # Lines are in post-order: a module's imports come right before it
+    # with deeper indentation, so roots are never followed by a shallower line
+    root_indent = min((e['indent'] for e in entries), default=0)
+    for e in entries:
+        e['depth'] = (e.pop('indent') - root_indent) // 2
+    return entries
+
+def import_profile(statement='import app', top=15, env=None):
+    """
+    Import ``statement`` in a fresh interpreter under -X importtime.
+    Returns the total import time, the slowest direct imports and the
+    cumulative time per top-level package.
+    """
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement],
+                          cwd=HERE, capture_output=True, text=True, env=env)
+    if proc.returncode != 0:
+        raise RuntimeError(f"{statement!r} failed:\n{proc.stderr[-2000:]}")
+    entries = parse_importtime(proc.stderr)
+    roots = [e for e in entries if e['depth'] == 0]
+    # A package is charged its cumulative time wherever another package (or
+    # the statement itself) imports it, so the totals overlap: gradio's
+    # time includes the pandas it imports, which is also listed on its own
+    packages = defaultdict(int)
+    parents = []  # (depth, package) of the enclosing imports, walking backwards
+    for e in reversed(entries):
+        package = e['module'].split('.')[0]
+        while parents and parents[-1][0] >= e['depth']:
+            parents.pop()
+        if not parents or parents[-1][1] != package:
+            packages[package] += e['cumulative_us']
+        parents.append((e['depth'], package))
+    return {
+        'statement': statement,
+        'total_us': sum(e['cumulative_us'] for e in roots),
+        'modules': len(entries),
+        'slowest': sorted(roots, key=lambda e: -e['cumulative_us'])[:top],
+        'packages': dict(sorted(packages.items(), key=lambda kv: -kv[1])[:top]),
+    }
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+def time_to_first_response(fast_start=True, timeout=180, poll_interval=0.05):
+    """Seconds from starting `python app.py` until its page answers with HTTP 200"""
+    port = _free_port()
+    env = dict(os.environ, GRADIO_SERVER_PORT=str(port), GRADIO_ANALYTICS_ENABLED='False',
+               FAST_START='1' if fast_start else '0')
+    start = time.perf_counter()
+    proc = subprocess.Popen([sys.executable, 'app.py'], cwd=HERE, env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        while time.perf_counter() - start < timeout:
+            if proc.poll() is not None:
+                raise RuntimeError(f"app.py exited with code {proc.returncode}")
+            try:
+                with urllib.request.urlopen(f'http://127.0.0.1:{port}/', timeout=1) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - start
+            except (urllib.error.URLError, ConnectionError, TimeoutError):
+                pass
+            time.sleep(poll_interval)
+        raise TimeoutError(f"app.py did not answer within {timeout}s")
+    finally:
+        proc.terminate()
+        try:
+            proc.wait(10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+def run(top=15, serve=True):
+    results = {'imports': {
+        'app': import_profile('import app', top),
+        # What fast start moves off the startup path
+        'model': import_profile('import inference, forest_compiler', top),
+    }}
+    if serve:
+        results['first_response_s'] = {
+            'fast_start': time_to_first_response(fast_start=True),
+            'eager': time_to_first_response(fast_start=False),
+        }
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Profile the Space's imports and cold start")
+    parser.add_argument('--top', type=int, default=15, help="slowest imports to list")
+    parser.add_argument('--no-serve', action='store_true', help="skip the time-to-first-response runs")
+    parser.add_argument('--output', default=None, help="write the results as JSON")
+    args = parser.parse_args()
+
+    results = run(args.top, serve=not args.no_serve)
+    for name, profile in results['imports'].items():
+        print(f"{profile['statement']}: {profile['total_us'] / 1e6:.2f}s over {profile['modules']} modules")
+        for package, us in profile['packages'].items():
+            print(f"  {package:<24} {us / 1e3:>9.1f} ms")
+    for mode, seconds in results.get('first_response_s', {}).items():
+        print(f"first response ({mode}): {seconds:.2f}s")
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
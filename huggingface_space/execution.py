@@ -0,0 +1,150 @@
+# huggingface_space/execution.py
+# Execution layer for the app's handlers. CPU-bound handlers run in a
+# bounded process pool so they cannot hold the GIL against everyone else,
+# model inference gets its own thread pool (sklearn and NumPy release the
+# GIL) for the micro-batcher, and every handler records queue wait and
+# latency percentiles.
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
+
+from timing_stats import percentile
+
+
+def _timed(fn, *args):
+    """Run fn(*args) in a worker; returns (result, seconds spent running)"""
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+def _noop():
+    return None
+
+class HandlerMetrics:
+    """Counters and recent latency samples for one handler"""
+
+    def __init__(self, window=1000):
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.latencies = deque(maxlen=window)
+        self.queue_waits = deque(maxlen=window)
+
+    def snapshot(self):
+        def summary(samples):
+            samples = list(samples)
+            if not samples:
+                return None
+            return {'p50_ms': percentile(samples, 50) * 1000, 'p99_ms': percentile(samples, 99) * 1000,
+                    'max_ms': max(samples) * 1000}
+
+        return {
+            'submitted': self.submitted,
+            'completed': self.completed,
+            'failed': self.failed,
+            'in_flight': self.in_flight,
+            'max_in_flight': self.max_in_flight,
+            'latency': summary(self.latencies),
+            'queue_wait': summary(self.queue_waits),
+        }
+
+class ExecutionLayer:
+    """
+    Pools and metrics shared by the app's handlers. The process pool is
+    created on first use, or by start() before the server spawns its
+    threads. Its workers come from a forkserver where there is one (spawn
+    elsewhere), never forked from the threaded server itself: the
+    forkserver imports the app once and forks each worker from that
+    single-threaded process, including replacements after a crash.
+    Concurrency per handler is capped in Gradio (concurrency_limit); the
+    pools only bound how much work runs at once.
+    """
+
+    def __init__(self, cpu_workers=None, inference_workers=None):
+        cores = os.cpu_count() or 1
+        self.cpu_workers = cpu_workers or max(1, min(4, cores - 1))
+        self.inference_workers = inference_workers or min(8, cores)
+        self.inference_pool = ThreadPoolExecutor(self.inference_workers, thread_name_prefix='inference')
+        self.metrics = {}
+        self._process_pool = None
+        self._lock = threading.Lock()
+
+    @property
+    def process_pool(self):
+        with self._lock:
+            if self._process_pool is None:
+                methods = multiprocessing.get_all_start_methods()
+                context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+                self._process_pool = ProcessPoolExecutor(self.cpu_workers, mp_context=context)
+            return self._process_pool
+
+    def start(self):
+        """Start every CPU worker now rather than on the first request"""
+        pool = self.process_pool
+        for future in [pool.submit(_noop) for _ in range(self.cpu_workers)]:
+            future.result()
+
+    def handler(self, name):
+        if name not in self.metrics:
+            self.metrics[name] = HandlerMetrics()
+        return self.metrics[name]
+
+    @asynccontextmanager
+    async def track(self, name):
+        """Record one call of handler ``name``: in-flight count, latency, failures"""
+        metrics = self.handler(name)
+        metrics.submitted += 1
+        metrics.in_flight += 1
+        metrics.max_in_flight = max(metrics.max_in_flight, metrics.in_flight)
+        start = time.perf_counter()
+        try:
+            yield metrics
+            metrics.completed += 1
+        except BaseException:
+            metrics.failed += 1
+            raise
+        finally:
+            metrics.in_flight -= 1
+            metrics.latencies.append(time.perf_counter() - start)
+
+    async def run_cpu(self, name, fn, *args):
+        """Run a module-level function in the process pool"""
+        try:
+            return await self._run(name, self.process_pool, fn, args)
+        except BrokenProcessPool:
+            # A worker died (e.g. out of memory); the next call gets a fresh pool
+            with self._lock:
+                if self._process_pool is not None:
+                    self._process_pool.shutdown(wait=False, cancel_futures=True)
+                    self._process_pool = None
+            raise
+
+    async def _run(self, name, executor, fn, args):
+        loop = asyncio.get_running_loop()
+        async with self.track(name) as metrics:
+            start = time.perf_counter()
+            result, running = await loop.run_in_executor(executor, _timed, fn, *args)
+            metrics.queue_waits.append(max(0.0, time.perf_counter() - start - running))
+            return result
+
+    def stats(self):
+        return {
+            'cpu_workers': self.cpu_workers,
+            'inference_workers': self.inference_workers,
+            'handlers': {name: m.snapshot() for name, m in sorted(self.metrics.items())},
+        }
+
+    def shutdown(self):
+        self.inference_pool.shutdown(wait=False, cancel_futures=True)
+        with self._lock:
+            if self._process_pool is not None:
+                self._process_pool.shutdown(wait=False, cancel_futures=True)
+                self._process_pool = None
@@ -0,0 +1,85 @@
+# huggingface_space/inference.py
+# Model loading and the precomputed inference path behind predict_priority.
+import numpy as np
+import pandas as pd
+from sklearn.datasets import load_breast_cancer
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.preprocessing import StandardScaler
+
+from model_store import ModelStore, fingerprint
+
+MODEL_PARAMS = {'n_estimators': 100, 'random_state': 42}
+CLASS_NAMES = ['Low Priority', 'Medium Priority', 'High Priority']
+# Feature columns the demo's sliders set: mean radius, texture, perimeter, area
+INPUT_COLUMNS = (0, 1, 2, 3)
+
+
+def load_model(store=None):
+    """
+    Return (model, scaler, key) for the demo's priority model, loaded from
+    the model store and trained only when the artifact key changes.
+    """
+    data = load_breast_cancer()
+    df = pd.DataFrame(data.data, columns=data.feature_names)
+    df['priority'] = pd.cut(df[data.feature_names[0]], bins=3, labels=[0, 1, 2]).astype(int)
+
+    X = df[data.feature_names]
+    y = df['priority']
+
+    def train():
+        scaler = StandardScaler()
+        X_scaled = scaler.fit_transform(X)
+        model = RandomForestClassifier(**MODEL_PARAMS)
+        model.fit(X_scaled, y)
+        return {'model': model, 'scaler': scaler}
+
+    key = fingerprint(X, y, features=list(data.feature_names), params=MODEL_PARAMS,
+                      scaler='StandardScaler', labels='pd.cut(mean radius, bins=3)')
+    artifact = (store or ModelStore()).get_or_train(
+        key, train, metadata={'source': 'huggingface_space/inference.py', 'params': MODEL_PARAMS})
+    return artifact['model'], artifact['scaler'], key
+
+class InferenceContext:
+    """
+    Everything a prediction request needs, computed once per model: the
+    feature count, the scaler's mean and scale, and the scaled template
+    row for the features the demo leaves at zero. A request then only
+    scales its own inputs and runs a single predict_proba pass, from which
+    the label is derived exactly as RandomForestClassifier.predict does.
+    Pass a forest_compiler.CompiledForest as ``compiled`` to run that pass
+    on flat node arrays instead of sklearn (same probabilities, far less
+    per-call overhead).
+    """
+
+    def __init__(self, model, scaler, input_columns=INPUT_COLUMNS, compiled=None):
+        self.model = model
+        self.predictor = compiled if compiled is not None else model
+        self.classes = model.classes_
+        self.n_features = scaler.n_features_in_
+        self.input_columns = np.asarray(input_columns)
+        self.mean = np.asarray(scaler.mean_, dtype=np.float64)
+        self.scale = np.asarray(scaler.scale_, dtype=np.float64)
+        self.input_mean = self.mean[self.input_columns]
+        self.input_scale = self.scale[self.input_columns]
+        # Same arithmetic as StandardScaler.transform on an all-zero row
+        self.template = ((np.zeros(self.n_features) - self.mean) / self.scale).reshape(1, -1)
+
+    def scale_inputs(self, inputs):
+        """
+        Scaled feature rows for an (n, len(input_columns)) batch of slider
+        values, with every other feature at its scaled zero.
+        """
+        inputs = np.asarray(inputs, dtype=np.float64).reshape(-1, len(self.input_columns))
+        rows = np.repeat(self.template, len(inputs), axis=0)
+        rows[:, self.input_columns] = (inputs - self.input_mean) / self.input_scale
+        return rows
+
+    def predict_batch(self, inputs):
+        """Return (labels, probabilities) for a batch of slider values"""
+        probabilities = self.predictor.predict_proba(self.scale_inputs(inputs))
+        return self.classes.take(np.argmax(probabilities, axis=1)), probabilities
+
+    def predict(self, *inputs):
+        """Return (label, probabilities) for one request"""
+        labels, probabilities = self.predict_batch([inputs])
+        return labels[0], probabilities[0]
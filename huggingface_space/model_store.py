@@ -0,0 +1,119 @@
+# huggingface_space/model_store.py
+# Generated from task3_predictive_analytics/model_store.py by
+# sync_vendored.py; edit the original and re-run it.
+# Versioned on-disk store of trained models. Artifacts are keyed by a hash
+# of the training data, features and hyperparameters, so a process only
+# retrains when one of those changes and otherwise loads in milliseconds.
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+
+import joblib
+import numpy as np
+import sklearn
+
+# Bump when the structure of stored payloads changes
+ARTIFACT_VERSION = 1
+
+DEFAULT_ROOT = Path(os.environ.get(
+    'MODEL_STORE_DIR', Path(__file__).resolve().parent / 'outputs' / 'models'))
+
+ARTIFACT_FILE = 'model.joblib'
+METADATA_FILE = 'metadata.json'
+
+
+def fingerprint(*arrays, **config):
+    """
+    Artifact key for a model trained on ``arrays`` with ``config`` (feature
+    names, hyperparameters, ...). The scikit-learn version is part of the
+    key because pickled estimators do not load across versions.
+    """
+    digest = hashlib.sha256()
+    for array in arrays:
+        array = np.asarray(array)
+        if array.dtype.kind == 'O':
+            array = array.astype(str)
+        array = np.ascontiguousarray(array)
+        digest.update(f"{array.dtype.str}{array.shape}".encode())
+        digest.update(array.tobytes())
+    config = dict(config, artifact_version=ARTIFACT_VERSION, sklearn=sklearn.__version__)
+    digest.update(json.dumps(config, sort_keys=True, default=str).encode())
+    return digest.hexdigest()[:24]
+
+class ModelStore:
+    """Directory of model artifacts, one subdirectory per key"""
+
+    def __init__(self, root=DEFAULT_ROOT):
+        self.root = Path(root)
+
+    def path(self, key):
+        return self.root / key
+
+    def load(self, key, mmap_mode='r'):
+        """
+        Load a stored payload, or return None if there is none. NumPy arrays
+        inside it are memory-mapped rather than read, so several processes
+        on one host share the pages. Unreadable artifacts count as missing.
+        """
+        path = self.path(key) / ARTIFACT_FILE
+        if not path.exists():
+            return None
+        try:
+            return joblib.load(path, mmap_mode=mmap_mode)
+        except (OSError, EOFError, ValueError, AttributeError, ImportError,
+                pickle.UnpicklingError):
+            return None
+
+    def save(self, key, payload, metadata=None, replace=False):
+        """
+        Store ``payload`` (e.g. {'model': ..., 'scaler': ...}) under ``key``.
+        The artifact is written to a temporary directory and renamed into
+        place, so concurrent readers never see a partial file. An existing
+        artifact for the same key is kept unless ``replace`` is set.
+        """
+        self.root.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix=f'.{key}-', dir=self.root))
+        try:
+            # Uncompressed, so that load() can memory-map the arrays
+            joblib.dump(payload, staging / ARTIFACT_FILE)
+            with open(staging / METADATA_FILE, 'w') as f:
+                json.dump({
+                    'key': key,
+                    'created': datetime.now(timezone.utc).isoformat(),
+                    'artifact_version': ARTIFACT_VERSION,
+                    'sklearn': sklearn.__version__,
+                    **(metadata or {}),
+                }, f, indent=2, default=str)
+            if replace:
+                shutil.rmtree(self.path(key), ignore_errors=True)
+            try:
+                os.replace(staging, self.path(key))
+            except OSError:
+                pass  # another process published the same key first
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+        return self.path(key)
+
+    def get_or_train(self, key, train, metadata=None):
+        """Load the payload stored under ``key``, or call train() and store it"""
+        payload = self.load(key)
+        if payload is None:
+            payload = train()
+            # A directory that failed to load holds a broken artifact
+            self.save(key, payload, metadata, replace=self.path(key).exists())
+        return payload
+
+    def metadata(self, key):
+        with open(self.path(key) / METADATA_FILE) as f:
+            return json.load(f)
+
+    def keys(self):
+        if not self.root.exists():
+            return []
+        return sorted(p.name for p in self.root.iterdir()
+                      if (p / ARTIFACT_FILE).exists())
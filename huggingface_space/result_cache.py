@@ -0,0 +1,109 @@
+# huggingface_space/result_cache.py
+# Memoization for the app's handlers: an LRU cache with a time-to-live,
+# bounded by the approximate memory of its entries and tied to a version
+# (the model key), so that a new model empties it automatically.
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+
+def quantize(values, steps):
+    """Integer bucket of each value on its step grid, e.g. the sliders' steps"""
+    return tuple(int(round(float(v) / step)) for v, step in zip(values, steps))
+
+def approx_size(obj):
+    """Rough bytes held by a cached key or value"""
+    if isinstance(obj, np.ndarray):
+        return sys.getsizeof(obj) + (0 if obj.base is None else obj.nbytes)
+    if isinstance(obj, (tuple, list)):
+        return sys.getsizeof(obj) + sum(approx_size(item) for item in obj)
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(approx_size(k) + approx_size(v) for k, v in obj.items())
+    return sys.getsizeof(obj)
+
+class ResultCache:
+    """
+    Thread-safe LRU cache. Entries expire ``ttl`` seconds after they were
+    stored, and the least recently used ones are evicted once the entries
+    take more than ``max_bytes`` (as estimated by ``sizeof``).
+    """
+
+    def __init__(self, max_bytes=16 * 2**20, ttl=3600.0, sizeof=approx_size, clock=time.monotonic):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.sizeof = sizeof
+        self.clock = clock
+        self.version = None
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+        self._entries = OrderedDict()  # key -> (expires, size, value)
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= self.clock():
+                self._drop(key)
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+
+    def put(self, key, value):
+        size = self.sizeof(key) + self.sizeof(value)
+        if size > self.max_bytes:
+            return  # would evict everything else
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (self.clock() + self.ttl, size, value)
+            self.nbytes += size
+            while self.nbytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _drop(self, key):
+        _, size, _ = self._entries.pop(key)
+        self.nbytes -= size
+
+    def set_version(self, version):
+        """Clear the cache if ``version`` (e.g. the model key) has changed"""
+        with self._lock:
+            if version == self.version:
+                return False
+            if self._entries:
+                self.invalidations += 1
+            self._entries.clear()
+            self.nbytes = 0
+            self.version = version
+            return True
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'bytes': self.nbytes,
+            'max_bytes': self.max_bytes,
+            'ttl_s': self.ttl,
+            'version': self.version,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'invalidations': self.invalidations,
+        }
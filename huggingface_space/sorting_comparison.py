@@ -0,0 +1,242 @@
+# huggingface_space/sorting_comparison.py
+# Generated from task1_code_completion/sorting_comparison.py by
+# sync_vendored.py; edit the original and re-run it.
+from collections import namedtuple
+from operator import itemgetter
+
+try:
+    import numpy as np
+except ImportError:  # the columnar engine is optional; itemgetter still works
+    np = None
+
+# A sort key: the dict field, its direction, and where None values go.
+SortKey = namedtuple('SortKey', ['name', 'descending', 'nones'])
+SortKey.__new__.__defaults__ = (False, 'last')
+
+# Below this many records, building NumPy columns costs more than it saves.
+COLUMNAR_THRESHOLD = 10_000
+
+
+def manual_sort_dicts(data, key):
+    """
+    Manual implementation of dictionary sorting using bubble sort algorithm.
+    This demonstrates a basic approach without using built-in sorting functions.
+    Time complexity: O(n²)
+    """
+    arr = data.copy()
+    n = len(arr)
+    
+    for i in range(n):
+        for j in range(0, n-i-1):
+            if arr[j][key] > arr[j+1][key]:
+                arr[j], arr[j+1] = arr[j+1], arr[j]
+    return arr
+
+def efficient_sort_dicts(data, key):
+    """
+    Efficient implementation using Python's built-in sorted function.
+    Utilizes Timsort algorithm which is optimized and implemented in C.
+    ``key`` is a field name, or a list of keys for the multi-key engine
+    (see multi_key_sort).
+    Time complexity: O(n log n)
+    """
+    if isinstance(key, str):
+        return sorted(data, key=itemgetter(key))
+    return multi_key_sort(data, key)
+
+def normalize_keys(keys):
+    """
+    Turn a key specification into a list of SortKey tuples.
+    Accepts a field name, a SortKey, a (name, descending, nones) tuple,
+    or a list mixing any of those, most significant key first.
+    """
+    if isinstance(keys, (str, SortKey)):
+        keys = [keys]
+    normalized = []
+    for key in keys:
+        if isinstance(key, str):
+            key = SortKey(key)
+        elif not isinstance(key, SortKey):
+            key = SortKey(*key)
+        if key.nones not in ('first', 'last'):
+            raise ValueError(f"nones must be 'first' or 'last', got {key.nones!r}")
+        normalized.append(key)
+    if not normalized:
+        raise ValueError("at least one sort key is required")
+    return normalized
+
+def multi_key_sort(data, keys, method='auto'):
+    """
+    Stable sort of dictionaries on several keys, each with its own
+    direction and None placement, e.g.
+    [SortKey('priority', descending=True), 'value', 'id'].
+
+    method='columnar' converts each key into a typed NumPy column once and
+    orders the records with a single stable np.lexsort. method='itemgetter'
+    uses Timsort with operator.itemgetter keys, so no Python-level lambda
+    runs per comparison. method='auto' picks columnar for large inputs
+    when NumPy is installed and every column has a numeric or string type.
+    Time complexity: O(n log n)
+    """
+    keys = normalize_keys(keys)
+    if method not in ('auto', 'columnar', 'itemgetter'):
+        raise ValueError(f"unknown sort method {method!r}")
+    if method == 'columnar' and np is None:
+        raise ImportError("the columnar sort engine requires numpy")
+
+    records = data if hasattr(data, '__getitem__') else list(data)
+    use_columns = method == 'columnar' or (
+        method == 'auto' and np is not None and len(records) >= COLUMNAR_THRESHOLD
+    )
+    if use_columns:
+        order = columnar_argsort(records, keys)
+        if order is not None:
+            return list(map(records.__getitem__, order.tolist()))
+        if method == 'columnar':
+            raise TypeError("sort keys must hold only numbers or only strings "
+                            "for the columnar engine")
+    return _itemgetter_sort(records, keys)
+
+def columnar_argsort(data, keys):
+    """
+    Return the stable sort order of ``data`` as an index array, or None if
+    some key column cannot be represented as a numeric or string array.
+    """
+    columns = key_columns(data, normalize_keys(keys))
+    if columns is None:
+        return None
+    # np.lexsort treats its last key as the most significant one
+    return np.lexsort(columns[::-1])
+
+def key_columns(data, keys):
+    """
+    Build the lexsort key arrays for ``keys``, most significant first.
+    Each key contributes a None mask (only when it has None values) and a
+    value column, negated or rank-encoded when the key is descending.
+    Returns None when a column is neither all-numeric nor all-string.
+    Stores with a column(name) method, such as record_store.RecordStore,
+    hand over their typed arrays without building Python lists.
+    """
+    columns = []
+    for key in keys:
+        if hasattr(data, 'column'):
+            column, values = data.column(key.name), None
+        else:
+            values = [row[key.name] for row in data]
+            missing = np.fromiter((v is None for v in values), dtype=bool, count=len(values))
+            if missing.any():
+                present = [v for v in values if v is not None]
+                filler = present[0] if present else 0
+                values = [filler if v is None else v for v in values]
+                columns.append(missing if key.nones == 'last' else ~missing)
+            column = np.asarray(values)
+
+        if column.dtype.kind in 'bu':
+            column = column.astype(np.int64)
+        if column.dtype.kind in 'if':
+            if key.descending:
+                column = -column
+        elif column.dtype.kind == 'U':
+            # np.asarray silently turns mixed numbers and strings into strings
+            if values is not None and not all(type(v) is str for v in values):
+                return None
+            if key.descending:
+                _, ranks = np.unique(column, return_inverse=True)
+                column = -ranks.reshape(-1)
+        else:
+            return None
+        columns.append(column)
+    return columns
+
+def record_sort_key(keys):
+    """
+    Return a key function whose values order records exactly like
+    multi_key_sort(data, keys), for use with heapq.merge, heaps and bisect.
+    """
+    parts = [
+        (itemgetter(key.name), key.descending, (1,) if key.nones == 'last' else (-1,))
+        for key in normalize_keys(keys)
+    ]
+
+    def sort_key(row):
+        composite = []
+        for getter, descending, none_rank in parts:
+            value = getter(row)
+            if value is None:
+                composite.append(none_rank)
+            elif descending:
+                composite.append((0, -value if type(value) in (int, float) else _Descending(value)))
+            else:
+                composite.append((0, value))
+        return tuple(composite)
+
+    return sort_key
+
+class _Descending:
+    """Wrap a value so that it compares in reverse order."""
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+def _itemgetter_sort(data, keys):
+    """Stable multi-key sort built from Timsort passes with itemgetter keys."""
+    records = list(data)
+    if len({key.descending for key in keys}) == 1:
+        try:
+            # reverse=True keeps equal records in their original order
+            return sorted(records, key=itemgetter(*[key.name for key in keys]),
+                          reverse=keys[0].descending)
+        except TypeError:
+            pass  # None in a key column; sort one key at a time below
+
+    # Least significant key first; each stable pass keeps the earlier order
+    for key in reversed(keys):
+        getter = itemgetter(key.name)
+        present = [row for row in records if getter(row) is not None]
+        missing = [row for row in records if getter(row) is None]
+        present.sort(key=getter, reverse=key.descending)
+        records = present + missing if key.nones == 'last' else missing + present
+    return records
+
+def generate_test_data(size, compact=False, seed=None):
+    """
+    Generate sample list of dictionaries for testing.
+    With compact=True, return a record_store.RecordStore generated in
+    vectorized form from a seeded numpy.random.Generator instead.
+    """
+    if compact:
+        from record_store import RecordStore
+        return RecordStore.generate(size, seed=seed)
+
+    import random
+    rng = random.Random(seed) if seed is not None else random
+    
+    test_data = []
+    for i in range(size):
+        test_data.append({
+            'id': i,
+            'priority': rng.randint(1, 10),
+            'value': rng.uniform(1.0, 100.0),
+            'name': f'item_{i}'
+        })
+    return test_data
+
+# Example usage and comparison
+if __name__ == "__main__":
+    # Same timer, warmup and repeats for both sorts; see benchmark.py for
+    # larger sizes, memory peaks and JSON output
+    from benchmark import print_report, run_suite
+
+    report = run_suite(
+        cases=['manual_sort_dicts', 'efficient_sort_dicts'],
+        sizes=[10, 50, 100, 1000],
+        memory=False,
+    )
+    print_report(report)
@@ -0,0 +1,142 @@
+# huggingface_space/sorting_demo.py
+# The Task 1 sorting comparison, built on the sorting module (a copy of
+# task1_code_completion/sorting_comparison.py). It is CPU-bound, so the app
+# runs it in worker processes; this module only needs NumPy to import.
+import math
+import time
+
+from sorting_comparison import efficient_sort_dicts, generate_test_data, manual_sort_dicts
+from timing_stats import fit_exponent, log_sizes
+
+# Bubble sort is run for real up to this size and projected beyond it
+MANUAL_SAMPLE_MAX = 1000
+# Likewise sorted() over dicts: a million of them take over a second and
+# ~400 MB just to build, so only this many are built and timed
+TIMSORT_SAMPLE_MAX = 100_000
+# Each point on the curve is the best of a few runs within this many seconds
+TIME_BUDGET = 0.05
+
+METHODS = {
+    'manual': 'Bubble sort (manual)',
+    'timsort': 'sorted() / Timsort (AI-suggested)',
+    'columnar': 'NumPy columnar argsort',
+}
+
+
+def best_time(func, *args, budget=TIME_BUDGET, max_runs=5):
+    """Fastest of up to ``max_runs`` calls, stopping once ``budget`` seconds are spent"""
+    best, spent, runs = float('inf'), 0.0, 0
+    while runs < max_runs and (runs == 0 or spent < budget):
+        start = time.perf_counter()
+        func(*args)
+        elapsed = time.perf_counter() - start
+        best, spent, runs = min(best, elapsed), spent + elapsed, runs + 1
+    return best
+
+def project_quadratic(size, sample_size, sample_time):
+    """Bubble sort makes n(n-1)/2 comparisons, so time scales with that count"""
+    return sample_time * (size * (size - 1)) / (sample_size * (sample_size - 1))
+
+def project_n_log_n(size, sample_size, sample_time):
+    """Timsort makes about n log n comparisons on unordered data"""
+    return sample_time * (size * math.log(size)) / (sample_size * math.log(sample_size))
+
+def scaling_curve(data_size, sort_key, seed=None):
+    """
+    Time every method at log-spaced sizes up to ``data_size`` on prefixes
+    of one vectorized dataset. Returns rows of size, method, seconds and
+    whether the time was projected rather than measured.
+    """
+    store = generate_test_data(data_size, compact=True, seed=seed)
+    records = store[:TIMSORT_SAMPLE_MAX].to_dicts()
+    sizes = set(log_sizes(10, data_size, per_decade=2)) if data_size > 10 else {data_size}
+    # The samples the projections are anchored on
+    sizes.update(sample for sample in (MANUAL_SAMPLE_MAX, TIMSORT_SAMPLE_MAX) if data_size > sample)
+
+    rows, manual_anchor, timsort_anchor = [], None, None
+    for size in sorted(sizes):
+        sample = records[:size]
+        if size <= MANUAL_SAMPLE_MAX:
+            manual = best_time(manual_sort_dicts, sample, sort_key, max_runs=3)
+            manual_anchor = (size, manual)
+        else:
+            manual = project_quadratic(size, *manual_anchor)
+        if size <= TIMSORT_SAMPLE_MAX:
+            timsort = best_time(efficient_sort_dicts, sample, sort_key)
+            timsort_anchor = (size, timsort)
+        else:
+            timsort = project_n_log_n(size, *timsort_anchor)
+        rows.append({'size': size, 'method': METHODS['manual'], 'seconds': manual,
+                     'projected': size > MANUAL_SAMPLE_MAX})
+        rows.append({'size': size, 'method': METHODS['timsort'], 'seconds': timsort,
+                     'projected': size > TIMSORT_SAMPLE_MAX})
+        rows.append({'size': size, 'method': METHODS['columnar'], 'projected': False,
+                     'seconds': best_time(store[:size].argsort, [sort_key])})
+    return rows
+
+def format_seconds(seconds):
+    if seconds >= 3600:
+        return f"{seconds / 3600:.1f} h"
+    if seconds >= 1:
+        return f"{seconds:.2f} s"
+    return f"{seconds * 1000:.4f} ms"
+
+def compare_sorting(data_size, sort_key, seed=None):
+    """
+    Compare manual vs AI sorting performance. Returns the report text and
+    the scaling-curve rows behind it.
+    """
+    rows = scaling_curve(data_size, sort_key, seed)
+    at_size = {row['method']: row for row in rows if row['size'] == data_size}
+    manual, ai, columnar = (at_size[METHODS[m]] for m in ('manual', 'timsort', 'columnar'))
+    speedup = manual['seconds'] / ai['seconds'] if ai['seconds'] > 0 else 0
+
+    def exponent(method):
+        points = [(r['size'], r['seconds']) for r in rows
+                  if r['method'] == method and not r['projected'] and r['size'] >= 100]
+        if len(points) < 2:
+            return "n/a"
+        return f"{fit_exponent(*zip(*points))[0]:.2f}"
+
+    manual_note = (f"projected from a {MANUAL_SAMPLE_MAX:,}-item sample as n(n-1)/2 comparisons"
+                   if manual['projected'] else "measured")
+    ai_note = (f"projected from a {TIMSORT_SAMPLE_MAX:,}-item sample as n log n comparisons"
+               if ai['projected'] else "measured")
+    table = "\n".join(
+        f"    {size:>9,} | " + " | ".join(f"{format_seconds(times[METHODS[m]]):>12}"
+                                         for m in ('manual', 'timsort', 'columnar'))
+        for size, times in _by_size(rows))
+
+    result = f"""
+    Dataset Size: {data_size:,} items
+    Sort Key: {sort_key}
+
+    Manual Implementation (Bubble Sort):
+    - Time: {format_seconds(manual['seconds'])} ({manual_note})
+    - Algorithm: O(n²) complexity (fitted exponent {exponent(METHODS['manual'])})
+
+    AI-Suggested Implementation (Timsort):
+    - Time: {format_seconds(ai['seconds'])} ({ai_note})
+    - Algorithm: O(n log n) complexity (fitted exponent {exponent(METHODS['timsort'])})
+
+    Columnar NumPy argsort: {format_seconds(columnar['seconds'])}
+
+    Performance Improvement: {speedup:,.2f}x faster
+
+    Scaling curve (bubble sort beyond {MANUAL_SAMPLE_MAX:,} items and sorted() beyond
+    {TIMSORT_SAMPLE_MAX:,} are projected):
+         size |       manual |      timsort |     columnar
+{table}
+
+    Analysis: The AI-suggested implementation using Python's built-in sorted()
+    function significantly outperforms manual bubble sort, especially as dataset
+    size increases. This demonstrates the value of leveraging optimized libraries.
+    """
+
+    return result, rows
+
+def _by_size(rows):
+    sizes = {}
+    for row in rows:
+        sizes.setdefault(row['size'], {})[row['method']] = row['seconds']
+    return sorted(sizes.items())
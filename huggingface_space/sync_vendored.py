@@ -0,0 +1,68 @@
+# huggingface_space/sync_vendored.py
+# The Space is deployed from this folder alone, so the modules it shares
+# with the task folders are vendored here. This script generates those
+# copies from the originals; --check reports copies that have drifted,
+# for CI and for tests/test_vendored.py. Edit the originals, never the copies.
+import argparse
+import os
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+
+# Vendored module -> original, relative to the repository root
+VENDORED = {
+    'sorting_comparison.py': 'task1_code_completion/sorting_comparison.py',
+    'record_store.py': 'task1_code_completion/record_store.py',
+    'model_store.py': 'task3_predictive_analytics/model_store.py',
+    'forest_compiler.py': 'task3_predictive_analytics/forest_compiler.py',
+    'timing_stats.py': 'shared/timing_stats.py',
+}
+
+
+def vendored_source(name, original):
+    """The generated copy: the original with its path header replaced"""
+    with open(os.path.join(ROOT, original), encoding='utf-8') as f:
+        lines = f.read().splitlines(keepends=True)
+    if lines and lines[0].startswith('# '):
+        lines = lines[1:]  # "# <folder>/<module>.py"
+    header = (f"# huggingface_space/{name}\n"
+              f"# Generated from {original} by\n"
+              f"# sync_vendored.py; edit the original and re-run it.\n")
+    return header + ''.join(lines)
+
+def stale(names=VENDORED):
+    """Vendored modules that are missing or differ from their originals"""
+    out_of_date = []
+    for name in names:
+        path = os.path.join(HERE, name)
+        try:
+            with open(path, encoding='utf-8') as f:
+                current = f.read()
+        except FileNotFoundError:
+            current = None
+        if current != vendored_source(name, VENDORED[name]):
+            out_of_date.append(name)
+    return out_of_date
+
+def sync(names=VENDORED):
+    """Rewrite the vendored modules that are out of date; returns their names"""
+    written = stale(names)
+    for name in written:
+        with open(os.path.join(HERE, name), 'w', encoding='utf-8') as f:
+            f.write(vendored_source(name, VENDORED[name]))
+    return written
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Copy the shared modules into the Space folder")
+    parser.add_argument('--check', action='store_true',
+                        help="only report out-of-date copies; exit 1 if there are any")
+    args = parser.parse_args()
+
+    if args.check:
+        out_of_date = stale()
+        for name in out_of_date:
+            print(f"{name} differs from {VENDORED[name]}; run python huggingface_space/sync_vendored.py")
+        sys.exit(1 if out_of_date else 0)
+    for name in sync():
+        print(f"wrote {name} from {VENDORED[name]}")
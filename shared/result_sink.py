@@ -0,0 +1,205 @@
+# shared/result_sink.py
+# Append-only JSONL results: one record per line, written as results come
+# in and flushed/fsync'd in batches, so a crash loses at most one batch.
+# The summarizer streams a file of any size: pass rates plus percentiles
+# of the numeric fields, from a bounded reservoir per field. Used by the
+# task2 test runs, the task1 sorting benchmark and the task3 model metrics;
+# installed with the rest of requirements.txt (pip install -e ./shared).
+import argparse
+import json
+import math
+import os
+import random
+import threading
+import time
+
+from timing_stats import percentile
+
+PERCENTILES = (50, 90, 99)
+# Fields are summarized exactly up to this many values, then from a sample
+RESERVOIR_SIZE = 100_000
+
+
+class ResultSink:
+    """
+    Appends records to ``path`` as JSON lines. Buffered lines are flushed
+    (and fsync'd unless ``fsync=False``) every ``batch_size`` records or
+    ``flush_interval`` seconds, whichever comes first, and on close().
+    Thread-safe, so parallel sessions can share one sink.
+    """
+
+    def __init__(self, path, batch_size=100, flush_interval=1.0, fsync=True, clock=time.monotonic):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        self.clock = clock
+        self.written = 0
+        self._pending = 0
+        self._last_flush = clock()
+        self._lock = threading.Lock()
+        self._file = open(path, 'a', encoding='utf-8')
+
+    def write(self, record):
+        line = json.dumps(record, separators=(',', ':'), default=str) + '\n'
+        with self._lock:
+            self._file.write(line)
+            self.written += 1
+            self._pending += 1
+            if self._pending >= self.batch_size or self.clock() - self._last_flush >= self.flush_interval:
+                self._flush()
+
+    def write_many(self, records):
+        for record in records:
+            self.write(record)
+
+    def flush(self):
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        self._pending = 0
+        self._last_flush = self.clock()
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._flush()
+                self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def iter_records(path, errors=None):
+    """
+    Records of a JSONL file, one line at a time. Lines that do not parse
+    (e.g. the last one after a crash) are skipped and counted in
+    ``errors['skipped']`` when a dict is passed.
+    """
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                if errors is not None:
+                    errors['skipped'] = errors.get('skipped', 0) + 1
+                continue
+            if isinstance(record, dict):
+                yield record
+
+def numeric_fields(record, prefix=''):
+    """(dotted name, value) for every int/float leaf, e.g. timings.total_ms"""
+    for key, value in record.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            yield from numeric_fields(value, f"{name}.")
+        elif isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(value):
+            yield name, value
+
+class FieldStats:
+    """Count, mean, min and max of a stream, plus a uniform reservoir for percentiles"""
+
+    def __init__(self, capacity=RESERVOIR_SIZE, rng=None):
+        self.capacity = capacity
+        self.rng = rng or random.Random(0)
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.sample = []
+
+    def add(self, value):
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        if len(self.sample) < self.capacity:
+            self.sample.append(value)
+        else:
+            slot = self.rng.randrange(self.count)
+            if slot < self.capacity:
+                self.sample[slot] = value
+
+    def summary(self, percentiles=PERCENTILES):
+        stats = {'count': self.count, 'mean': self.total / self.count, 'min': self.min}
+        stats.update((f"p{q}", percentile(self.sample, q)) for q in percentiles)
+        stats['max'] = self.max
+        stats['exact'] = self.count <= self.capacity
+        return stats
+
+def summarize(path, group_by=None, fields=None, percentiles=PERCENTILES, capacity=RESERVOIR_SIZE, seed=0):
+    """
+    Stream a results file into per-group summaries (one group unless
+    ``group_by`` names a field): record count, pass rate over records with
+    a ``passed`` field, and percentiles of each numeric field, or only of
+    the dotted names in ``fields``. Memory grows with the number of
+    groups and fields, not with the file.
+    """
+    rng = random.Random(seed)
+    errors = {}
+    groups = {}
+    records = 0
+    for record in iter_records(path, errors):
+        records += 1
+        key = str(record.get(group_by)) if group_by else 'all'
+        group = groups.get(key)
+        if group is None:
+            group = groups[key] = {'records': 0, 'passed': 0, 'checked': 0, 'fields': {}}
+        group['records'] += 1
+        if 'passed' in record:
+            group['checked'] += 1
+            group['passed'] += bool(record['passed'])
+        for name, value in numeric_fields(record):
+            if fields is not None and name not in fields:
+                continue
+            stats = group['fields'].get(name)
+            if stats is None:
+                stats = group['fields'][name] = FieldStats(capacity, rng)
+            stats.add(value)
+
+    summary = {'path': path, 'records': records, 'skipped_lines': errors.get('skipped', 0), 'groups': {}}
+    for key, group in groups.items():
+        summary['groups'][key] = {
+            'records': group['records'],
+            'passed': group['passed'],
+            'pass_rate': group['passed'] / group['checked'] if group['checked'] else None,
+            'fields': {name: stats.summary(percentiles) for name, stats in group['fields'].items()},
+        }
+    return summary
+
+def format_summary(summary):
+    lines = [f"{summary['path']}: {summary['records']:,} records"
+             + (f", {summary['skipped_lines']} unreadable lines skipped" if summary['skipped_lines'] else "")]
+    for key, group in summary['groups'].items():
+        rate = group['pass_rate']
+        lines.append(f"[{key}] {group['records']:,} records"
+                     + (f", {group['passed']:,} passed ({rate:.1%})" if rate is not None else ""))
+        for name, stats in group['fields'].items():
+            quantiles = "  ".join(f"{q}={stats[q]:,.4g}" for q in stats if q.startswith('p'))
+            lines.append(f"    {name:<28} {quantiles}  max={stats['max']:,.4g}")
+    return "\n".join(lines)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Summarize a JSONL results file")
+    parser.add_argument('path')
+    parser.add_argument('--group-by', help="field to group records by, e.g. case or backend")
+    parser.add_argument('--fields', nargs='+', help="numeric fields to summarize, e.g. timings.total_ms")
+    parser.add_argument('--output', help="also save the summary as JSON")
+    args = parser.parse_args()
+
+    summary = summarize(args.path, args.group_by, args.fields)
+    print(format_summary(summary))
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(summary, f, indent=2)
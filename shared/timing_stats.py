@@ -0,0 +1,41 @@
+# shared/timing_stats.py
+# Small timing helpers shared by the task1 benchmark, the result sink and
+# the Space: percentiles, log-spaced sizes, complexity fits and nanosecond
+# formatting, without the benchmark's case registry.
+import math
+
+
+def percentile(samples, q):
+    """Linearly interpolated percentile, matching numpy's default"""
+    ordered = sorted(samples)
+    position = (len(ordered) - 1) * q / 100
+    low, high = math.floor(position), math.ceil(position)
+    return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+def log_sizes(min_size=10, max_size=10**6, per_decade=2):
+    """Log-spaced sizes from min_size to max_size inclusive"""
+    start, stop = math.log10(min_size), math.log10(max_size)
+    steps = max(1, round((stop - start) * per_decade))
+    sizes = {round(10 ** (start + (stop - start) * i / steps)) for i in range(steps + 1)}
+    return sorted(sizes)
+
+def fit_exponent(sizes, times):
+    """
+    Least-squares fit of log(time) = k * log(n) + c.
+    Returns (k, r_squared); k is about 1 for O(n), 2 for O(n²).
+    """
+    xs = [math.log(n) for n in sizes]
+    ys = [math.log(t) for t in times]
+    mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+    sxx = sum((x - mean_x) ** 2 for x in xs)
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    syy = sum((y - mean_y) ** 2 for y in ys)
+    slope = sxy / sxx
+    r_squared = sxy * sxy / (sxx * syy) if syy else 1.0
+    return slope, r_squared
+
+def format_ns(ns):
+    for unit, scale in (('s', 1e9), ('ms', 1e6), ('µs', 1e3)):
+        if ns >= scale:
+            return f"{ns / scale:.3f}{unit}"
+    return f"{ns:.0f}ns"
@@ -0,0 +1,345 @@
+# task1_code_completion/benchmark.py
+# Benchmark harness for the sorting comparison: repeated perf_counter_ns
+# timings on log-spaced sizes, median/p95 with bootstrap confidence
+# intervals, tracemalloc peaks, fitted complexity exponents and JSON output.
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+from external_sort import external_sort
+from parallel_sort import parallel_sort_dicts
+from sorted_index import SortedRecordIndex
+from sorting_comparison import (SortKey, efficient_sort_dicts, generate_test_data,
+                                manual_sort_dicts, multi_key_sort, np)
+from timing_stats import fit_exponent, format_ns, log_sizes, percentile
+from top_k import top_k
+
+SORT_KEYS = [SortKey('priority', descending=True), 'value', 'id']
+
+DEFAULT_WARMUP = 1
+DEFAULT_REPEATS = 7
+MIN_REPEATS = 3
+# Stop repeating a size once this much time was spent on it (after MIN_REPEATS)
+DEFAULT_TIME_BUDGET = 5.0
+# Sizes below this are dominated by call overhead and skew the fitted exponent
+FIT_MIN_SIZE = 100
+
+# name -> (func(data), largest size worth running, wants a RecordStore, setup(data) or None)
+_CASES = {}
+
+
+def benchmark_case(name, max_size=None, compact=False, setup=None):
+    """
+    Register ``func(data)`` as a benchmark case; larger sizes are skipped.
+    compact=True cases get a RecordStore instead of a list of dicts. With
+    ``setup``, each call is func(setup(data)) and only func is timed.
+    """
+    def register(func):
+        _CASES[name] = (func, max_size, compact, setup)
+        return func
+    return register
+
+def available_cases():
+    return list(_CASES)
+
+@benchmark_case('manual_sort_dicts', max_size=3_000)
+def _manual(data):
+    return manual_sort_dicts(data, 'priority')
+
+@benchmark_case('efficient_sort_dicts')
+def _efficient(data):
+    return efficient_sort_dicts(data, 'priority')
+
+@benchmark_case('multi_key_itemgetter')
+def _multi_key_itemgetter(data):
+    return multi_key_sort(data, SORT_KEYS, method='itemgetter')
+
+if np is not None:
+    @benchmark_case('multi_key_columnar')
+    def _multi_key_columnar(data):
+        return multi_key_sort(data, SORT_KEYS, method='columnar')
+
+    @benchmark_case('parallel_sort')
+    def _parallel_sort(data):
+        # threshold=0 measures the multi-process path even below the crossover
+        return parallel_sort_dicts(data, SORT_KEYS, workers=max(2, os.cpu_count() or 1),
+                                   threshold=0)
+
+    @benchmark_case('record_store_argsort', compact=True)
+    def _record_store_argsort(store):
+        return store.argsort(SORT_KEYS)
+
+@benchmark_case('top_k_100')
+def _top_k(data):
+    return top_k(data, 100, SORT_KEYS)
+
+@benchmark_case('external_sort', max_size=1_000_000)
+def _external_sort(data):
+    return list(external_sort(data, SORT_KEYS, run_size=max(1, len(data) // 8)))
+
+# Priority changes applied per run by the incremental-update cases
+UPDATE_EVENTS = 100
+
+def _update_events(data):
+    """The same (record, new priority) events for every update case"""
+    rng = random.Random(len(data))
+    return [(data[rng.randrange(len(data))], rng.randint(1, 10)) for _ in range(UPDATE_EVENTS)]
+
+def _restore(events):
+    originals = [(record, record['priority']) for record, _ in events]
+    return lambda: [record.__setitem__('priority', p) for record, p in reversed(originals)]
+
+def _build_index(data):
+    events = _update_events(data)
+    return SortedRecordIndex(SORT_KEYS, data), events, _restore(events)
+
+@benchmark_case('sorted_index_updates', setup=_build_index)
+def _sorted_index_updates(prepared):
+    index, events, restore = prepared
+    for record, priority in events:
+        index.update(record, priority=priority)
+        index[0]
+    restore()
+    return index
+
+@benchmark_case('resort_per_update', max_size=100_000)
+def _resort_per_update(data):
+    events = _update_events(data)
+    restore = _restore(events)
+    for record, priority in events:
+        record['priority'] = priority
+        result = multi_key_sort(data, SORT_KEYS)
+        result[0]
+    restore()
+
+def measure(func, data, warmup=DEFAULT_WARMUP, repeats=DEFAULT_REPEATS,
+            time_budget=DEFAULT_TIME_BUDGET, setup=None):
+    """
+    Time ``func(data)`` with garbage collection paused; returns samples in
+    ns. With ``setup``, each sample times func(setup(data)) minus the setup.
+    """
+    prepare = setup or (lambda data: data)
+    for _ in range(warmup):
+        func(prepare(data))
+    samples = []
+    deadline = time.perf_counter_ns() + int(time_budget * 1e9)
+    gc_enabled = gc.isenabled()
+    try:
+        while len(samples) < repeats:
+            arg = prepare(data)
+            gc.collect()
+            gc.disable()
+            start = time.perf_counter_ns()
+            func(arg)
+            samples.append(time.perf_counter_ns() - start)
+            if gc_enabled:
+                gc.enable()
+            if len(samples) >= MIN_REPEATS and time.perf_counter_ns() > deadline:
+                break
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return samples
+
+def peak_memory(func, data, setup=None):
+    """Peak bytes allocated by one ``func(data)`` call (after ``setup``), traced by tracemalloc"""
+    arg = setup(data) if setup else data
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func(arg)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def bootstrap_ci(samples, q, confidence=0.95, resamples=1000, seed=0):
+    """Bootstrap confidence interval for the q-th percentile of ``samples``"""
+    rng = random.Random(seed)
+    estimates = sorted(
+        percentile(rng.choices(samples, k=len(samples)), q) for _ in range(resamples)
+    )
+    tail = (1 - confidence) / 2 * 100
+    return [percentile(estimates, tail), percentile(estimates, 100 - tail)]
+
+def run_suite(cases=None, sizes=None, warmup=DEFAULT_WARMUP, repeats=DEFAULT_REPEATS,
+              time_budget=DEFAULT_TIME_BUDGET, memory=True, seed=42, progress=None):
+    """
+    Benchmark every case on every size and return a JSON-serializable report.
+    Each size gets one freshly generated dataset per data form (list of
+    dicts or RecordStore) that all cases share.
+    """
+    cases = cases or available_cases()
+    unknown = set(cases) - set(_CASES)
+    if unknown:
+        raise ValueError(f"unknown benchmark cases: {sorted(unknown)}")
+    sizes = sizes or log_sizes()
+
+    results = []
+    for size in sizes:
+        datasets = {}
+        for name in cases:
+            func, max_size, compact, setup = _CASES[name]
+            if max_size is not None and size > max_size:
+                continue
+            if compact not in datasets:
+                datasets[compact] = generate_test_data(size, compact=compact, seed=seed)
+            data = datasets[compact]
+            samples = measure(func, data, warmup, repeats, time_budget, setup)
+            result = {
+                'case': name,
+                'size': size,
+                'repeats': len(samples),
+                'median_ns': percentile(samples, 50),
+                'p95_ns': percentile(samples, 95),
+                'median_ci_ns': bootstrap_ci(samples, 50),
+                'p95_ci_ns': bootstrap_ci(samples, 95),
+                'min_ns': min(samples),
+                'peak_bytes': peak_memory(func, data, setup) if memory else None,
+            }
+            results.append(result)
+            if progress:
+                progress(result)
+        datasets = data = None
+
+    return {
+        'meta': _environment(),
+        'config': {
+            'cases': cases, 'sizes': sizes, 'warmup': warmup, 'repeats': repeats,
+            'time_budget_s': time_budget, 'seed': seed,
+        },
+        'results': results,
+        'complexity': _fit_all(results),
+    }
+
+def _fit_all(results):
+    fits = {}
+    for name in dict.fromkeys(r['case'] for r in results):
+        points = [(r['size'], r['median_ns']) for r in results
+                  if r['case'] == name and r['size'] >= FIT_MIN_SIZE]
+        if len(points) >= 2:
+            exponent, r_squared = fit_exponent(*zip(*points))
+            fits[name] = {'exponent': exponent, 'r_squared': r_squared, 'points': len(points)}
+    return fits
+
+def _environment():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'git_commit': commit,
+        'python': sys.version.split()[0],
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'numpy': np.__version__ if np is not None else None,
+    }
+
+def compare_reports(baseline, current, threshold=0.10):
+    """
+    List the (case, size) points whose median got more than ``threshold``
+    slower than in ``baseline`` and whose confidence intervals do not overlap.
+    """
+    previous = {(r['case'], r['size']): r for r in baseline['results']}
+    regressions = []
+    for result in current['results']:
+        old = previous.get((result['case'], result['size']))
+        if old is None:
+            continue
+        ratio = result['median_ns'] / old['median_ns']
+        if ratio > 1 + threshold and result['median_ci_ns'][0] > old['median_ci_ns'][1]:
+            regressions.append({
+                'case': result['case'], 'size': result['size'],
+                'baseline_median_ns': old['median_ns'], 'median_ns': result['median_ns'],
+                'ratio': ratio,
+            })
+    return regressions
+
+def format_result(result):
+    low, high = result['median_ci_ns']
+    line = (f"{result['case']:<22} n={result['size']:>10,}  "
+            f"median={format_ns(result['median_ns'])} "
+            f"[{format_ns(low)}, {format_ns(high)}]  "
+            f"p95={format_ns(result['p95_ns'])}  x{result['repeats']}")
+    if result['peak_bytes'] is not None:
+        line += f"  peak={result['peak_bytes'] / 1024:,.1f}KiB"
+    return line
+
+def print_report(report):
+    for result in report['results']:
+        print(format_result(result))
+    print_complexity(report)
+
+def print_complexity(report):
+    for name, fit in report['complexity'].items():
+        print(f"{name:<22} time ~ n^{fit['exponent']:.2f} (r²={fit['r_squared']:.3f})")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the sorting implementations")
+    parser.add_argument('--cases', nargs='+', choices=available_cases(), default=None)
+    parser.add_argument('--min-size', type=int, default=10)
+    parser.add_argument('--max-size', type=int, default=10**6, help="up to 10**7")
+    parser.add_argument('--per-decade', type=int, default=2, help="sizes per power of ten")
+    parser.add_argument('--warmup', type=int, default=DEFAULT_WARMUP)
+    parser.add_argument('--repeats', type=int, default=DEFAULT_REPEATS)
+    parser.add_argument('--time-budget', type=float, default=DEFAULT_TIME_BUDGET,
+                        help="seconds per case and size before repeats are cut short")
+    parser.add_argument('--no-memory', action='store_true', help="skip the tracemalloc run")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', default='results/benchmark.json')
+    parser.add_argument('--results-log', metavar='JSONL',
+                        help="also append each measurement to this JSONL file as it finishes")
+    parser.add_argument('--compare', metavar='BASELINE', help="report regressions against a saved run")
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="relative slowdown that counts as a regression")
+    args = parser.parse_args()
+
+    sink = None
+    if args.results_log:
+        from result_sink import ResultSink  # shared/, see requirements.txt
+        sink = ResultSink(args.results_log)
+    run_id = datetime.now(timezone.utc).isoformat()
+
+    def progress(result):
+        print(format_result(result), flush=True)
+        if sink is not None:
+            sink.write(dict(result, run=run_id))
+
+    try:
+        report = run_suite(
+            cases=args.cases,
+            sizes=log_sizes(args.min_size, args.max_size, args.per_decade),
+            warmup=args.warmup,
+            repeats=args.repeats,
+            time_budget=args.time_budget,
+            memory=not args.no_memory,
+            seed=args.seed,
+            progress=progress,
+        )
+    finally:
+        if sink is not None:
+            sink.close()
+    print_complexity(report)
+
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"Saved {len(report['results'])} measurements to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare_reports(json.load(f), report, args.threshold)
+        for r in regressions:
+            print(f"REGRESSION {r['case']} n={r['size']:,}: "
+                  f"{format_ns(r['baseline_median_ns'])} -> {format_ns(r['median_ns'])} "
+                  f"({r['ratio']:.2f}x)")
+        if regressions:
+            sys.exit(1)
@@ -0,0 +1,126 @@
+# task1_code_completion/external_sort.py
+# Out-of-core merge sort for record streams that do not fit in memory.
+import argparse
+import heapq
+import json
+import os
+import tempfile
+from itertools import islice
+
+from sorting_comparison import SortKey, multi_key_sort, normalize_keys, record_sort_key
+
+# Records held in memory per sorted run
+DEFAULT_RUN_SIZE = 100_000
+# Runs merged at once; more runs than this are merged in several passes
+DEFAULT_FAN_IN = 64
+
+
+def read_jsonl(path):
+    """Lazily yield one record per non-blank line of a JSONL file"""
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+def write_jsonl(records, path):
+    """Write records to a JSONL file and return how many were written"""
+    count = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        for record in records:
+            f.write(json.dumps(record))
+            f.write('\n')
+            count += 1
+    return count
+
+def external_sort(records, keys, run_size=DEFAULT_RUN_SIZE, tmp_dir=None,
+                  max_fan_in=DEFAULT_FAN_IN):
+    """
+    Lazily yield records in the order multi_key_sort(records, keys) would
+    return them, holding at most ``run_size`` records in memory.
+
+    ``records`` is any iterable of JSON-serializable dicts, or the path of
+    a JSONL file. Each run of ``run_size`` records is sorted in memory and
+    spilled to a temporary JSONL file under ``tmp_dir``; the runs are then
+    k-way merged with heapq.merge, which is stable, so ties keep their
+    input order. Input that fits in a single run never touches the disk.
+    The spill files are removed once the generator is exhausted or closed.
+    Time complexity: O(n log n), memory O(run_size)
+    """
+    if run_size < 1:
+        raise ValueError("run_size must be at least 1")
+    if max_fan_in < 2:
+        raise ValueError("max_fan_in must be at least 2")
+    if isinstance(records, (str, os.PathLike)):
+        records = read_jsonl(records)
+    keys = normalize_keys(keys)
+    sort_key = record_sort_key(keys)
+
+    iterator = iter(records)
+    first = multi_key_sort(list(islice(iterator, run_size)), keys)
+    if len(first) < run_size:
+        yield from first
+        return
+
+    with tempfile.TemporaryDirectory(prefix='external_sort_', dir=tmp_dir) as workdir:
+        runs = [_spill(first, workdir)]
+        del first
+        while True:
+            chunk = list(islice(iterator, run_size))
+            if not chunk:
+                break
+            runs.append(_spill(multi_key_sort(chunk, keys), workdir))
+            del chunk
+
+        # Merge groups of adjacent runs until one final merge is left;
+        # keeping groups contiguous preserves the stable order of ties
+        while len(runs) > max_fan_in:
+            merged = []
+            for start in range(0, len(runs), max_fan_in):
+                group = runs[start:start + max_fan_in]
+                merged.append(_spill(_merge_runs(group, sort_key), workdir))
+                for path in group:
+                    os.remove(path)
+            runs = merged
+
+        yield from _merge_runs(runs, sort_key)
+
+def external_sort_file(src, dst, keys, **kwargs):
+    """Sort the JSONL file ``src`` into ``dst``; returns the record count"""
+    return write_jsonl(external_sort(src, keys, **kwargs), dst)
+
+def _spill(records, workdir):
+    fd, path = tempfile.mkstemp(suffix='.jsonl', dir=workdir)
+    os.close(fd)
+    write_jsonl(records, path)
+    return path
+
+def _merge_runs(paths, sort_key):
+    return heapq.merge(*[read_jsonl(path) for path in paths], key=sort_key)
+
+def parse_key(spec):
+    """Parse a command-line key such as 'priority:desc' or 'value:asc:first'"""
+    name, *options = spec.split(':')
+    descending, nones = False, 'last'
+    for option in options:
+        if option in ('asc', 'desc'):
+            descending = option == 'desc'
+        elif option in ('first', 'last'):
+            nones = option
+        else:
+            raise argparse.ArgumentTypeError(f"unknown key option {option!r} in {spec!r}")
+    return SortKey(name, descending, nones)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sort a JSONL file larger than memory")
+    parser.add_argument('src', help="input JSONL file")
+    parser.add_argument('dst', help="output JSONL file")
+    parser.add_argument('--key', dest='keys', action='append', type=parse_key, required=True,
+                        help="sort key as name[:asc|desc][:first|last]; repeat, most significant first")
+    parser.add_argument('--run-size', type=int, default=DEFAULT_RUN_SIZE)
+    parser.add_argument('--fan-in', type=int, default=DEFAULT_FAN_IN)
+    parser.add_argument('--tmp-dir', default=None, help="where sorted runs are spilled")
+    args = parser.parse_args()
+
+    count = external_sort_file(args.src, args.dst, args.keys, run_size=args.run_size,
+                               tmp_dir=args.tmp_dir, max_fan_in=args.fan_in)
+    print(f"Sorted {count} records into {args.dst}")
@@ -0,0 +1,137 @@
+# task1_code_completion/parallel_sort.py
+# Multi-process sort: key columns go to worker processes through shared
+# memory, each worker sorts one contiguous chunk, and the parent merges
+# the sorted runs.
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from sorting_comparison import key_columns, multi_key_sort, normalize_keys, np
+
+# Below this many records, process start-up and the merge cost more than
+# the parallel sort saves; such inputs are sorted in-process.
+PARALLEL_THRESHOLD = 500_000
+
+# Python 3.13+ can attach to a segment without registering it with the
+# resource tracker, which would otherwise warn about the parent's segment
+_ATTACH_OPTIONS = {'track': False} if sys.version_info >= (3, 13) else {}
+
+
+def parallel_sort_dicts(data, keys, workers=None, threshold=PARALLEL_THRESHOLD,
+                        executor=None):
+    """
+    Sort dictionaries on multi_key_sort-style keys across several processes.
+    The result is the same stable order as efficient_sort_dicts and
+    multi_key_sort. Inputs smaller than ``threshold``, a single worker, or
+    keys that cannot become NumPy columns fall back to multi_key_sort.
+    Pass a ProcessPoolExecutor as ``executor`` to reuse worker processes
+    between calls.
+    Time complexity: O((n / workers) log(n / workers) + n log workers)
+    """
+    keys = normalize_keys(keys)
+    records = data if hasattr(data, '__getitem__') else list(data)
+    workers = workers or os.cpu_count() or 1
+    if np is None or workers < 2 or len(records) < max(threshold, 2):
+        return multi_key_sort(records, keys)
+
+    columns = key_columns(records, keys)
+    if columns is None:
+        return multi_key_sort(records, keys)
+    order = parallel_argsort(columns, workers, executor)
+    return list(map(records.__getitem__, order.tolist()))
+
+def parallel_argsort(columns, workers, executor=None):
+    """
+    Stable lexicographic order of the key ``columns`` (most significant
+    first, as built by key_columns), sorted in ``workers`` chunks.
+    """
+    n = len(columns[0])
+    bounds = np.linspace(0, n, min(workers, n) + 1).astype(np.int64).tolist()
+    segments = []
+    try:
+        specs = [_share(column, segments) for column in columns]
+        out_spec = _share(np.empty(n, dtype=np.int64), segments)
+
+        owns_executor = executor is None
+        if owns_executor:
+            executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            futures = [
+                executor.submit(_sort_chunk, specs, out_spec, lo, hi)
+                for lo, hi in zip(bounds, bounds[1:])
+            ]
+            for future in futures:
+                future.result()
+        finally:
+            if owns_executor:
+                executor.shutdown()
+
+        # The views must be gone before the segments can be closed
+        return _merge_runs([_view(spec, segment) for spec, segment in zip(specs, segments)],
+                           _view(out_spec, segments[-1]), bounds)
+    finally:
+        for segment in segments:
+            segment.close()
+            segment.unlink()
+
+def _merge_runs(columns, order, bounds):
+    """
+    Merge the sorted index runs order[lo:hi]. The keys are packed into one
+    order-preserving byte string per record, and NumPy's stable sort
+    (Timsort) on the concatenated runs only has to gallop-merge them.
+    Equal keys stay in run order, i.e. in input order.
+    """
+    packed = _packed_keys(columns)
+    return order[np.argsort(packed[order], kind='stable')]
+
+def _packed_keys(columns):
+    """
+    Encode key columns as fixed-width byte strings whose byte order matches
+    np.lexsort order: big-endian, sign-flipped integers and floats, UTF-32BE
+    strings, one byte per None mask.
+    """
+    n = len(columns[0])
+    parts = []
+    for column in columns:
+        kind = column.dtype.kind
+        if kind == 'b':
+            parts.append(column.astype(np.uint8).reshape(n, 1))
+        elif kind == 'i':
+            bits = column.astype(np.int64).view(np.uint64) ^ np.uint64(1 << 63)
+            parts.append(bits.astype('>u8').view(np.uint8).reshape(n, 8))
+        elif kind == 'f':
+            # + 0.0 folds -0.0 into 0.0, which lexsort treats as equal
+            bits = (column.astype(np.float64) + 0.0).view(np.uint64)
+            negative = (bits >> np.uint64(63)).astype(bool)
+            bits = np.where(negative, ~bits, bits | np.uint64(1 << 63))
+            parts.append(bits.astype('>u8').view(np.uint8).reshape(n, 8))
+        else:
+            width = column.dtype.itemsize // 4
+            parts.append(column.astype(f'>U{width}').view(np.uint8).reshape(n, 4 * width))
+    packed = np.ascontiguousarray(np.hstack(parts))
+    return packed.view(f'S{packed.shape[1]}').reshape(n)
+
+def _share(array, segments):
+    """Copy an array into a new shared memory segment; returns its spec"""
+    segment = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    segments.append(segment)
+    _view((segment.name, array.dtype.str, array.shape), segment)[...] = array
+    return segment.name, array.dtype.str, array.shape
+
+def _view(spec, segment):
+    _, dtype, shape = spec
+    return np.ndarray(shape, dtype=np.dtype(dtype), buffer=segment.buf)
+
+def _sort_chunk(specs, out_spec, lo, hi):
+    """Worker: sort rows lo..hi of the shared columns into the shared output"""
+    segments = [shared_memory.SharedMemory(name=spec[0], **_ATTACH_OPTIONS)
+                for spec in specs + [out_spec]]
+    try:
+        columns = [_view(spec, segment)[lo:hi] for spec, segment in zip(specs, segments)]
+        out = _view(out_spec, segments[-1])
+        out[lo:hi] = np.lexsort(columns[::-1]) + lo
+        del columns, out
+    finally:
+        for segment in segments:
+            segment.close()
@@ -0,0 +1,162 @@
+# task1_code_completion/record_store.py
+# Struct-of-arrays record container: one NumPy column per field instead of
+# one Python dict per record (about 24 bytes per record instead of ~400).
+from collections.abc import Mapping, Sequence
+
+import numpy as np
+
+from sorting_comparison import columnar_argsort
+
+FIELDS = ('id', 'priority', 'value', 'name')
+
+
+class RecordStore(Sequence):
+    """
+    Records with id, priority, value and name fields held as NumPy columns.
+
+    Indexing returns a RecordView, a read-only dict-like row, so
+    manual_sort_dicts, efficient_sort_dicts and multi_key_sort all accept a
+    store wherever they accept a list of dicts. Names default to
+    'item_{id}' and are only formatted when read. Slicing returns a store
+    over the same columns, as NumPy slicing does: sorting a slice sorts
+    that range of the parent store; take() or copy the columns to detach.
+    """
+    __slots__ = ('_columns', '_names')
+
+    def __init__(self, ids, priorities, values, names=None):
+        ids = np.asarray(ids, dtype=np.int64)
+        priorities = np.asarray(priorities, dtype=np.int64)
+        values = np.asarray(values, dtype=np.float64)
+        if not len(ids) == len(priorities) == len(values):
+            raise ValueError("all columns must have the same length")
+        if names is not None:
+            names = np.asarray(names, dtype=str)
+            if len(names) != len(ids):
+                raise ValueError("all columns must have the same length")
+        self._columns = {'id': ids, 'priority': priorities, 'value': values}
+        self._names = names
+
+    @classmethod
+    def generate(cls, size, seed=None):
+        """
+        Vectorized equivalent of generate_test_data: priorities uniform in
+        1..10 and values uniform in [1, 100), drawn from a seeded Generator.
+        """
+        rng = np.random.default_rng(seed)
+        return cls(
+            np.arange(size, dtype=np.int64),
+            rng.integers(1, 11, size=size),
+            rng.uniform(1.0, 100.0, size=size),
+        )
+
+    @classmethod
+    def from_records(cls, records):
+        """Build a store from an iterable of dicts with the same four fields"""
+        records = list(records)
+        return cls(
+            [r['id'] for r in records],
+            [r['priority'] for r in records],
+            [r['value'] for r in records],
+            [r['name'] for r in records],
+        )
+
+    def column(self, name):
+        """The typed array behind a field"""
+        if name == 'name':
+            if self._names is None:
+                return np.char.add('item_', self._columns['id'].astype(str))
+            return self._names
+        try:
+            return self._columns[name]
+        except KeyError:
+            raise KeyError(name) from None
+
+    def value(self, name, index):
+        """A single field of a single record, as a plain Python value"""
+        if name == 'name' and self._names is None:
+            return f"item_{self._columns['id'][index]}"
+        return self.column(name)[index].item()
+
+    def __len__(self):
+        return len(self._columns['id'])
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            # Slicing a NumPy column is a view, so this copies nothing
+            names = None if self._names is None else self._names[index]
+            return RecordStore(*(self._columns[f][index] for f in FIELDS[:3]), names=names)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("record index out of range")
+        return RecordView(self, index)
+
+    def copy(self):
+        """
+        A list of row views, which is what list-based code such as
+        manual_sort_dicts expects from data.copy(); the columns are shared.
+        """
+        return list(self)
+
+    def to_dicts(self):
+        # Column-wise: one tolist() per column instead of a lookup per field
+        ids, priorities, values = (self._columns[f].tolist() for f in FIELDS[:3])
+        names = self._names.tolist() if self._names is not None else [f'item_{i}' for i in ids]
+        return [{'id': i, 'priority': p, 'value': v, 'name': n}
+                for i, p, v, n in zip(ids, priorities, values, names)]
+
+    @property
+    def nbytes(self):
+        total = sum(column.nbytes for column in self._columns.values())
+        return total + (0 if self._names is None else self._names.nbytes)
+
+    def argsort(self, keys):
+        """Stable multi-key sort order (see multi_key_sort) as an index array"""
+        return columnar_argsort(self, keys)
+
+    def sort(self, keys):
+        """
+        Sort the store in place on multi_key_sort-style keys. Only the
+        columns are permuted, one at a time; no rows are materialized. On
+        a slice (store[a:b].sort(keys)) this reorders records a..b-1 of
+        the parent store, leaving the rest of it as it was.
+        """
+        order = self.argsort(keys)
+        for column in self._columns.values():
+            column[:] = column[order]
+        if self._names is not None:
+            self._names[:] = self._names[order]
+        return self
+
+    def take(self, indices):
+        """A new store with the records at ``indices``, in that order"""
+        names = None if self._names is None else self._names[indices]
+        return RecordStore(*(self._columns[f][indices] for f in FIELDS[:3]), names=names)
+
+    def __repr__(self):
+        return f"RecordStore({len(self)} records, {self.nbytes:,} bytes)"
+
+class RecordView(Mapping):
+    """Read-only dict-like view of one row of a RecordStore"""
+    __slots__ = ('_store', '_index')
+
+    def __init__(self, store, index):
+        self._store = store
+        self._index = index
+
+    def __getitem__(self, field):
+        if field not in FIELDS:
+            raise KeyError(field)
+        return self._store.value(field, self._index)
+
+    def __iter__(self):
+        return iter(FIELDS)
+
+    def __len__(self):
+        return len(FIELDS)
+
+    def to_dict(self):
+        return {field: self[field] for field in FIELDS}
+
+    def __repr__(self):
+        return f"RecordView({self.to_dict()!r})"
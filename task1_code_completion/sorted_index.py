@@ -0,0 +1,224 @@
+# task1_code_completion/sorted_index.py
+# Sorted collection of records that stays in multi_key_sort order under
+# inserts, deletes and priority updates, instead of re-sorting per change.
+from bisect import bisect_left, insort
+from itertools import count
+
+from sorting_comparison import normalize_keys, record_sort_key
+
+# Target chunk length; chunks split at twice this and merge below half
+DEFAULT_LOAD = 500
+
+_AFTER_TIES = float('inf')
+
+
+class SortedRecordIndex:
+    """
+    Records kept in the order multi_key_sort(records, keys) would give.
+
+    Records live in a list of sorted chunks of a few hundred entries, found
+    by bisecting the chunk maxima, with a Fenwick tree over chunk lengths
+    for positional access. add, remove, update, rank and positional lookup
+    cost O(log n) comparisons plus a short list shift inside one chunk.
+
+    Records are tracked by identity. Change their key fields only through
+    update(); a record mutated behind the index's back can no longer be
+    found. Among equal keys, records are ordered by when they were (last)
+    added, as if appended to the list and re-sorted stably.
+    """
+
+    def __init__(self, keys, records=(), load=DEFAULT_LOAD):
+        if load < 4:
+            raise ValueError("load must be at least 4")
+        self._keys = normalize_keys(keys)
+        self._sort_key = record_sort_key(self._keys)
+        self._load = load
+        self._seq = count()
+        self._positions = {}  # id(record) -> (key, seq)
+        self._chunks = []     # sorted lists of (key, seq, record)
+        self._maxes = []      # (key, seq) of the last entry of each chunk
+        self._tree = None     # Fenwick tree over chunk lengths, rebuilt lazily
+        self._len = 0
+
+        entries = sorted(self._entry(record) for record in records)
+        for start in range(0, len(entries), load):
+            chunk = entries[start:start + load]
+            self._chunks.append(chunk)
+            self._maxes.append(chunk[-1][:2])
+        self._len = len(entries)
+
+    def _entry(self, record):
+        if id(record) in self._positions:
+            raise ValueError("record is already in the index")
+        entry = (self._sort_key(record), next(self._seq), record)
+        self._positions[id(record)] = entry[:2]
+        return entry
+
+    def add(self, record):
+        """Insert a record"""
+        entry = self._entry(record)
+        if not self._chunks:
+            self._chunks.append([entry])
+            self._maxes.append(entry[:2])
+            self._tree = None
+        else:
+            i = bisect_left(self._maxes, entry[:2])
+            if i == len(self._chunks):
+                i -= 1
+                self._chunks[i].append(entry)
+                self._maxes[i] = entry[:2]
+            else:
+                insort(self._chunks[i], entry)
+            self._grow(i, 1)
+            if len(self._chunks[i]) > 2 * self._load:
+                self._split(i)
+        self._len += 1
+
+    def remove(self, record):
+        """Delete a record; raises ValueError if it is not in the index"""
+        try:
+            position = self._positions.pop(id(record))
+        except KeyError:
+            raise ValueError("record is not in the index") from None
+        i = bisect_left(self._maxes, position)
+        chunk = self._chunks[i]
+        del chunk[bisect_left(chunk, position)]
+        self._len -= 1
+        if not chunk:
+            del self._chunks[i], self._maxes[i]
+            self._tree = None
+            return
+        self._maxes[i] = chunk[-1][:2]
+        self._grow(i, -1)
+        if len(chunk) < self._load // 2 and len(self._chunks) > 1:
+            self._merge(i)
+
+    def update(self, record, **fields):
+        """Change fields of an indexed record (e.g. priority) and re-position it"""
+        self.remove(record)
+        record.update(fields)
+        self.add(record)
+
+    def __contains__(self, record):
+        return id(record) in self._positions
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        for chunk in self._chunks:
+            for entry in chunk:
+                yield entry[2]
+
+    def __getitem__(self, index):
+        """The record at a position of the sorted order"""
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("index out of range")
+        i, j = self._locate(index)
+        return self._chunks[i][j][2]
+
+    def index(self, record):
+        """Position of an indexed record in the sorted order"""
+        try:
+            position = self._positions[id(record)]
+        except KeyError:
+            raise ValueError("record is not in the index") from None
+        i = bisect_left(self._maxes, position)
+        return self._offset(i) + bisect_left(self._chunks[i], position)
+
+    def rank(self, bound):
+        """
+        Number of records that sort strictly before ``bound``, a record or a
+        dict holding the key fields.
+        """
+        return self._bisect((self._sort_key(bound),))
+
+    def irange(self, low=None, high=None, inclusive=(True, True)):
+        """
+        Iterate, in order, over the records whose keys fall between the
+        bounds (records or dicts holding the key fields); None is open.
+        """
+        start = 0 if low is None else self._bisect(self._probe(low, not inclusive[0]))
+        stop = self._len if high is None else self._bisect(self._probe(high, inclusive[1]))
+        if start >= stop:
+            return
+        i, j = self._locate(start)
+        for _ in range(stop - start):
+            yield self._chunks[i][j][2]
+            j += 1
+            if j == len(self._chunks[i]):
+                i, j = i + 1, 0
+
+    def count_range(self, low=None, high=None, inclusive=(True, True)):
+        start = 0 if low is None else self._bisect(self._probe(low, not inclusive[0]))
+        stop = self._len if high is None else self._bisect(self._probe(high, inclusive[1]))
+        return max(0, stop - start)
+
+    def _probe(self, bound, after_ties):
+        # (key,) sorts before every entry with that key, (key, inf) after all of them
+        key = self._sort_key(bound)
+        return (key, _AFTER_TIES) if after_ties else (key,)
+
+    def _bisect(self, probe):
+        i = bisect_left(self._maxes, probe)
+        if i == len(self._chunks):
+            return self._len
+        return self._offset(i) + bisect_left(self._chunks[i], probe)
+
+    def _split(self, i):
+        chunk = self._chunks[i]
+        half = len(chunk) // 2
+        self._chunks[i:i + 1] = [chunk[:half], chunk[half:]]
+        self._maxes[i:i + 1] = [chunk[half - 1][:2], chunk[-1][:2]]
+        self._tree = None
+
+    def _merge(self, i):
+        j = i + 1 if i + 1 < len(self._chunks) else i - 1
+        low, high = min(i, j), max(i, j)
+        merged = self._chunks[low] + self._chunks[high]
+        self._chunks[low:high + 1] = [merged]
+        self._maxes[low:high + 1] = [merged[-1][:2]]
+        self._tree = None
+        if len(merged) > 2 * self._load:
+            self._split(low)
+
+    # Fenwick tree over chunk lengths: tree[k] sums a power-of-two block
+    def _build_tree(self):
+        tree = [0] + [len(chunk) for chunk in self._chunks]
+        for k in range(1, len(tree)):
+            parent = k + (k & -k)
+            if parent < len(tree):
+                tree[parent] += tree[k]
+        self._tree = tree
+
+    def _grow(self, i, delta):
+        if self._tree is None:
+            return
+        k = i + 1
+        while k < len(self._tree):
+            self._tree[k] += delta
+            k += k & -k
+
+    def _offset(self, i):
+        """Number of entries in the chunks before chunk i"""
+        if self._tree is None:
+            self._build_tree()
+        total, k = 0, i
+        while k:
+            total += self._tree[k]
+            k -= k & -k
+        return total
+
+    def _locate(self, index):
+        """(chunk, offset) of a position, by descending the Fenwick tree"""
+        if self._tree is None:
+            self._build_tree()
+        k, step = 0, 1 << (len(self._tree) - 1).bit_length()
+        while step:
+            if k + step < len(self._tree) and self._tree[k + step] <= index:
+                k += step
+                index -= self._tree[k]
+            step >>= 1
+        return k, index
@@ -0,0 +1,129 @@
+# task1_code_completion/top_k.py
+# Partial selection: the first k records of the multi-key sort order,
+# without paying for a full O(n log n) sort.
+import heapq
+
+from sorting_comparison import COLUMNAR_THRESHOLD, key_columns, multi_key_sort, normalize_keys, np, record_sort_key
+
+
+def top_k(data, k, keys, method='auto'):
+    """
+    Return the first ``k`` records of multi_key_sort(data, keys), e.g. the
+    ten most urgent tickets with top_k(data, 10, [SortKey('priority', True)]).
+    Ties keep their input order, exactly as in the full sort.
+
+    method='heap' uses heapq.nsmallest and accepts any iterable.
+    Time complexity: O(n log k)
+    method='partition' builds the NumPy key columns, np.argpartition-s the
+    most significant key (within its None group, if it has Nones) and
+    fully sorts only the m records tied with or ahead of the k-th.
+    Time complexity: O(n + m log m)
+    method='auto' takes the partition path for large sequences, the heap
+    path otherwise, and a plain sort when k is close to n.
+    """
+    keys = normalize_keys(keys)
+    if method not in ('auto', 'heap', 'partition'):
+        raise ValueError(f"unknown top-k method {method!r}")
+    if method == 'partition' and np is None:
+        raise ImportError("the partition top-k path requires numpy")
+    if k <= 0:
+        return []
+    if method == 'heap' or not hasattr(data, '__len__'):
+        return heapq.nsmallest(k, data, key=record_sort_key(keys))
+
+    n = len(data)
+    if k >= n:
+        return multi_key_sort(data, keys)
+    if method == 'partition' or (np is not None and n >= COLUMNAR_THRESHOLD):
+        result = _partition_top_k(data, k, keys)
+        if result is not None:
+            return result
+        if method == 'partition':
+            raise TypeError("sort keys must hold only numbers or only strings "
+                            "for the partition path")
+    if k >= n // 4:
+        return multi_key_sort(data, keys)[:k]
+    return heapq.nsmallest(k, data, key=record_sort_key(keys))
+
+def _partition_top_k(data, k, keys):
+    columns = key_columns(data, keys)
+    if columns is None:
+        return None
+    indices = np.arange(len(data))
+    primary = columns[0]
+    if primary.dtype == bool:
+        # The first key holds Nones and this is its two-valued None mask
+        # (False sorts first): select on the value column within each group
+        front = indices[~primary]
+        if len(front) >= k:
+            candidates = _tied_or_ahead(columns[1], front, k)
+        else:
+            back = indices[primary]
+            candidates = np.sort(np.concatenate([front, _tied_or_ahead(columns[1], back, k - len(front))]))
+    else:
+        candidates = _tied_or_ahead(primary, indices, k)
+    order = candidates[np.lexsort([column[candidates] for column in columns[::-1]])]
+    return list(map(data.__getitem__, order[:k].tolist()))
+
+def _tied_or_ahead(column, indices, k):
+    """The ``indices`` whose value is at most the k-th smallest among them"""
+    values = column[indices]
+    kth = values[np.argpartition(values, k - 1)[k - 1]]
+    # Everything tied with the k-th value may still belong to the result
+    return indices[values <= kth]
+
+class RunningTopK:
+    """
+    Keep the first ``k`` records of the multi-key order over an unbounded
+    stream. Each push costs O(log k) and memory stays O(k); when records
+    tie, the one seen first wins, as in top_k.
+    """
+
+    def __init__(self, k, keys):
+        if k < 1:
+            raise ValueError("k must be at least 1")
+        self.k = k
+        self.seen = 0
+        self._sort_key = record_sort_key(keys)
+        self._heap = []  # max-heap: the record that would be evicted next is on top
+
+    def push(self, record):
+        """Offer a record; returns True if it is currently in the top k"""
+        entry = _Entry((self._sort_key(record), self.seen), record)
+        self.seen += 1
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+            return True
+        if entry.rank < self._heap[0].rank:
+            heapq.heapreplace(self._heap, entry)
+            return True
+        return False
+
+    def extend(self, records):
+        """Push every record of an iterable"""
+        for record in records:
+            self.push(record)
+
+    def threshold(self):
+        """The record a newcomer has to beat, or None until k are held"""
+        if len(self._heap) < self.k:
+            return None
+        return self._heap[0].record
+
+    def items(self):
+        """The current top records, best first"""
+        return [entry.record for entry in sorted(self._heap, reverse=True)]
+
+    def __len__(self):
+        return len(self._heap)
+
+class _Entry:
+    """Heap entry ordered by descending rank, so heapq acts as a max-heap"""
+    __slots__ = ('rank', 'record')
+
+    def __init__(self, rank, record):
+        self.rank = rank
+        self.record = record
+
+    def __lt__(self, other):
+        return other.rank < self.rank
@@ -0,0 +1,191 @@
+# task2_automated_testing/backends.py
+# Driver backends for LoginTestAutomation. Each backend opens the login
+# page (served by fixture_server) and performs the four timed phases of a
+# test case (locate, type, click, response): SeleniumBackend in a real
+# Chrome, InProcessBackend by evaluating the page's validUsers check in
+# Python, without a browser.
+import http.client
+import json
+import re
+import time
+from html.parser import HTMLParser
+from urllib.parse import urlsplit
+
+# Elements run_test_case drives: (tag, id); the login button has no id
+FORM_ELEMENTS = (("input", "username"), ("input", "password"), ("button", None), ("div", "message"))
+
+
+class SeleniumBackend:
+    """Chrome through Selenium WebDriver (needs selenium and chromedriver)"""
+
+    name = "selenium"
+
+    def __init__(self, driver_path=None, headless=False, timeout=10, poll_frequency=0.05):
+        from selenium import webdriver
+        from selenium.webdriver.chrome.service import Service
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        self._By, self._EC = By, EC
+        options = webdriver.ChromeOptions()
+        if headless:
+            options.add_argument("--headless=new")
+        service = Service(executable_path=driver_path) if driver_path else None
+        self.driver = webdriver.Chrome(options=options, service=service)  # Requires chromedriver
+        self.wait = WebDriverWait(self.driver, timeout, poll_frequency=poll_frequency)
+
+    def open(self, url):
+        self.driver.get(url)
+
+    def locate(self):
+        By, EC = self._By, self._EC
+        return {
+            "username": self.wait.until(EC.presence_of_element_located((By.ID, "username"))),
+            "password": self.driver.find_element(By.ID, "password"),
+            "button": self.driver.find_element(By.TAG_NAME, "button"),
+            "message": self.driver.find_element(By.ID, "message"),
+        }
+
+    def type(self, form, username, password):
+        form["username"].clear()
+        form["password"].clear()
+        form["username"].send_keys(username)
+        form["password"].send_keys(password)
+
+    def click(self, form):
+        # Clear the previous answer, so the wait below only sees this one
+        self.driver.execute_script("arguments[0].textContent = '';", form["message"])
+        form["button"].click()
+
+    def response(self, form):
+        # The message is filled in as soon as login() runs
+        return self.wait.until(lambda driver: form["message"].text)
+
+    def close(self):
+        self.driver.quit()
+
+class _PageParser(HTMLParser):
+    """Collects element ids by tag and the text of inline scripts"""
+
+    def __init__(self):
+        super().__init__()
+        self.elements = set()
+        self.scripts = []
+        self._in_script = False
+
+    def handle_starttag(self, tag, attrs):
+        self.elements.add((tag, dict(attrs).get("id")))
+        self.elements.add((tag, None))
+        self._in_script = tag == "script"
+
+    def handle_endtag(self, tag):
+        if tag == "script":
+            self._in_script = False
+
+    def handle_data(self, data):
+        if self._in_script:
+            self.scripts.append(data)
+
+class InProcessBackend:
+    """
+    A stand-in for the browser: fetches the page over one keep-alive
+    connection (revalidating it by ETag), parses it only when it changed,
+    reads validUsers, the two messages and the answer delay from its
+    script, and answers a login the way the page's login() would, as late
+    as it would. No browser or selenium; the phases are timed the same
+    way, so results keep the same schema.
+    """
+
+    name = "inprocess"
+
+    def __init__(self, timeout=10, **options):
+        self.timeout = timeout
+        self.valid_users = None
+        self.messages = None
+        self.answer_delay = 0.0
+        self._conn = None
+        self._page = None  # (path, etag, html) of the last page loaded
+
+    def open(self, url):
+        parts = urlsplit(url)
+        if self._conn is None or (self._conn.host, self._conn.port) != (parts.hostname, parts.port):
+            self.close()
+            self._conn = http.client.HTTPConnection(parts.hostname, parts.port, timeout=self.timeout)
+        cached = self._page if self._page and self._page[0] == parts.path else None
+        headers = {"If-None-Match": cached[1]} if cached else {}
+        target = parts.path + (f"?{parts.query}" if parts.query else "")
+        try:
+            self._conn.request("GET", target, headers=headers)
+            response = self._conn.getresponse()
+            body = response.read()
+        except (http.client.HTTPException, OSError):
+            self.close()  # the server dropped the connection; the next open reconnects
+            raise
+        if response.status == 304 and cached:
+            return
+        if response.status != 200:
+            raise RuntimeError(f"GET {url} returned {response.status} {response.reason}")
+        html = body.decode("utf-8")
+        self.load(html)
+        self._page = (parts.path, response.getheader("ETag"), html)
+
+    def load(self, html):
+        """Read the login check from a page's markup"""
+        parser = _PageParser()
+        parser.feed(html)
+        missing = [f"{tag}#{id_}" if id_ else tag for tag, id_ in FORM_ELEMENTS
+                   if (tag, id_) not in parser.elements]
+        if missing:
+            raise ValueError(f"login page has no {', '.join(missing)}")
+        script = "\n".join(parser.scripts)
+        users = re.search(r"validUsers\s*=\s*(\{.*?\})", script, re.S)
+        messages = re.findall(r"message\.textContent\s*=\s*(\"(?:[^\"\\]|\\.)*\")", script)
+        if users is None or len(messages) != 2:
+            raise ValueError("login page script has no validUsers check")
+        # The object literal is JSON apart from a possible trailing comma
+        self.valid_users = json.loads(re.sub(r",\s*\}", "}", users.group(1)))
+        self.messages = [json.loads(m) for m in messages]
+        delay = re.search(r"answerDelay\s*=\s*(\d+)", script)
+        self.answer_delay = int(delay.group(1)) / 1000 if delay else 0.0
+
+    def locate(self):
+        if self.valid_users is None:
+            raise RuntimeError("no page loaded; call load() first")
+        return {"username": "", "password": "", "message": ""}
+
+    def type(self, form, username, password):
+        form["username"] = username
+        form["password"] = password
+
+    def click(self, form):
+        # validUsers[username] && validUsers[username] === password
+        stored = self.valid_users.get(form["username"])
+        success = bool(stored) and stored == form["password"]
+        form["message"] = self.messages[0] if success else self.messages[1]
+        form["answer_at"] = time.perf_counter() + self.answer_delay
+
+    def response(self, form):
+        # The page's setTimeout fires answer_delay after the click
+        wait = form["answer_at"] - time.perf_counter()
+        if wait > self.timeout:
+            time.sleep(self.timeout)
+            raise TimeoutError(f"no answer within {self.timeout}s")
+        if wait > 0:
+            time.sleep(wait)
+        return form["message"]
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+BACKENDS = {backend.name: backend for backend in (SeleniumBackend, InProcessBackend)}
+
+def make_backend(name="selenium", **options):
+    """A backend by name; options go to its constructor (ignored in-process)"""
+    try:
+        backend_class = BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"unknown backend {name!r}; choose from {', '.join(BACKENDS)}") from None
+    return backend_class(**options)
@@ -0,0 +1,80 @@
+# task2_automated_testing/benchmark_backends.py
+# Cases per second on each driver backend: the same generated case table
+# runs on a session pool per backend, after timing how long a session
+# takes to open. Backends that cannot start here (no selenium, no Chrome)
+# are reported as skipped.
+import argparse
+import json
+import time
+
+from backends import BACKENDS
+from case_tables import credential_permutations
+from login_test_automation import LoginTestAutomation, summarize_timings
+from parallel_runner import SessionPool
+
+
+def session_startup(backend, headless=True):
+    """Seconds to open a session and load the test page"""
+    start = time.perf_counter()
+    session = LoginTestAutomation(headless=headless, backend=backend)
+    try:
+        session.setup_test_page()
+        return time.perf_counter() - start
+    finally:
+        session.close()
+
+def benchmark_backend(backend, cases, workers=1, headless=True):
+    """Startup and throughput of one backend on ``cases``, or why it was skipped"""
+    try:
+        startup = session_startup(backend, headless)
+    except Exception as e:  # ImportError, or WebDriverException without a browser
+        return {'backend': backend, 'skipped': f"{type(e).__name__}: {e}".splitlines()[0]}
+
+    with SessionPool(workers, headless=headless, backend=backend) as pool:
+        start = time.perf_counter()
+        results = pool.run(cases)
+        elapsed = time.perf_counter() - start
+    return {
+        'backend': backend,
+        'workers': workers,
+        'cases': len(results),
+        'passed': sum(1 for r in results if r["passed"]),
+        'startup_s': startup,
+        'wall_s': elapsed,
+        'cases_per_s': len(results) / elapsed if elapsed > 0 else float('inf'),
+        'phases': summarize_timings(results),
+    }
+
+def run(backends=tuple(BACKENDS), count=500, workers=1, headless=True):
+    cases = credential_permutations(count)
+    return [benchmark_backend(backend, cases, workers, headless) for backend in backends]
+
+def format_report(report):
+    lines = [f"{'backend':<10} {'startup':>10} {'cases/s':>12} {'passed':>12}"]
+    for row in report:
+        if 'skipped' in row:
+            lines.append(f"{row['backend']:<10} skipped ({row['skipped']})")
+            continue
+        lines.append(f"{row['backend']:<10} {row['startup_s'] * 1000:>8.1f}ms "
+                     f"{row['cases_per_s']:>12,.1f} {row['passed']:>6}/{row['cases']:<5}")
+    measured = {row['backend']: row['cases_per_s'] for row in report if 'skipped' not in row}
+    if len(measured) > 1:
+        slowest = min(measured.values())
+        lines.append("Speedup over the slowest: " + ", ".join(
+            f"{name} {rate / slowest:,.0f}x" for name, rate in measured.items()))
+    return "\n".join(lines)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare cases per second across driver backends")
+    parser.add_argument('--backends', nargs='+', choices=sorted(BACKENDS), default=list(BACKENDS))
+    parser.add_argument('--cases', type=int, default=500, help="generated credential permutations")
+    parser.add_argument('--workers', type=int, default=1, help="sessions per backend")
+    parser.add_argument('--headed', action='store_true', help="show the browser windows")
+    parser.add_argument('--output', help="also save the report as JSON")
+    args = parser.parse_args()
+
+    report = run(args.backends, args.cases, args.workers, headless=not args.headed)
+    print(format_report(report))
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
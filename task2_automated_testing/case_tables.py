@@ -0,0 +1,83 @@
+# task2_automated_testing/case_tables.py
+# Data-driven login test cases: the built-in regression cases, CSV case
+# tables, and generated username/password permutations for large suites.
+import csv
+import itertools
+import random
+from collections import namedtuple
+
+TestCase = namedtuple('TestCase', 'username password expected_success test_name')
+# Not a pytest test class, despite the name
+TestCase.__test__ = False
+
+# Mirrors validUsers in the test page's script (fixture_server.LOGIN_PAGE)
+VALID_USERS = {
+    "admin": "admin123",
+    "user": "password123",
+}
+
+DEFAULT_CASES = [
+    # Valid credentials
+    TestCase("admin", "admin123", True, "Valid Credentials - Admin"),
+    TestCase("user", "password123", True, "Valid Credentials - User"),
+
+    # Invalid credentials
+    TestCase("admin", "wrongpass", False, "Invalid Password"),
+    TestCase("invaliduser", "admin123", False, "Invalid Username"),
+    TestCase("", "", False, "Empty Credentials"),
+]
+
+
+def expected_login(username, password, valid_users=VALID_USERS):
+    """What the page should answer: the same check as its login() function"""
+    return bool(valid_users.get(username)) and valid_users[username] == password
+
+def load_cases(path):
+    """
+    Read a CSV case table with username, password and expected columns
+    (expected is success/failure, true/false or 1/0) and an optional
+    test_name column.
+    """
+    cases = []
+    with open(path, newline='') as f:
+        for i, row in enumerate(csv.DictReader(f)):
+            expected = row['expected'].strip().lower()
+            if expected not in ('success', 'failure', 'true', 'false', '1', '0'):
+                raise ValueError(f"{path}, row {i + 2}: unknown expected value {row['expected']!r}")
+            cases.append(TestCase(
+                row['username'], row['password'], expected in ('success', 'true', '1'),
+                row.get('test_name') or f"Case {i + 1}",
+            ))
+    return cases
+
+def save_cases(cases, path):
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['test_name', 'username', 'password', 'expected'])
+        for case in cases:
+            writer.writerow([case.test_name, case.username, case.password,
+                             'success' if case.expected_success else 'failure'])
+
+def _variants(value):
+    """Near misses of a valid username or password"""
+    return [value, value.upper(), value.capitalize(), f" {value}", f"{value} ", value[:-1], value + "1"]
+
+def credential_permutations(count, valid_users=VALID_USERS, seed=0):
+    """
+    ``count`` cases from every pairing of known usernames and passwords,
+    their near misses, empty values and random strings; expectations come
+    from expected_login. The same seed gives the same table.
+    """
+    rng = random.Random(seed)
+    usernames = {""} | {v for name in valid_users for v in _variants(name)}
+    passwords = {""} | {v for password in valid_users.values() for v in _variants(password)}
+    while len(usernames) * len(passwords) < count:
+        usernames.add(''.join(rng.choices('abcdefghijklmnopqrstuvwxyz0123456789', k=8)))
+        passwords.add(''.join(rng.choices('abcdefghijklmnopqrstuvwxyz0123456789!#%&', k=10)))
+    # Valid pairs first so even small tables cover both outcomes
+    pairs = [(u, p) for u, p in valid_users.items()]
+    others = sorted(set(itertools.product(sorted(usernames), sorted(passwords))) - set(pairs))
+    rng.shuffle(others)
+    pairs = (pairs + others)[:count]
+    return [TestCase(u, p, expected_login(u, p, valid_users), f"Permutation {i + 1}")
+            for i, (u, p) in enumerate(pairs)]
@@ -0,0 +1,163 @@
+# task2_automated_testing/fixture_server.py
+# The login test page, served over HTTP/1.1 from a local threaded server on
+# an ephemeral port. One server is shared by every session in a run; pages
+# carry an ETag and Cache-Control so browsers revalidate instead of
+# re-downloading. /login?delay_ms=N serves a variant whose login() answers
+# N ms after the click, to load-test the wait for the answer.
+import atexit
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+LOGIN_PAGE = """<!DOCTYPE html>
+<html>
+<head>
+    <title>Login Test Page</title>
+</head>
+<body>
+    <div id="login-form">
+        <h2>Login</h2>
+        <input type="text" id="username" placeholder="Username">
+        <input type="password" id="password" placeholder="Password">
+        <button onclick="login()">Login</button>
+        <div id="message"></div>
+    </div>
+
+    <script>
+        const validUsers = {
+            "admin": "admin123",
+            "user": "password123"
+        };
+        const answerDelay = 0;
+
+        function login() {
+            const username = document.getElementById("username").value;
+            const password = document.getElementById("password").value;
+            const message = document.getElementById("message");
+
+            setTimeout(() => {
+                if (validUsers[username] && validUsers[username] === password) {
+                    message.textContent = "Login successful!";
+                    message.style.color = "green";
+                } else {
+                    message.textContent = "Invalid credentials!";
+                    message.style.color = "red";
+                }
+            }, answerDelay);
+        }
+    </script>
+</body>
+</html>
+"""
+
+PAGES = {"/login": LOGIN_PAGE}
+# A page's latency variants replace this line with the injected delay
+ANSWER_DELAY = "const answerDelay = 0;"
+# Upper bound for ?delay_ms, so a typo cannot hang a run
+MAX_DELAY_MS = 60_000
+
+
+class _FixtureHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive: Content-Length on every response
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        try:
+            delay_ms = int(float(parse_qs(url.query).get("delay_ms", ["0"])[0]))
+        except (ValueError, OverflowError):  # not a number, nan, or ±inf
+            return self._send(400, b"delay_ms must be a finite number\n")
+        page = self.server.page(url.path, min(max(delay_ms, 0), MAX_DELAY_MS))
+        if page is None:
+            return self._send(404, b"no such fixture\n")
+        body, etag = page
+        if etag in self.headers.get("If-None-Match", ""):
+            return self._send(304, b"", etag)
+        self._send(200, body, etag)
+
+    def _send(self, status, body, etag=None):
+        self.send_response(status)
+        if etag:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", f"max-age={self.server.max_age}")
+        if status != 304:
+            self.send_header("Content-Type", "text/html; charset=utf-8" if etag else "text/plain")
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # thousands of page loads per run
+
+class _FixtureHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, pages, max_age):
+        super().__init__(address, _FixtureHandler)
+        self.pages = pages
+        self.max_age = max_age
+
+    def page(self, path, delay_ms=0):
+        """(body, etag) of a page or of its latency variant; None if unknown"""
+        html = self.pages.get(path)
+        if html is None:
+            return None
+        if delay_ms:
+            html = html.replace(ANSWER_DELAY, f"const answerDelay = {delay_ms};")
+        body = html.encode("utf-8")
+        return body, '"%s"' % hashlib.sha1(body).hexdigest()[:16]
+
+class FixtureServer:
+    """
+    Serves ``pages`` (path -> HTML) on 127.0.0.1, one thread per
+    connection. ``port=0`` picks a free port; see url() for the address.
+    """
+
+    def __init__(self, pages=None, port=0, max_age=3600):
+        self.pages = dict(PAGES if pages is None else pages)
+        self.port = port
+        self.max_age = max_age
+        self._httpd = None
+        self._thread = None
+
+    def start(self):
+        if self._httpd is not None:
+            return self
+        httpd = _FixtureHTTPServer(("127.0.0.1", self.port), self.pages, self.max_age)
+        self._httpd = httpd
+        self.port = httpd.server_address[1]
+        self._thread = threading.Thread(target=httpd.serve_forever, name="fixture-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def url(self, path="/login", delay_ms=None):
+        """Address of a fixture; ``delay_ms`` gives its variant that answers that much later"""
+        if self._httpd is None:
+            raise RuntimeError("fixture server is not running; call start() first")
+        query = f"?{urlencode({'delay_ms': delay_ms})}" if delay_ms else ""
+        return f"http://127.0.0.1:{self.port}{path}{query}"
+
+    def stop(self):
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._thread.join()
+            self._httpd = self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+_shared = None
+_shared_lock = threading.Lock()
+
+def shared_server():
+    """The run's fixture server, started on first use and stopped at exit"""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = FixtureServer().start()
+            atexit.register(_shared.stop)
+        return _shared
@@ -1,87 +1,88 @@
 # task2_automated_testing/login_test_automation.py
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 import json
 import time
 
+from backends import BACKENDS, make_backend
+from case_tables import DEFAULT_CASES
+from fixture_server import shared_server
+
+PHASES = ("locate", "type", "click", "response")
+
+def summarize_timings(results):
+    """Median and worst milliseconds per phase over results that have timings"""
+    summary = {}
+    for phase in PHASES + ("total",):
+        samples = sorted(r["timings"][f"{phase}_ms"] for r in results
+                         if f"{phase}_ms" in r.get("timings", {}))
+        if samples:
+            summary[phase] = {"median_ms": samples[len(samples) // 2], "max_ms": samples[-1]}
+    return summary
+
 class LoginTestAutomation:
-    def __init__(self, driver_path=None):
-        """Initialize the test automation suite"""
-        self.driver = webdriver.Chrome()  # Requires chromedriver
-        self.wait = WebDriverWait(self.driver, 10)
+    def __init__(self, driver_path=None, headless=False, timeout=10, poll_frequency=0.05,
+                 backend="selenium", answer_delay_ms=None, sink=None):
+        """
+        Initialize the test automation suite. Waits give up after ``timeout``
+        seconds and re-check their condition every ``poll_frequency`` seconds.
+        ``backend`` is "selenium" (Chrome), "inprocess" (no browser; see
+        backends.py) or a backend instance. ``answer_delay_ms`` loads the
+        fixture server's variant of the page that answers a login that
+        many milliseconds after the click. With a
+        ``sink`` (result_sink.ResultSink), results are appended to it as
+        each case finishes instead of being kept in ``self.results``.
+        """
+        if isinstance(backend, str):
+            backend = make_backend(backend, driver_path=driver_path, headless=headless,
+                                   timeout=timeout, poll_frequency=poll_frequency)
+        self.backend = backend
+        self.answer_delay_ms = answer_delay_ms
+        self.sink = sink
+        # Selenium objects, for callers that drive the browser directly
+        self.driver = getattr(backend, "driver", None)
+        self.wait = getattr(backend, "wait", None)
         self.results = []
     
     def setup_test_page(self):
-        """Create a simple login page for testing"""
-        html_content = """
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Login Test Page</title>
-        </head>
-        <body>
-            <div id="login-form">
-                <h2>Login</h2>
-                <input type="text" id="username" placeholder="Username">
-                <input type="password" id="password" placeholder="Password">
-                <button onclick="login()">Login</button>
-                <div id="message"></div>
-            </div>
-            
-            <script>
-                const validUsers = {
-                    "admin": "admin123",
-                    "user": "password123"
-                };
-                
-                function login() {
-                    const username = document.getElementById("username").value;
-                    const password = document.getElementById("password").value;
-                    const message = document.getElementById("message");
-                    
-                    if (validUsers[username] && validUsers[username] === password) {
-                        message.textContent = "Login successful!";
-                        message.style.color = "green";
-                    } else {
-                        message.textContent = "Invalid credentials!";
-                        message.style.color = "red";
-                    }
-                }
-            </script>
-        </body>
-        </html>
-        """
-        
-        self.driver.get("data:text/html," + html_content)
+        """Open the login page on the run's shared fixture server"""
+        self.backend.open(shared_server().url("/login", delay_ms=self.answer_delay_ms))
     
     def run_test_case(self, username, password, expected_success, test_name):
-        """Run a single test case"""
+        """
+        Run a single test case. result["timings"] holds the milliseconds
+        spent locating the elements, typing, clicking and waiting for the
+        page's answer.
+        """
         result = {
             "test_name": test_name,
             "username": username,
             "password": password,
             "expected": "success" if expected_success else "failure"
         }
+        timings = {}
+        mark = time.perf_counter()
+        
+        def lap(phase):
+            nonlocal mark
+            now = time.perf_counter()
+            timings[f"{phase}_ms"] = round((now - mark) * 1000, 3)
+            mark = now
         
         try:
-            # Clear fields
-            username_field = self.wait.until(EC.presence_of_element_located((By.ID, "username")))
-            password_field = self.driver.find_element(By.ID, "password")
-            username_field.clear()
-            password_field.clear()
+            # Locate the form
+            form = self.backend.locate()
+            lap("locate")
             
-            # Enter credentials
-            username_field.send_keys(username)
-            password_field.send_keys(password)
+            # Clear fields and enter credentials
+            self.backend.type(form, username, password)
+            lap("type")
             
             # Click login
-            self.driver.find_element(By.TAG_NAME, "button").click()
+            self.backend.click(form)
+            lap("click")
             
             # Wait for response
-            time.sleep(1)
-            message = self.driver.find_element(By.ID, "message").text.lower()
+            message = self.backend.response(form).lower()
+            lap("response")
             
             # Determine actual result
             actual_success = "successful" in message
@@ -93,43 +94,69 @@ class LoginTestAutomation:
             result["error"] = str(e)
             result["passed"] = False
         
-        self.results.append(result)
+        timings["total_ms"] = round(sum(timings.values()), 3)
+        result["timings"] = timings
+        if self.sink is not None:
+            self.sink.write(result)
+        else:
+            self.results.append(result)
         return result
     
-    def run_all_tests(self):
-        """Run all test cases"""
-        # Valid credentials
-        self.run_test_case("admin", "admin123", True, "Valid Credentials - Admin")
-        self.run_test_case("user", "password123", True, "Valid Credentials - User")
-        
-        # Invalid credentials
-        self.run_test_case("admin", "wrongpass", False, "Invalid Password")
-        self.run_test_case("invaliduser", "admin123", False, "Invalid Username")
-        self.run_test_case("", "", False, "Empty Credentials")
+    def run_all_tests(self, cases=None):
+        """
+        Run all test cases (case_tables.DEFAULT_CASES unless given a case
+        table). With a sink the results are already in its file, so this
+        flushes it and returns an empty list.
+        """
+        for case in DEFAULT_CASES if cases is None else cases:
+            self.run_test_case(case.username, case.password, case.expected_success, case.test_name)
         
+        if self.sink is not None:
+            self.sink.flush()
         return self.results
     
     def save_results(self, filename="test_results.json"):
         """Save test results to JSON file"""
+        if self.sink is not None:
+            raise RuntimeError(f"results were streamed to {self.sink.path}, not kept; "
+                               "summarize that file with result_sink.summarize")
         with open(filename, 'w') as f:
             json.dump(self.results, f, indent=2)
     
     def close(self):
         """Close the browser"""
-        self.driver.quit()
+        self.backend.close()
 
 # Example usage
 if __name__ == "__main__":
-    test_suite = LoginTestAutomation()
+    import argparse
+    parser = argparse.ArgumentParser(description="Run the login test cases")
+    parser.add_argument('--backend', choices=sorted(BACKENDS), default="selenium",
+                        help="driver backend (inprocess needs no browser)")
+    parser.add_argument('--output', default="test_results.json",
+                        help="results file; a .jsonl file is appended to as cases finish")
+    args = parser.parse_args()
+    streaming = args.output.endswith(".jsonl")
+    if streaming:
+        from result_sink import ResultSink, format_summary, summarize
+    sink = ResultSink(args.output) if streaming else None
+    test_suite = LoginTestAutomation(backend=args.backend, sink=sink)
     try:
         test_suite.setup_test_page()
         results = test_suite.run_all_tests()
-        test_suite.save_results()
-        
-        # Print summary
+        if not streaming:
+            test_suite.save_results(args.output)
+    finally:
+        test_suite.close()
+        if sink is not None:
+            sink.close()
+    
+    # Print summary
+    if streaming:
+        print(format_summary(summarize(args.output, fields=[f"timings.{p}_ms" for p in PHASES + ("total",)])))
+    else:
         passed = sum(1 for r in results if r["passed"])
         total = len(results)
         print(f"Test Summary: {passed}/{total} passed")
-        
-    finally:
-        test_suite.close()
+        for phase, stats in summarize_timings(results).items():
+            print(f"  {phase:<9} median {stats['median_ms']:.1f} ms, max {stats['max_ms']:.1f} ms")
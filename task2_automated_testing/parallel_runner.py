@@ -0,0 +1,162 @@
+# task2_automated_testing/parallel_runner.py
+# Parallel execution of login test cases: a pool of reusable headless
+# browser sessions, one per worker, each running its shard of a case table.
+# Results are merged back into case order, whatever finished first, or
+# streamed to a JSONL result sink as they finish.
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from backends import BACKENDS
+from case_tables import DEFAULT_CASES, credential_permutations, load_cases
+from fixture_server import shared_server
+
+
+def shard(count, workers):
+    """Round-robin case indices per worker, so shards differ by at most one case"""
+    return [list(range(w, count, workers)) for w in range(min(workers, count))]
+
+def _run_shard(session, indexed_cases, sink=None):
+    session.results.clear()  # the merged run keeps the results, not the session
+    merged = []
+    for index, case in indexed_cases:
+        result = session.run_test_case(case.username, case.password, case.expected_success, case.test_name)
+        if sink is None:
+            merged.append((index, result))
+        else:
+            sink.write(dict(result, index=index))
+            session.results.clear()
+    return merged
+
+class SessionPool:
+    """
+    ``workers`` test sessions (LoginTestAutomation by default, headless, on
+    the named driver ``backend``), opened in parallel with the test page
+    loaded, and kept open across run() calls. Each session runs its shard
+    in its own thread: WebDriver calls spend their time waiting on the
+    browser, not holding the GIL. All sessions load the page from the one
+    shared fixture server, ``answer_delay_ms`` selecting its variant that
+    answers that much later.
+    """
+
+    def __init__(self, workers=None, session_factory=None, headless=True, backend="selenium",
+                 answer_delay_ms=None):
+        self.workers = workers or os.cpu_count() or 1
+        if session_factory is None:
+            from login_test_automation import LoginTestAutomation
+            session_factory = lambda: LoginTestAutomation(headless=headless, backend=backend,
+                                                          answer_delay_ms=answer_delay_ms)
+        self.session_factory = session_factory
+        self.sessions = []
+        self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix='login-session')
+
+    def _open_session(self):
+        session = self.session_factory()
+        try:
+            session.setup_test_page()
+        except Exception:
+            session.close()
+            raise
+        return session
+
+    def start(self):
+        """Open any sessions that are not open yet"""
+        shared_server()  # started here once, not raced for by the sessions
+        missing = self.workers - len(self.sessions)
+        futures = [self._executor.submit(self._open_session) for _ in range(missing)]
+        for future in futures:
+            try:
+                self.sessions.append(future.result())
+            except Exception:
+                self.close()
+                raise
+        return self
+
+    def run(self, cases, sink=None):
+        """
+        Run every case and return their result dicts in case order. With a
+        ``sink``, each result (plus its case ``index``) is written to it as
+        it finishes and nothing is returned.
+        """
+        if len(self.sessions) < self.workers:
+            self.start()
+        cases = list(cases)
+        futures = [self._executor.submit(_run_shard, session, [(i, cases[i]) for i in indices], sink)
+                   for session, indices in zip(self.sessions, shard(len(cases), len(self.sessions)))]
+        indexed = [pair for future in futures for pair in future.result()]
+        indexed.sort(key=lambda pair: pair[0])
+        return [result for _, result in indexed]
+
+    def close(self):
+        for session in self.sessions:
+            try:
+                session.close()
+            except Exception:
+                pass  # the browser may already be gone
+        self.sessions = []
+        self._executor.shutdown(wait=False)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
+
+def run_parallel(cases=DEFAULT_CASES, workers=None, headless=True, backend="selenium",
+                 answer_delay_ms=None, sink=None):
+    """
+    Run a case table on a fresh session pool; returns (results, wall
+    seconds), with no results when they were streamed to ``sink``.
+    """
+    with SessionPool(workers, headless=headless, backend=backend,
+                     answer_delay_ms=answer_delay_ms) as pool:
+        start = time.perf_counter()
+        results = pool.run(cases, sink)
+        return results, time.perf_counter() - start
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the login tests on parallel browser sessions")
+    parser.add_argument('--workers', type=int, default=None, help="browser sessions (default: one per core)")
+    parser.add_argument('--cases', help="CSV case table (username, password, expected[, test_name])")
+    parser.add_argument('--permutations', type=int, default=None,
+                        help="generate this many credential permutations instead")
+    parser.add_argument('--headed', action='store_true', help="show the browser windows")
+    parser.add_argument('--backend', choices=sorted(BACKENDS), default="selenium",
+                        help="driver backend (inprocess needs no browser)")
+    parser.add_argument('--answer-delay-ms', type=int, default=None,
+                        help="use the test page variant that answers this long after the click")
+    parser.add_argument('--output', default="test_results.json",
+                        help="results file; a .jsonl file is appended to as cases finish")
+    args = parser.parse_args()
+
+    if args.cases:
+        cases = load_cases(args.cases)
+    elif args.permutations:
+        cases = credential_permutations(args.permutations)
+    else:
+        cases = DEFAULT_CASES
+
+    if args.output.endswith('.jsonl'):
+        from login_test_automation import PHASES
+        from result_sink import ResultSink, format_summary, summarize
+        with ResultSink(args.output) as sink:
+            _, elapsed = run_parallel(cases, args.workers, headless=not args.headed, backend=args.backend,
+                                      answer_delay_ms=args.answer_delay_ms, sink=sink)
+        print(format_summary(summarize(args.output, fields=[f"timings.{p}_ms" for p in PHASES + ("total",)])))
+        print(f"Wall time: {elapsed:.2f}s ({len(cases) / elapsed:.1f} cases/s)")
+        sys.exit(0)
+
+    results, elapsed = run_parallel(cases, args.workers, headless=not args.headed,
+                                    backend=args.backend, answer_delay_ms=args.answer_delay_ms)
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+
+    passed = sum(1 for r in results if r["passed"])
+    print(f"Test Summary: {passed}/{len(results)} passed")
+    print(f"Wall time: {elapsed:.2f}s ({len(results) / elapsed:.1f} cases/s)")
+    from login_test_automation import summarize_timings
+    for phase, stats in summarize_timings(results).items():
+        print(f"  {phase:<9} median {stats['median_ms']:.1f} ms, max {stats['max_ms']:.1f} ms")
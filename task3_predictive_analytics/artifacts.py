@@ -0,0 +1,46 @@
+# task3_predictive_analytics/artifacts.py
+# Content-addressed evaluation artifacts. Each output file is recorded in a
+# manifest with the hash of what it was rendered from (model, test set), and
+# is only rebuilt when that hash changes or the file has gone missing.
+import json
+import os
+import tempfile
+from pathlib import Path
+
+MANIFEST_FILE = 'artifacts_manifest.json'
+
+
+class ArtifactManifest:
+    """The manifest of one output directory, mapping file name to content key"""
+
+    def __init__(self, output_dir='outputs'):
+        self.output_dir = Path(output_dir)
+        self.path = self.output_dir / MANIFEST_FILE
+        try:
+            with open(self.path) as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def is_current(self, name, key):
+        return self.entries.get(name) == key and (self.output_dir / name).exists()
+
+    def build(self, name, key, render):
+        """
+        Call render(path) unless ``name`` was already rendered for ``key``.
+        Returns True if the artifact was (re)built.
+        """
+        if self.is_current(name, key):
+            return False
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        render(self.output_dir / name)
+        self.entries[name] = key
+        return True
+
+    def save(self):
+        """Write the manifest atomically, so an interrupted run cannot corrupt it"""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(prefix='.manifest-', dir=self.output_dir)
+        with os.fdopen(fd, 'w') as f:
+            json.dump(self.entries, f, indent=2, sort_keys=True)
+        os.replace(tmp, self.path)
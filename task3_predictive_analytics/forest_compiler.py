@@ -0,0 +1,206 @@
+# task3_predictive_analytics/forest_compiler.py
+# Flatten a fitted RandomForestClassifier into contiguous NumPy node arrays
+# and predict by walking every tree one level at a time, vectorized across
+# trees and rows. Small batches skip sklearn's per-call and per-tree
+# overhead, and the saved arrays are much smaller than the pickle.
+import argparse
+import time
+
+import numpy as np
+import sklearn
+
+from model_store import ModelStore
+
+# Before scikit-learn 1.4, tree leaves held weighted class counts and
+# predict_proba normalized them per call; since then they hold fractions
+_LEAF_VALUES_ARE_FRACTIONS = tuple(int(p) for p in sklearn.__version__.split('.')[:2]) >= (1, 4)
+
+
+class CompiledForest:
+    """
+    A forest as flat arrays over the nodes of all trees: split feature and
+    threshold, both children packed as children[2 * node + go_right], and
+    per-node class probabilities. Leaves point to themselves, so every
+    tree can be stepped ``depth`` times without checking for leaves.
+    """
+
+    def __init__(self, feature, threshold, children, values, roots, depth, classes,
+                 n_features, missing_go_left=None):
+        self.feature = feature
+        self.threshold = threshold
+        self.children = children
+        self.values = values
+        self.roots = roots
+        self.depth = int(depth)
+        self.classes_ = classes
+        self.n_features_in_ = int(n_features)
+        self.missing_go_left = missing_go_left
+
+    @property
+    def n_trees(self):
+        return len(self.roots)
+
+    def apply(self, X):
+        """Leaf node index of every row in every tree, shape (n_trees, n_rows)"""
+        # sklearn evaluates trees on float32 input against float64 thresholds
+        X = np.asarray(X, dtype=np.float32)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        n_rows, n_features = X.shape
+        flat = X.ravel()
+        # One flat lane per (tree, row); 1-D gathers are the cheapest NumPy ops
+        nodes = np.repeat(self.roots, n_rows)
+        offsets = np.tile(np.arange(n_rows, dtype=np.int64) * n_features, self.n_trees)
+        has_missing = self.missing_go_left is not None and np.isnan(flat).any()
+        for _ in range(self.depth):
+            columns = self.feature[nodes]
+            x = flat[columns if n_rows == 1 else offsets + columns]
+            if has_missing:
+                go_right = ~(x <= self.threshold[nodes]) & ~(np.isnan(x) & self.missing_go_left[nodes])
+            else:
+                go_right = x > self.threshold[nodes]
+            nodes = self.children[2 * nodes + go_right]
+        return nodes.reshape(self.n_trees, n_rows)
+
+    def predict_proba(self, X):
+        """Mean class probabilities over the trees, as RandomForestClassifier computes them"""
+        leaves = self.apply(X)
+        # Summing over the outer axis adds tree by tree, in the same order
+        # as sklearn's accumulation, so results are bit-for-bit identical
+        proba = self.values[leaves].sum(axis=0)
+        proba /= self.n_trees
+        return proba
+
+    def predict(self, X):
+        return self.classes_.take(np.argmax(self.predict_proba(X), axis=1))
+
+    def save(self, path):
+        """Write the arrays to a compressed .npz file"""
+        arrays = {
+            'feature': self.feature, 'threshold': self.threshold, 'children': self.children,
+            'values': self.values, 'roots': self.roots, 'depth': np.array(self.depth),
+            'classes': self.classes_, 'n_features': np.array(self.n_features_in_),
+        }
+        if self.missing_go_left is not None:
+            arrays['missing_go_left'] = self.missing_go_left
+        np.savez_compressed(path, **arrays)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path, allow_pickle=False) as f:
+            return cls(
+                f['feature'], f['threshold'], f['children'], f['values'], f['roots'],
+                f['depth'], f['classes'], f['n_features'],
+                f['missing_go_left'] if 'missing_go_left' in f else None,
+            )
+
+def compile_forest(forest):
+    """Flatten a fitted single-output RandomForestClassifier into a CompiledForest"""
+    if forest.n_outputs_ != 1:
+        raise ValueError("only single-output forests can be compiled")
+    n_classes = forest.n_classes_
+    features, thresholds, children, values, roots, missing = [], [], [], [], [], []
+    offset, depth = 0, 0
+    for estimator in forest.estimators_:
+        tree = estimator.tree_
+        count = tree.node_count
+        nodes = np.arange(offset, offset + count, dtype=np.int32)
+        leaf = tree.children_left == -1
+        left = np.where(leaf, nodes, tree.children_left + offset).astype(np.int32)
+        right = np.where(leaf, nodes, tree.children_right + offset).astype(np.int32)
+
+        features.append(np.where(leaf, 0, tree.feature).astype(np.int32))
+        thresholds.append(tree.threshold.astype(np.float64))
+        children.append(np.column_stack([left, right]).ravel())
+        values.append(_leaf_probabilities(tree.value[:, 0, :n_classes]))
+        roots.append(offset)
+        node_records = tree.__getstate__()['nodes']  # structured array of all node fields
+        if 'missing_go_to_left' in node_records.dtype.names:
+            missing.append(node_records['missing_go_to_left'].astype(bool))
+        offset += count
+        depth = max(depth, tree.max_depth)
+
+    return CompiledForest(
+        np.concatenate(features),
+        np.concatenate(thresholds),
+        np.concatenate(children),
+        np.concatenate(values),
+        np.asarray(roots, dtype=np.int32),
+        depth,
+        np.asarray(forest.classes_),
+        forest.n_features_in_,
+        np.concatenate(missing) if missing else None,
+    )
+
+def _leaf_probabilities(value):
+    value = np.array(value, dtype=np.float64)
+    if _LEAF_VALUES_ARE_FRACTIONS:
+        return value
+    # Same normalization DecisionTreeClassifier.predict_proba applied
+    normalizer = value.sum(axis=1)[:, np.newaxis]
+    normalizer[normalizer == 0.0] = 1.0
+    value /= normalizer
+    return value
+
+def parity_inputs(compiled, rows=1000, seed=0):
+    """
+    Random rows spread over each feature's split thresholds, so that both
+    branches of most splits are exercised.
+    """
+    rng = np.random.default_rng(seed)
+    n_features = compiled.n_features_in_
+    low, high = np.zeros(n_features), np.ones(n_features)
+    split = compiled.children[2 * np.arange(len(compiled.feature))] != np.arange(len(compiled.feature))
+    # Splits that only separate missing values have an infinite threshold
+    split &= np.isfinite(compiled.threshold)
+    for f in range(n_features):
+        cuts = compiled.threshold[split & (compiled.feature == f)]
+        if len(cuts):
+            margin = (cuts.max() - cuts.min()) * 0.1 + 1e-3
+            low[f], high[f] = cuts.min() - margin, cuts.max() + margin
+    return rng.uniform(low, high, size=(rows, n_features))
+
+def check_parity(forest, compiled, X):
+    """Largest absolute probability difference to sklearn; 0.0 means identical"""
+    expected = forest.predict_proba(X)
+    actual = compiled.predict_proba(X)
+    if not np.array_equal(forest.predict(X), compiled.predict(X)):
+        raise AssertionError("compiled forest predicts different labels")
+    return float(np.abs(expected - actual).max())
+
+def single_row_latency(predict, X, repeats=1000):
+    """Median single-row prediction time in microseconds"""
+    samples = []
+    for i in range(repeats):
+        row = X[i % len(X):i % len(X) + 1]
+        start = time.perf_counter_ns()
+        predict(row)
+        samples.append(time.perf_counter_ns() - start)
+    return float(np.median(samples)) / 1000
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compile a stored forest and check it against sklearn")
+    parser.add_argument('key', nargs='?', help="model store key (default: every stored model)")
+    parser.add_argument('--output-dir', default=None, help="write <key>.npz compiled artifacts here")
+    args = parser.parse_args()
+
+    store = ModelStore()
+    for key in [args.key] if args.key else store.keys():
+        forest = store.load(key)['model']
+        compiled = compile_forest(forest)
+        X = parity_inputs(compiled)
+        if hasattr(forest, 'feature_names_in_'):
+            import pandas as pd
+            X_forest = pd.DataFrame(X, columns=forest.feature_names_in_)
+        else:
+            X_forest = X
+        max_diff = check_parity(forest, compiled, X_forest)
+        sklearn_us = single_row_latency(forest.predict_proba, X_forest)
+        compiled_us = single_row_latency(compiled.predict_proba, X)
+        print(f"{key}: {compiled.n_trees} trees, {len(compiled.feature):,} nodes, depth {compiled.depth}; "
+              f"max |Δp| = {max_diff:.3g}; single row: sklearn {sklearn_us:.0f}µs, "
+              f"compiled {compiled_us:.0f}µs")
+        if args.output_dir:
+            path = f"{args.output_dir}/{key}.npz"
+            compiled.save(path)
+            print(f"  saved {path}")
@@ -1,86 +1,145 @@
-
 # task3_predictive_analytics/predictive_model.py
-import numpy as np
 import pandas as pd
+from sklearn.datasets import load_breast_cancer
 from sklearn.model_selection import train_test_split
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.metrics import accuracy_score, f1_score, classification_report
-import matplotlib.pyplot as plt
-import seaborn as sns
+import argparse
 import json
+import os
+from datetime import datetime, timezone
 
-# Load dataset
-from sklearn.datasets import load_breast_cancer
-data = load_breast_cancer()
-
-# Create DataFrame
-df = pd.DataFrame(data.data, columns=data.feature_names)
-df['target'] = data.target
-
-# For our resource allocation simulation, let's create priority levels
-# based on feature values (simulating issue severity)
-feature_sums = df.iloc[:, :-1].sum(axis=1)
-thresholds = np.percentile(feature_sums, [33, 67])
-
-def classify_priority(val):
-    if val < thresholds[0]:
-        return "Low"
-    elif val < thresholds[1]:
-        return "Medium"
-    else:
-        return "High"
-
-# Create priority labels
-y_priority = np.array([classify_priority(val) for val in feature_sums])
+from artifacts import ArtifactManifest
+from model_store import ModelStore, fingerprint
+from priority_labels import iter_row_chunks, label_priorities
 
 # Select relevant features for prediction
-selected_features = [
+SELECTED_FEATURES = [
     'mean radius', 'mean texture', 'mean perimeter', 'mean area',
     'mean smoothness', 'mean compactness', 'mean concavity'
 ]
-X = df[selected_features]
-
-# Split data
-X_train, X_test, y_train, y_test = train_test_split(
-    X, y_priority, test_size=0.2, random_state=42, stratify=y_priority
-)
-
-# Train Random Forest model
-model = RandomForestClassifier(n_estimators=100, random_state=42)
-model.fit(X_train, y_train)
-
-# Make predictions
-y_pred = model.predict(X_test)
-
-# Evaluate model
-accuracy = accuracy_score(y_test, y_pred)
-f1 = f1_score(y_test, y_pred, average='weighted')
-
-# Save metrics
-metrics = {
-    "accuracy": float(accuracy),
-    "f1_score": float(f1),
-    "classification_report": classification_report(y_test, y_pred, output_dict=True)
-}
-
-# Save results
-with open('outputs/model_metrics.json', 'w') as f:
-    json.dump(metrics, f, indent=2)
-
-# Generate visualizations
-plt.figure(figsize=(8, 6))
-cm = pd.crosstab(y_test, y_pred, rownames=['Actual'], colnames=['Predicted'])
-sns.heatmap(cm, annot=True, fmt='d', cmap='Blues')
-plt.savefig('outputs/confusion_matrix.png')
-plt.close()
-
-# Feature importance
-feat_importance = pd.Series(model.feature_importances_, index=selected_features)
-feat_importance.sort_values().plot(kind='barh')
-plt.tight_layout()
-plt.savefig('outputs/feature_importance.png')
-plt.close()
-
-print(f"Model trained successfully!")
-print(f"Accuracy: {accuracy:.3f}")
-print(f"F1-Score: {f1:.3f}")
+MODEL_PARAMS = {'n_estimators': 100, 'random_state': 42}
+
+
+def load_data():
+    """
+    Breast-cancer features with simulated priority labels, split as the
+    script always has: returns (X_train, X_test, y_train, y_test).
+    """
+    data = load_breast_cancer()
+
+    # Create DataFrame
+    df = pd.DataFrame(data.data, columns=data.feature_names)
+
+    # For our resource allocation simulation, let's create priority levels
+    # based on feature values (simulating issue severity)
+    # Summed straight from the NumPy feature matrix in row chunks, so the same
+    # pipeline labels data too large for memory (see priority_labels.py)
+    y_priority, _ = label_priorities(lambda: iter_row_chunks(data.data))
+
+    X = df[SELECTED_FEATURES]
+
+    # Split data
+    return train_test_split(
+        X, y_priority, test_size=0.2, random_state=42, stratify=y_priority
+    )
+
+def train_model(X_train, y_train, store=None):
+    """Train the Random Forest model, or reuse the stored one if nothing changed"""
+    model_key = fingerprint(X_train, y_train, features=SELECTED_FEATURES, params=MODEL_PARAMS)
+    model = (store or ModelStore()).get_or_train(
+        model_key,
+        lambda: {'model': RandomForestClassifier(**MODEL_PARAMS).fit(X_train, y_train)},
+        metadata={'source': 'task3_predictive_analytics/predictive_model.py', 'params': MODEL_PARAMS},
+    )['model']
+    return model, model_key
+
+def evaluate(model, X_test, y_test):
+    """Accuracy, weighted F1 and the classification report on the test split"""
+    # Make predictions
+    y_pred = model.predict(X_test)
+
+    # Evaluate model
+    accuracy = accuracy_score(y_test, y_pred)
+    f1 = f1_score(y_test, y_pred, average='weighted')
+
+    return {
+        "accuracy": float(accuracy),
+        "f1_score": float(f1),
+        "classification_report": classification_report(y_test, y_pred, output_dict=True)
+    }, y_pred
+
+def plot_confusion_matrix(y_test, y_pred, path):
+    # Plotting libraries are imported here so that metrics-only runs never load them
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    plt.figure(figsize=(8, 6))
+    cm = pd.crosstab(y_test, y_pred, rownames=['Actual'], colnames=['Predicted'])
+    sns.heatmap(cm, annot=True, fmt='d', cmap='Blues')
+    plt.savefig(path)
+    plt.close()
+
+def plot_feature_importance(model, path):
+    import matplotlib.pyplot as plt
+
+    feat_importance = pd.Series(model.feature_importances_, index=SELECTED_FEATURES)
+    feat_importance.sort_values().plot(kind='barh')
+    plt.tight_layout()
+    plt.savefig(path)
+    plt.close()
+
+def save_artifacts(model, model_key, X_test, y_test, y_pred, metrics, plots=True, output_dir='outputs'):
+    """
+    Write the metrics and, unless ``plots`` is off, the plots. Each file is
+    keyed on what it depends on (model, test set) in the output directory's
+    manifest and is skipped when it is already current. Returns the names
+    of the files that were rebuilt.
+    """
+    manifest = ArtifactManifest(output_dir)
+    evaluation_key = fingerprint(X_test, y_test, model=model_key)
+
+    def write_metrics(path):
+        with open(path, 'w') as f:
+            json.dump(metrics, f, indent=2)
+
+    built = []
+    if manifest.build('model_metrics.json', evaluation_key, write_metrics):
+        built.append('model_metrics.json')
+    if plots:
+        # Generate visualizations
+        if manifest.build('confusion_matrix.png', evaluation_key,
+                          lambda path: plot_confusion_matrix(y_test, y_pred, path)):
+            built.append('confusion_matrix.png')
+        # Feature importance depends on the model alone
+        if manifest.build('feature_importance.png', model_key,
+                          lambda path: plot_feature_importance(model, path)):
+            built.append('feature_importance.png')
+    manifest.save()
+    return built
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Train and evaluate the priority model")
+    parser.add_argument('--headless', action='store_true',
+                        default=os.environ.get('HEADLESS', '') not in ('', '0'),
+                        help="metrics only: skip the plots and never import matplotlib "
+                             "(also set by HEADLESS=1)")
+    parser.add_argument('--metrics-log', metavar='JSONL',
+                        help="also append this run's metrics to a JSONL history")
+    args = parser.parse_args()
+
+    X_train, X_test, y_train, y_test = load_data()
+    model, model_key = train_model(X_train, y_train)
+    metrics, y_pred = evaluate(model, X_test, y_test)
+
+    # Save results
+    built = save_artifacts(model, model_key, X_test, y_test, y_pred, metrics, plots=not args.headless)
+    if args.metrics_log:
+        from result_sink import ResultSink  # shared/, see requirements.txt
+        with ResultSink(args.metrics_log) as sink:
+            sink.write(dict(metrics, model_key=model_key, timestamp=datetime.now(timezone.utc).isoformat()))
+
+    print(f"Model trained successfully!")
+    print(f"Accuracy: {metrics['accuracy']:.3f}")
+    print(f"F1-Score: {metrics['f1_score']:.3f}")
+    print(f"Artifacts rebuilt: {', '.join(built) if built else 'none (all current)'}")
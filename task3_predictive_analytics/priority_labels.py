@@ -0,0 +1,120 @@
+# task3_predictive_analytics/priority_labels.py
+# Vectorized, chunk-aware priority labeling. An item's severity is the sum
+# of its features; severities below the 33rd percentile are Low, below the
+# 67th Medium, the rest High. Two passes over row chunks (percentiles,
+# then labels) let the labels be computed for data that is not in memory.
+import numpy as np
+
+PRIORITY_LEVELS = np.array(['Low', 'Medium', 'High'])
+PERCENTILES = (33, 67)
+DEFAULT_CHUNK_ROWS = 1_000_000
+# Severities kept exactly for the percentiles (8 MB at 8 bytes each);
+# beyond this many rows the percentiles are estimated from a uniform
+# reservoir sample of this size. The estimate's rank is then off by about
+# sqrt(q * (1 - q) / DEFAULT_MAX_EXACT), i.e. ±0.05 percentile points for
+# the 33rd/67th at one standard deviation, so roughly 0.05% of rows, those
+# closest to a threshold, can get the neighbouring label.
+DEFAULT_MAX_EXACT = 1_000_000
+
+
+class StreamingPercentiles:
+    """
+    Percentiles of values that arrive chunk by chunk, in one buffer of
+    ``max_exact`` float64 values. Until that many values were seen it
+    holds all of them, so the result equals np.percentile over all of
+    them; after that it is a reservoir sample and the percentiles become
+    estimates (see DEFAULT_MAX_EXACT for their error).
+    """
+
+    def __init__(self, max_exact=DEFAULT_MAX_EXACT, seed=0):
+        self.max_exact = max_exact
+        self.seen = 0
+        self._sample = None
+        self._rng = np.random.default_rng(seed)
+
+    @property
+    def exact(self):
+        return self.seen <= self.max_exact
+
+    def update(self, values):
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if self._sample is None:
+            # The OS only commits the pages that get written
+            self._sample = np.empty(self.max_exact)
+        # Fill the remaining slots first
+        filled = min(self.seen, self.max_exact)
+        free = min(self.max_exact - filled, len(values))
+        self._sample[filled:filled + free] = values[:free]
+        rest = values[free:]
+        if len(rest):
+            # Algorithm R, vectorized: value number i replaces a random slot
+            # with probability max_exact / (i + 1)
+            positions = self.seen + free + np.arange(len(rest), dtype=np.int64)
+            slots = (self._rng.random(len(rest)) * (positions + 1)).astype(np.int64)
+            keep = slots < self.max_exact
+            self._sample[slots[keep]] = rest[keep]
+        self.seen += len(values)
+
+    def percentiles(self, q):
+        if not self.seen:
+            raise ValueError("no values seen")
+        return np.percentile(self._sample[:min(self.seen, self.max_exact)], q)
+
+def iter_row_chunks(array, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """
+    Row chunks of a 2-D array; pass np.load(path, mmap_mode='r') to read
+    a .npy file from disk one chunk at a time.
+    """
+    for start in range(0, len(array), chunk_rows):
+        yield np.asarray(array[start:start + chunk_rows])
+
+def severity(chunk):
+    """Per-row feature sums, without copying the chunk"""
+    return np.asarray(chunk).sum(axis=1)
+
+def priority_thresholds(chunks, percentiles=PERCENTILES, max_exact=DEFAULT_MAX_EXACT):
+    """First pass: severity percentiles over all row chunks"""
+    estimator = StreamingPercentiles(max_exact)
+    for chunk in chunks:
+        estimator.update(severity(chunk))
+    return estimator.percentiles(percentiles)
+
+def priority_codes(scores, thresholds):
+    """0/1/2 codes into PRIORITY_LEVELS: how many thresholds each score reaches"""
+    return np.searchsorted(thresholds, scores, side='right').astype(np.int8)
+
+def iter_priority_codes(chunks, thresholds):
+    """Second pass: priority codes, one array per row chunk"""
+    for chunk in chunks:
+        yield priority_codes(severity(chunk), thresholds)
+
+def label_priorities(make_chunks, percentiles=PERCENTILES, max_exact=DEFAULT_MAX_EXACT):
+    """
+    Priority labels ('Low', 'Medium', 'High') for every row, in memory.
+    ``make_chunks`` returns a fresh iterator of row chunks for each pass.
+    Returns (labels, thresholds). The labels array holds every row, so
+    for inputs that do not fit in memory use write_priority_codes (or
+    iter_priority_codes over priority_thresholds) instead.
+    """
+    thresholds = priority_thresholds(make_chunks(), percentiles, max_exact)
+    codes = np.concatenate(list(iter_priority_codes(make_chunks(), thresholds)))
+    return PRIORITY_LEVELS[codes], thresholds
+
+def write_priority_codes(make_chunks, path, percentiles=PERCENTILES, max_exact=DEFAULT_MAX_EXACT):
+    """
+    Out-of-core labeling: write one int8 code per row to a .npy file
+    (PRIORITY_LEVELS[code] is the label). Returns the thresholds.
+    """
+    estimator = StreamingPercentiles(max_exact)
+    for chunk in make_chunks():
+        estimator.update(severity(chunk))
+    thresholds = estimator.percentiles(percentiles)
+
+    out = np.lib.format.open_memmap(path, mode='w+', dtype=np.int8, shape=(estimator.seen,))
+    start = 0
+    for codes in iter_priority_codes(make_chunks(), thresholds):
+        out[start:start + len(codes)] = codes
+        start += len(codes)
+    out.flush()
+    del out
+    return thresholds
@@ -0,0 +1,300 @@
+# task3_predictive_analytics/streaming_training.py
+# Out-of-core training for the priority model. Features are read from disk
+# one chunk at a time (memory-mapped .npy files or Parquet row groups) and
+# the forest grows per chunk, either incrementally with warm_start or as
+# independent shard forests trained in worker processes and merged.
+import argparse
+import copy
+import os
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.metrics import accuracy_score, f1_score
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+DEFAULT_CHUNK_ROWS = 100_000
+
+
+class NpySource:
+    """
+    Features and labels stored as two .npy files, memory-mapped so that
+    only the chunk being read is paged in. ``columns`` selects feature
+    columns by index.
+    """
+
+    def __init__(self, features_path, labels_path, columns=None, chunk_rows=DEFAULT_CHUNK_ROWS):
+        self.features_path = str(features_path)
+        self.labels_path = str(labels_path)
+        self.columns = None if columns is None else list(columns)
+        self.chunk_rows = chunk_rows
+        self._X = self._y = None
+
+    def __getstate__(self):
+        # Worker processes reopen the files instead of receiving the maps
+        return dict(self.__dict__, _X=None, _y=None)
+
+    def _open(self):
+        if self._X is None:
+            self._X = np.load(self.features_path, mmap_mode='r')
+            self._y = np.load(self.labels_path, mmap_mode='r')
+            if len(self._X) != len(self._y):
+                raise ValueError(f"{self.features_path} has {len(self._X)} rows "
+                                 f"but {self.labels_path} has {len(self._y)}")
+
+    @property
+    def n_rows(self):
+        self._open()
+        return len(self._X)
+
+    def chunks(self):
+        """(start, stop) row ranges of at most chunk_rows rows (all rows if None)"""
+        size = self.chunk_rows or max(self.n_rows, 1)
+        return [(start, min(start + size, self.n_rows)) for start in range(0, self.n_rows, size)]
+
+    def read(self, chunk):
+        self._open()
+        start, stop = chunk
+        X = self._X[start:stop]
+        X = np.asarray(X if self.columns is None else X[:, self.columns])
+        return X, np.asarray(self._y[start:stop])
+
+class ParquetSource:
+    """A Parquet file read one row group at a time (needs pyarrow)"""
+
+    def __init__(self, path, features, label):
+        self.path = str(path)
+        self.features = list(features)
+        self.label = label
+
+    @property
+    def n_rows(self):
+        import pyarrow.parquet as pq
+        return pq.ParquetFile(self.path).metadata.num_rows
+
+    def chunks(self):
+        """Row group indices"""
+        import pyarrow.parquet as pq
+        return list(range(pq.ParquetFile(self.path).num_row_groups))
+
+    def read(self, chunk):
+        import pyarrow.parquet as pq
+        table = pq.ParquetFile(self.path).read_row_group(chunk, columns=self.features + [self.label])
+        X = np.column_stack([table.column(name).to_numpy() for name in self.features])
+        return X, table.column(self.label).to_numpy()
+
+def open_source(path, labels=None, features=None, label='priority', chunk_rows=DEFAULT_CHUNK_ROWS):
+    """NpySource for a .npy features file (``labels`` is its .npy labels file), else ParquetSource"""
+    if Path(path).suffix.lower() == '.npy':
+        if labels is None:
+            raise ValueError("a .npy features file needs a labels file")
+        columns = None if features is None else [int(f) for f in features]
+        return NpySource(path, labels, columns, chunk_rows)
+    if features is None:
+        raise ValueError("name the feature columns to read from Parquet")
+    return ParquetSource(path, features, label)
+
+def trees_per_chunk(n_estimators, n_chunks):
+    """Spread n_estimators over the chunks as evenly as possible"""
+    base, extra = divmod(n_estimators, n_chunks)
+    return [base + (i < extra) for i in range(n_chunks)]
+
+def _check_classes(y, classes, chunk):
+    present = np.unique(y)
+    if classes is not None and not np.array_equal(present, classes):
+        raise ValueError(f"chunk {chunk} has classes {present.tolist()}, expected "
+                         f"{np.asarray(classes).tolist()}; use larger chunks or shuffle the rows")
+    return present
+
+def train_incremental(source, n_estimators=100, classes=None, **params):
+    """
+    Grow one forest chunk by chunk with warm_start: each chunk adds its
+    share of the trees, fitted on that chunk only, so memory is bounded by
+    the chunk size. With a single chunk this is exactly
+    RandomForestClassifier(n_estimators, **params).fit(X, y).
+    Every chunk must contain every class.
+    """
+    chunks = source.chunks()
+    model = RandomForestClassifier(n_estimators=0, warm_start=True, **params)
+    for chunk, n_trees in zip(chunks, trees_per_chunk(n_estimators, len(chunks))):
+        if not n_trees:
+            continue
+        X, y = source.read(chunk)
+        classes = _check_classes(y, classes, chunk)
+        model.set_params(n_estimators=model.n_estimators + n_trees)
+        model.fit(X, y)
+    model.set_params(warm_start=False)
+    return model
+
+def _fit_shard(source, chunk, n_trees, seed, params):
+    X, y = source.read(chunk)
+    model = RandomForestClassifier(**dict(params, n_estimators=n_trees, random_state=seed)).fit(X, y)
+    return model, peak_rss_mb()
+
+def train_sharded(source, n_estimators=100, n_jobs=None, classes=None, random_state=42, **params):
+    """
+    Fit a small forest per chunk in a process pool and merge their trees.
+    Workers read their own chunk from disk. Returns (model, worker peak
+    RSS in MB, or None where the platform cannot tell).
+    """
+    chunks = source.chunks()
+    jobs = [(chunk, n_trees, random_state + i)
+            for i, (chunk, n_trees) in enumerate(zip(chunks, trees_per_chunk(n_estimators, len(chunks))))
+            if n_trees]
+    with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+        futures = [pool.submit(_fit_shard, source, chunk, n_trees, seed, params)
+                   for chunk, n_trees, seed in jobs]
+        results = [future.result() for future in futures]
+    forests = [forest for forest, _ in results]
+    for (chunk, _, _), forest in zip(jobs, forests):
+        classes = _check_classes(forest.classes_, classes, chunk)
+    peaks = [peak for _, peak in results if peak is not None]
+    return merge_forests(forests), max(peaks) if peaks else None
+
+def merge_forests(forests):
+    """One forest holding the trees of all ``forests``, which must share classes and features"""
+    merged = copy.copy(forests[0])
+    for forest in forests[1:]:
+        if not np.array_equal(forest.classes_, merged.classes_):
+            raise ValueError("forests were trained on different classes")
+        if forest.n_features_in_ != merged.n_features_in_:
+            raise ValueError("forests were trained on different features")
+    merged.estimators_ = [tree for forest in forests for tree in forest.estimators_]
+    merged.n_estimators = len(merged.estimators_)
+    return merged
+
+def evaluate(model, source):
+    """Accuracy and weighted F1 over a source, predicted chunk by chunk"""
+    y_true, y_pred = [], []
+    for chunk in source.chunks():
+        X, y = source.read(chunk)
+        y_true.append(y)
+        y_pred.append(model.predict(X))
+    y_true, y_pred = np.concatenate(y_true), np.concatenate(y_pred)
+    return {
+        'accuracy': float(accuracy_score(y_true, y_pred)),
+        'f1_score': float(f1_score(y_true, y_pred, average='weighted')),
+    }
+
+def peak_rss_mb(who='self'):
+    """Peak resident set size of this process (or its children) in MB"""
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_SELF if who == 'self' else resource.RUSAGE_CHILDREN)
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    return usage.ru_maxrss / (1024 * 1024 if os.uname().sysname == 'Darwin' else 1024)
+
+@contextmanager
+def memory_high_water():
+    """
+    Yield a dict that is filled on exit with the traced allocation peak
+    (Python objects and NumPy arrays) and the process peak RSS, in MB.
+    """
+    report = {}
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    start = time.perf_counter()
+    try:
+        yield report
+    finally:
+        report['seconds'] = time.perf_counter() - start
+        report['traced_peak_mb'] = tracemalloc.get_traced_memory()[1] / 2**20
+        if started:
+            tracemalloc.stop()
+        report['rss_peak_mb'] = peak_rss_mb()
+
+def train(source, mode='incremental', n_estimators=100, n_jobs=None, classes=None, random_state=42):
+    """Train in the given mode; returns (model, memory report)"""
+    with memory_high_water() as memory:
+        if mode == 'incremental':
+            model = train_incremental(source, n_estimators, classes, random_state=random_state)
+        elif mode == 'sharded':
+            model, memory['worker_rss_peak_mb'] = train_sharded(
+                source, n_estimators, n_jobs, classes, random_state)
+        else:
+            raise ValueError(f"unknown mode {mode!r}")
+    return model, memory
+
+def format_memory(memory):
+    parts = [f"{memory['seconds']:.2f}s", f"traced peak {memory['traced_peak_mb']:.1f} MB"]
+    if memory.get('rss_peak_mb') is not None:
+        parts.append(f"process peak RSS {memory['rss_peak_mb']:.0f} MB")
+    if memory.get('worker_rss_peak_mb') is not None:
+        parts.append(f"worker peak RSS {memory['worker_rss_peak_mb']:.0f} MB")
+    return ', '.join(parts)
+
+def demo(chunk_rows_options, n_jobs=None):
+    """
+    Write predictive_model.py's train/test split to .npy files and train
+    on it from disk: with one chunk the model and its scores are the
+    in-memory script's; smaller chunks show the memory/accuracy trade-off.
+    """
+    from predictive_model import MODEL_PARAMS, load_data
+
+    X_train, X_test, y_train, y_test = load_data()
+    classes = np.unique(y_train)
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = {}
+        for name, array in [('X_train', X_train), ('y_train', y_train), ('X_test', X_test), ('y_test', y_test)]:
+            paths[name] = os.path.join(tmp, f'{name}.npy')
+            np.save(paths[name], np.asarray(array))
+        test = NpySource(paths['X_test'], paths['y_test'])
+
+        baseline = RandomForestClassifier(**MODEL_PARAMS).fit(X_train.to_numpy(), y_train)
+        scores = evaluate(baseline, test)
+        print(f"in memory:            accuracy {scores['accuracy']:.3f}, F1 {scores['f1_score']:.3f}")
+        for mode in ('incremental', 'sharded'):
+            for chunk_rows in chunk_rows_options:
+                source = NpySource(paths['X_train'], paths['y_train'], chunk_rows=chunk_rows)
+                model, memory = train(source, mode, MODEL_PARAMS['n_estimators'], n_jobs, classes,
+                                      MODEL_PARAMS['random_state'])
+                scores = evaluate(model, test)
+                print(f"{mode:<11} {len(source.chunks()):>3} chunk(s): accuracy {scores['accuracy']:.3f}, "
+                      f"F1 {scores['f1_score']:.3f} ({format_memory(memory)})")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Train the priority forest from data on disk, chunk by chunk")
+    parser.add_argument('train', nargs='?', help="training features: .npy (with --labels) or .parquet; "
+                                                 "omit to compare against predictive_model.py")
+    parser.add_argument('--labels', help="training labels .npy, e.g. from priority_labels.write_priority_codes")
+    parser.add_argument('--test', help="held-out features in the same format")
+    parser.add_argument('--test-labels', help="held-out labels .npy")
+    parser.add_argument('--features', nargs='*', help="Parquet column names, or .npy column indices")
+    parser.add_argument('--label-column', default='priority', help="Parquet label column")
+    parser.add_argument('--chunk-rows', type=int, default=DEFAULT_CHUNK_ROWS, help=".npy rows per chunk")
+    parser.add_argument('--mode', choices=['incremental', 'sharded'], default='incremental')
+    parser.add_argument('--n-estimators', type=int, default=100)
+    parser.add_argument('--n-jobs', type=int, default=None, help="worker processes in sharded mode")
+    parser.add_argument('--save', metavar='KEY', help="store the model in the model store under KEY")
+    args = parser.parse_args()
+
+    if args.train is None:
+        demo([None, 200, 100], args.n_jobs)
+        raise SystemExit
+
+    source = open_source(args.train, args.labels, args.features, args.label_column, args.chunk_rows)
+    model, memory = train(source, args.mode, args.n_estimators, args.n_jobs)
+    print(f"Trained {model.n_estimators} trees on {source.n_rows:,} rows in "
+          f"{len(source.chunks())} chunk(s): {format_memory(memory)}")
+    if args.test:
+        test = open_source(args.test, args.test_labels, args.features, args.label_column, args.chunk_rows)
+        scores = evaluate(model, test)
+        print(f"Accuracy: {scores['accuracy']:.3f}")
+        print(f"F1-Score: {scores['f1_score']:.3f}")
+    if args.save:
+        from model_store import ModelStore
+        ModelStore().save(args.save, {'model': model}, metadata={
+            'source': 'task3_predictive_analytics/streaming_training.py',
+            'train': args.train, 'mode': args.mode, 'memory': memory})
+        print(f"Saved model under {args.save}")
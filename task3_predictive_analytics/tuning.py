@@ -0,0 +1,180 @@
+# task3_predictive_analytics/tuning.py
+# Successive-halving hyperparameter search for the priority forest. Every
+# configuration is scored on a small sample of each CV training fold; the
+# best third moves on to three times the data, until the full folds decide.
+# Models are ranked on F1 and on single-row prediction latency.
+import argparse
+import itertools
+import json
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.metrics import accuracy_score, f1_score
+from sklearn.model_selection import StratifiedKFold
+
+from forest_compiler import compile_forest, single_row_latency
+
+SEARCH_SPACE = {
+    'n_estimators': [25, 50, 100, 200],
+    'max_depth': [None, 12, 6],
+    'max_features': ['sqrt', 0.5],
+    'min_samples_leaf': [1, 3],
+}
+# Configurations whose F1 is within this of the best count as equally
+# accurate and are ordered by latency instead
+F1_TOLERANCE = 0.005
+LATENCY_REPEATS = 300
+
+
+def candidates(space=SEARCH_SPACE):
+    """Every combination of the search space, as parameter dicts"""
+    names = sorted(space)
+    return [dict(zip(names, values)) for values in itertools.product(*(space[n] for n in names))]
+
+def cv_folds(y, n_splits=5, seed=42):
+    """
+    Stratified folds as (train, test) index arrays, computed once per
+    search. Training indices are shuffled so that any prefix of them is a
+    random subsample, which is how rounds with less data are drawn.
+    """
+    rng = np.random.default_rng(seed)
+    splitter = StratifiedKFold(n_splits=n_splits, shuffle=True, random_state=seed)
+    return [(rng.permutation(train).astype(np.int32), test.astype(np.int32))
+            for train, test in splitter.split(np.zeros(len(y)), y)]
+
+# Set once per worker process by _init_worker, so trials only ship params
+_X = _y = _folds = None
+
+def _init_worker(X, y, folds):
+    global _X, _y, _folds
+    _X, _y, _folds = X, y, folds
+
+def evaluate_config(params, n_samples, seed=42, latency_repeats=LATENCY_REPEATS):
+    """
+    Mean F1 and accuracy over the cached folds, training on the first
+    ``n_samples`` rows of each training fold, and the median single-row
+    latency of the compiled forest (the demo's serving path) in µs.
+    """
+    f1s, accuracies = [], []
+    for train, test in _folds:
+        train = train[:n_samples]
+        model = RandomForestClassifier(**params, random_state=seed, n_jobs=1).fit(_X[train], _y[train])
+        predicted = model.predict(_X[test])
+        f1s.append(f1_score(_y[test], predicted, average='weighted'))
+        accuracies.append(accuracy_score(_y[test], predicted))
+    latency = single_row_latency(compile_forest(model).predict_proba, _X[test], latency_repeats)
+    return {
+        'params': params,
+        'n_samples': int(min(n_samples, len(train))),
+        'f1': float(np.mean(f1s)),
+        'f1_std': float(np.std(f1s)),
+        'accuracy': float(np.mean(accuracies)),
+        'latency_us': latency,
+    }
+
+def rank(results, f1_tolerance=F1_TOLERANCE):
+    """
+    Order trial results best first: those within f1_tolerance of the best
+    F1 by latency, then the rest by F1.
+    """
+    best = max(r['f1'] for r in results)
+    near = sorted((r for r in results if r['f1'] >= best - f1_tolerance), key=lambda r: r['latency_us'])
+    rest = sorted((r for r in results if r['f1'] < best - f1_tolerance), key=lambda r: -r['f1'])
+    return near + rest
+
+def pareto_front(results):
+    """Results no other result beats on both F1 and latency"""
+    return [r for r in results
+            if not any(o['f1'] >= r['f1'] and o['latency_us'] <= r['latency_us']
+                       and (o['f1'] > r['f1'] or o['latency_us'] < r['latency_us'])
+                       for o in results)]
+
+def successive_halving(X, y, space=SEARCH_SPACE, factor=3, min_samples=50, n_splits=5,
+                       n_jobs=None, seed=42, f1_tolerance=F1_TOLERANCE, progress=None):
+    """
+    Run the search in a process pool; the data and folds are sent to each
+    worker once. Returns (best result, every trial result with its round).
+    """
+    X, y = np.asarray(X), np.asarray(y)
+    configs = candidates(space)
+    folds = cv_folds(y, n_splits, seed)
+    max_samples = min(len(train) for train, _ in folds)
+    # One round per factor-fold cut of the configs, as long as the data
+    # still shrinks by ``factor`` per round without going below min_samples
+    n_rounds = 1 + min(math.floor(math.log(len(configs), factor)),
+                       max(0, math.floor(math.log(max_samples / min_samples, factor))))
+
+    trials = []
+    with ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_worker,
+                             initargs=(X, y, folds)) as pool:
+        for round_ in range(n_rounds):
+            n_samples = max_samples // factor ** (n_rounds - 1 - round_)
+            results = list(pool.map(evaluate_config, configs, itertools.repeat(n_samples),
+                                    itertools.repeat(seed)))
+            ranked = rank(results, f1_tolerance)
+            for r in results:
+                r['round'] = round_
+            trials.extend(results)
+            if progress:
+                progress(round_, n_samples, ranked)
+            configs = [r['params'] for r in ranked[:max(1, math.ceil(len(ranked) / factor))]]
+    return ranked[0], trials
+
+def pareto_table(trials):
+    """One row per trial, flagging the latency/F1 Pareto front of each round"""
+    rows = []
+    for round_ in sorted({t['round'] for t in trials}):
+        results = [t for t in trials if t['round'] == round_]
+        front = {id(r) for r in pareto_front(results)}
+        for r in results:
+            rows.append({'round': round_, 'n_samples': r['n_samples'], **r['params'],
+                         'f1': r['f1'], 'f1_std': r['f1_std'], 'accuracy': r['accuracy'],
+                         'latency_us': r['latency_us'], 'pareto': id(r) in front})
+    return pd.DataFrame(rows).sort_values(['round', 'pareto', 'latency_us'], ascending=[True, False, True])
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Successive-halving search over the priority forest")
+    parser.add_argument('--n-jobs', type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument('--factor', type=int, default=3)
+    parser.add_argument('--folds', type=int, default=5)
+    parser.add_argument('--f1-tolerance', type=float, default=F1_TOLERANCE)
+    parser.add_argument('--output-dir', default='outputs')
+    args = parser.parse_args()
+
+    from predictive_model import load_data
+
+    X_train, X_test, y_train, y_test = load_data()
+    best, trials = successive_halving(
+        X_train, y_train, factor=args.factor, n_splits=args.folds, n_jobs=args.n_jobs,
+        f1_tolerance=args.f1_tolerance,
+        progress=lambda r, n, ranked: print(
+            f"round {r}: {len(ranked)} configs on {n} rows/fold, "
+            f"best F1 {ranked[0]['f1']:.3f} at {ranked[0]['latency_us']:.0f}µs"))
+
+    # The winner, refitted on the whole training split and scored on the test split
+    model = RandomForestClassifier(**best['params'], random_state=42, n_jobs=-1).fit(X_train, y_train)
+    y_pred = model.predict(X_test)
+    summary = {
+        'params': best['params'],
+        'cv_f1': best['f1'],
+        'cv_accuracy': best['accuracy'],
+        'latency_us': best['latency_us'],
+        'test_accuracy': float(accuracy_score(y_test, y_pred)),
+        'test_f1_score': float(f1_score(y_test, y_pred, average='weighted')),
+        'search': {'factor': args.factor, 'folds': args.folds, 'f1_tolerance': args.f1_tolerance,
+                   'space': SEARCH_SPACE, 'trials': len(trials)},
+    }
+    os.makedirs(args.output_dir, exist_ok=True)
+    with open(os.path.join(args.output_dir, 'best_params.json'), 'w') as f:
+        json.dump(summary, f, indent=2)
+    table = pareto_table(trials)
+    table.to_csv(os.path.join(args.output_dir, 'pareto.csv'), index=False)
+
+    print(table[table['pareto'] & (table['round'] == table['round'].max())].to_string(index=False))
+    print(f"Best: {best['params']}")
+    print(f"Accuracy: {summary['test_accuracy']:.3f}")
+    print(f"F1-Score: {summary['test_f1_score']:.3f}")
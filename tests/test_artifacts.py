@@ -0,0 +1,61 @@
+# tests/test_artifacts.py
+# Evaluation artifacts are rebuilt only when what they were rendered from
+# changes, and headless runs never import the plotting libraries.
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from artifacts import ArtifactManifest
+
+TASK3 = Path(__file__).resolve().parent.parent / 'task3_predictive_analytics'
+
+
+def _render(calls):
+    def render(path):
+        calls.append(path.name)
+        path.write_text(str(len(calls)))
+    return render
+
+def test_artifact_is_rebuilt_only_when_its_key_changes(tmp_path):
+    calls = []
+    manifest = ArtifactManifest(tmp_path)
+    assert manifest.build('metrics.json', 'key-1', _render(calls))
+    manifest.save()
+
+    manifest = ArtifactManifest(tmp_path)
+    assert not manifest.build('metrics.json', 'key-1', _render(calls))
+    assert manifest.build('metrics.json', 'key-2', _render(calls))
+    assert calls == ['metrics.json', 'metrics.json']
+
+def test_missing_file_is_rebuilt(tmp_path):
+    calls = []
+    manifest = ArtifactManifest(tmp_path)
+    manifest.build('plot.png', 'key', _render(calls))
+    manifest.save()
+    (tmp_path / 'plot.png').unlink()
+    assert ArtifactManifest(tmp_path).build('plot.png', 'key', _render(calls))
+
+def test_corrupt_manifest_counts_as_empty(tmp_path):
+    (tmp_path / 'artifacts_manifest.json').write_text('{not json')
+    assert ArtifactManifest(tmp_path).entries == {}
+
+def test_headless_run_skips_plotting_libraries(tmp_path):
+    script = f"""
+import sys
+from model_store import ModelStore
+from predictive_model import evaluate, load_data, save_artifacts, train_model
+X_train, X_test, y_train, y_test = load_data()
+model, key = train_model(X_train, y_train, store=ModelStore({str(tmp_path / 'models')!r}))
+metrics, y_pred = evaluate(model, X_test, y_test)
+built = save_artifacts(model, key, X_test, y_test, y_pred, metrics, plots=False,
+                       output_dir={str(tmp_path / 'outputs')!r})
+again = save_artifacts(model, key, X_test, y_test, y_pred, metrics, plots=False,
+                       output_dir={str(tmp_path / 'outputs')!r})
+print(built, again, sorted(m for m in ('matplotlib', 'seaborn') if m in sys.modules))
+"""
+    out = subprocess.run([sys.executable, '-c', script], cwd=TASK3, capture_output=True, text=True,
+                         check=True).stdout
+    assert out.strip().splitlines()[-1] == "['model_metrics.json'] [] []"
+    metrics = json.loads((tmp_path / 'outputs' / 'model_metrics.json').read_text())
+    assert metrics['accuracy'] > 0.8
@@ -0,0 +1,43 @@
+# tests/test_backends.py
+# Driver backends by name, and the in-process backend's results.
+import pytest
+
+import backends
+from backends import make_backend
+from case_tables import DEFAULT_CASES, credential_permutations
+from login_test_automation import PHASES, LoginTestAutomation
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError, match="unknown backend 'firefox'; choose from selenium, inprocess"):
+        make_backend("firefox")
+
+def test_constructor_errors_are_not_reported_as_unknown_backends(monkeypatch):
+    class Broken:
+        def __init__(self, **options):
+            raise KeyError("driver_path")
+
+    monkeypatch.setitem(backends.BACKENDS, "broken", Broken)
+    with pytest.raises(KeyError, match="driver_path"):
+        make_backend("broken")
+
+def test_inprocess_backend_runs_the_default_cases():
+    session = LoginTestAutomation(backend="inprocess")
+    try:
+        session.setup_test_page()
+        results = session.run_all_tests()
+    finally:
+        session.close()
+    assert [r["test_name"] for r in results] == [c.test_name for c in DEFAULT_CASES]
+    assert all(r["passed"] for r in results), results
+    for result in results:
+        assert set(result["timings"]) == {f"{phase}_ms" for phase in PHASES + ("total",)}
+
+def test_inprocess_backend_checks_generated_cases():
+    session = LoginTestAutomation(backend="inprocess")
+    try:
+        session.setup_test_page()
+        results = session.run_all_tests(credential_permutations(200))
+    finally:
+        session.close()
+    assert len(results) == 200 and all(r["passed"] for r in results)
@@ -0,0 +1,44 @@
+# tests/test_batch_score.py
+# Chunked scoring of backlog files, including files without any rows.
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.preprocessing import StandardScaler
+
+from batch_score import score_chunk, select_features
+
+FEATURES = ['mean radius', 'mean texture', 'mean perimeter', 'mean area']
+
+
+@pytest.fixture(scope='module')
+def fitted():
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.normal(size=(60, len(FEATURES))), columns=FEATURES)
+    y = rng.integers(0, 3, size=len(X))
+    scaler = StandardScaler().fit(X)
+    model = RandomForestClassifier(n_estimators=5, random_state=0).fit(scaler.transform(X), y)
+    return model, scaler
+
+def test_score_chunk_keeps_columns_and_order(fitted):
+    model, scaler = fitted
+    chunk = pd.DataFrame(np.ones((3, len(FEATURES))), columns=FEATURES)
+    chunk.insert(0, 'id', [7, 8, 9])
+    scored = score_chunk(model, scaler, chunk, keep=['id'])
+    assert list(scored['id']) == [7, 8, 9]
+    assert list(scored.columns) == ['id', 'priority', 'priority_name',
+                                    'probability_0', 'probability_1', 'probability_2']
+    np.testing.assert_allclose(scored.filter(like='probability_').sum(axis=1), 1.0)
+
+def test_header_only_chunk_scores_to_an_empty_frame(fitted):
+    model, scaler = fitted
+    chunk = pd.DataFrame(columns=['id'] + FEATURES)
+    scored = score_chunk(model, scaler, chunk, keep=['id'])
+    assert len(scored) == 0
+    assert list(scored.columns) == ['id', 'priority', 'priority_name',
+                                    'probability_0', 'probability_1', 'probability_2']
+
+def test_missing_slider_feature_is_an_error():
+    chunk = pd.DataFrame(columns=['mean radius', 'mean texture', 'mean perimeter', 'mean areas'])
+    with pytest.raises(ValueError, match="'mean area' \\(found 'mean areas'\\?\\)"):
+        select_features(chunk, FEATURES, input_columns=(0, 1, 2, 3))
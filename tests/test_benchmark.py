@@ -0,0 +1,59 @@
+# tests/test_benchmark.py
+# The sorting benchmark's report, its regression check, and the shared
+# timing helpers it is built on.
+import json
+
+import pytest
+
+import benchmark
+from benchmark import compare_reports, measure, run_suite
+from timing_stats import fit_exponent, log_sizes, percentile
+
+
+def test_percentile_matches_numpy():
+    np = pytest.importorskip('numpy')
+    samples = [5, 1, 9, 3, 7, 2]
+    for q in (0, 33, 50, 95, 100):
+        assert percentile(samples, q) == pytest.approx(np.percentile(samples, q))
+
+def test_log_sizes_and_exponent():
+    sizes = log_sizes(10, 10**4, per_decade=2)
+    assert sizes[0] == 10 and sizes[-1] == 10**4 and len(sizes) == 7
+    exponent, r_squared = fit_exponent(sizes, [n * n for n in sizes])
+    assert exponent == pytest.approx(2.0) and r_squared == pytest.approx(1.0)
+
+def test_report_is_json_with_a_result_per_case_and_size():
+    report = run_suite(cases=['efficient_sort_dicts', 'top_k_100', 'sorted_index_updates'],
+                       sizes=[100, 1000], warmup=0, repeats=3, memory=False)
+    report = json.loads(json.dumps(report))
+    assert [(r['case'], r['size']) for r in report['results']] == [
+        ('efficient_sort_dicts', 100), ('top_k_100', 100), ('sorted_index_updates', 100),
+        ('efficient_sort_dicts', 1000), ('top_k_100', 1000), ('sorted_index_updates', 1000)]
+    for result in report['results']:
+        low, high = result['median_ci_ns']
+        assert result['min_ns'] <= low <= result['median_ns'] <= high
+    assert set(report['complexity']) == {'efficient_sort_dicts', 'top_k_100', 'sorted_index_updates'}
+
+def test_setup_runs_outside_the_timer():
+    calls = []
+    samples = measure(lambda prepared: calls.append(prepared), 'data', warmup=1, repeats=3,
+                      setup=lambda data: data.upper())
+    assert calls == ['DATA'] * 4 and len(samples) == 3
+
+def test_unknown_case_is_an_error():
+    with pytest.raises(ValueError, match="unknown benchmark cases"):
+        run_suite(cases=['bogo_sort'], sizes=[10])
+
+def _report(median, ci):
+    return {'results': [{'case': 'c', 'size': 10, 'median_ns': median, 'median_ci_ns': ci}]}
+
+def test_regression_needs_a_slowdown_outside_both_intervals():
+    baseline = _report(100, [95, 105])
+    assert compare_reports(baseline, _report(130, [125, 135]))[0]['ratio'] == pytest.approx(1.3)
+    assert compare_reports(baseline, _report(130, [100, 160])) == []  # intervals overlap
+    assert compare_reports(baseline, _report(108, [107, 109])) == []  # under the threshold
+    assert compare_reports(baseline, {'results': []}) == []
+
+def test_every_registered_case_runs():
+    for name in benchmark.available_cases():
+        run_suite(cases=[name], sizes=[50], warmup=0, repeats=1, memory=False)
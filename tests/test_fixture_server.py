@@ -0,0 +1,53 @@
+# tests/test_fixture_server.py
+# The local login page server: caching headers, keep-alive, latency
+# variants and rejected delays.
+import http.client
+
+import pytest
+
+from fixture_server import MAX_DELAY_MS, FixtureServer
+
+
+@pytest.fixture(scope='module')
+def server():
+    with FixtureServer() as server:
+        yield server
+
+def get(connection, path, headers=None):
+    connection.request("GET", path, headers=headers or {})
+    response = connection.getresponse()
+    return response, response.read()
+
+def test_revalidation_on_one_connection(server):
+    connection = http.client.HTTPConnection("127.0.0.1", server.port)
+    response, body = get(connection, "/login")
+    assert response.status == 200 and b"Login Test Page" in body
+    etag = response.getheader("ETag")
+    assert response.getheader("Cache-Control") == "max-age=3600"
+
+    response, body = get(connection, "/login", {"If-None-Match": etag})
+    assert (response.status, body) == (304, b"")
+    connection.close()
+
+def test_delay_variant_answers_later(server):
+    connection = http.client.HTTPConnection("127.0.0.1", server.port)
+    _, plain = get(connection, "/login")
+    response, delayed = get(connection, "/login?delay_ms=250")
+    assert b"const answerDelay = 250;" in delayed
+    assert response.getheader("ETag") != get(connection, "/login")[0].getheader("ETag")
+    _, capped = get(connection, "/login?delay_ms=1e12")
+    assert f"const answerDelay = {MAX_DELAY_MS};".encode() in capped
+    assert b"const answerDelay = 0;" in plain
+    connection.close()
+
+@pytest.mark.parametrize('delay', ['abc', 'nan', 'inf', '-inf', '1e400'])
+def test_bad_delays_are_rejected(server, delay):
+    connection = http.client.HTTPConnection("127.0.0.1", server.port)
+    response, body = get(connection, f"/login?delay_ms={delay}")
+    assert (response.status, body) == (400, b"delay_ms must be a finite number\n")
+    connection.close()
+
+def test_unknown_page(server):
+    connection = http.client.HTTPConnection("127.0.0.1", server.port)
+    assert get(connection, "/nope")[0].status == 404
+    connection.close()
@@ -0,0 +1,56 @@
+# tests/test_forest_compiler.py
+# The compiled forest gives sklearn's probabilities bit for bit.
+import numpy as np
+import pytest
+from sklearn.datasets import load_breast_cancer
+from sklearn.ensemble import RandomForestClassifier
+
+from forest_compiler import CompiledForest, compile_forest, parity_inputs
+from predictive_model import MODEL_PARAMS, SELECTED_FEATURES
+from priority_labels import iter_row_chunks, label_priorities
+
+
+@pytest.fixture(scope='module')
+def priority_data():
+    """The selected breast-cancer features with 'Low'/'Medium'/'High' labels and some NaN cells"""
+    data = load_breast_cancer()
+    labels, _ = label_priorities(lambda: iter_row_chunks(data.data))
+    columns = [list(data.feature_names).index(name) for name in SELECTED_FEATURES]
+    X = data.data[:, columns].copy()
+    rng = np.random.default_rng(0)
+    X[rng.random(X.shape) < 0.05] = np.nan
+    return X, labels
+
+@pytest.fixture(scope='module')
+def forest(priority_data):
+    X, y = priority_data
+    return RandomForestClassifier(**dict(MODEL_PARAMS, n_estimators=25)).fit(X, y)
+
+def test_probabilities_are_identical(priority_data, forest):
+    X, _ = priority_data
+    assert np.isnan(X).any()
+    compiled = compile_forest(forest)
+    assert np.array_equal(compiled.predict_proba(X), forest.predict_proba(X))
+    assert np.array_equal(compiled.predict(X), forest.predict(X))
+    assert set(compiled.predict(X)) <= {'Low', 'Medium', 'High'}
+
+def test_probabilities_are_identical_off_the_training_data(forest):
+    compiled = compile_forest(forest)
+    X = parity_inputs(compiled, rows=2000)
+    X[::7, 2] = np.nan
+    assert np.array_equal(compiled.predict_proba(X), forest.predict_proba(X))
+
+def test_single_rows_match(priority_data, forest):
+    X, _ = priority_data
+    compiled = compile_forest(forest)
+    for row in X[:50]:
+        assert np.array_equal(compiled.predict_proba(row), forest.predict_proba(row.reshape(1, -1)))
+
+def test_saved_forest_loads_identical(priority_data, forest, tmp_path):
+    X, _ = priority_data
+    compiled = compile_forest(forest)
+    path = tmp_path / 'forest.npz'
+    compiled.save(path)
+    loaded = CompiledForest.load(path)
+    assert np.array_equal(loaded.predict_proba(X), forest.predict_proba(X))
+    assert np.array_equal(loaded.predict(X), forest.predict(X))
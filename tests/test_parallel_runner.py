@@ -0,0 +1,57 @@
+# tests/test_parallel_runner.py
+# Sharded runs on a session pool merge back into case order, on the
+# browserless backend.
+import json
+
+from case_tables import DEFAULT_CASES, credential_permutations, load_cases
+from login_test_automation import LoginTestAutomation
+from parallel_runner import SessionPool, run_parallel, shard
+from result_sink import ResultSink
+
+
+def _comparable(results):
+    return [{k: v for k, v in r.items() if k != "timings"} for r in results]
+
+def test_shards_cover_every_case_once():
+    shards = shard(10, 4)
+    assert [len(s) for s in shards] == [3, 3, 2, 2]
+    assert sorted(i for s in shards for i in s) == list(range(10))
+    assert shard(2, 8) == [[0], [1]]
+
+def test_parallel_results_match_a_serial_run():
+    cases = credential_permutations(300)
+    serial = LoginTestAutomation(backend="inprocess")
+    try:
+        serial.setup_test_page()
+        expected = serial.run_all_tests(cases)
+    finally:
+        serial.close()
+
+    results, _ = run_parallel(cases, workers=4, backend="inprocess")
+    assert _comparable(results) == _comparable(expected)
+    assert all(r["passed"] for r in results)
+
+def test_pool_is_reused_across_runs():
+    with SessionPool(3, backend="inprocess") as pool:
+        sessions = list(pool.sessions)
+        first = pool.run(DEFAULT_CASES)
+        second = pool.run(DEFAULT_CASES)
+        assert pool.sessions == sessions
+    assert [r["test_name"] for r in first] == [c.test_name for c in DEFAULT_CASES]
+    assert _comparable(first) == _comparable(second)
+
+def test_streamed_results_carry_their_case_index(tmp_path):
+    cases = credential_permutations(50)
+    path = tmp_path / "results.jsonl"
+    with ResultSink(str(path), fsync=False) as sink:
+        results, _ = run_parallel(cases, workers=3, backend="inprocess", sink=sink)
+    assert results == []
+    with open(path) as f:
+        records = sorted((json.loads(line) for line in f), key=lambda r: r["index"])
+    assert [r["test_name"] for r in records] == [c.test_name for c in cases]
+
+def test_csv_case_table(tmp_path):
+    path = tmp_path / "cases.csv"
+    path.write_text("username,password,expected\nadmin,admin123,success\nadmin,nope,failure\n")
+    results, _ = run_parallel(load_cases(str(path)), workers=2, backend="inprocess")
+    assert [r["passed"] for r in results] == [True, True]
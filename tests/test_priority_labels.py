@@ -0,0 +1,54 @@
+# tests/test_priority_labels.py
+# The chunked labeling pipeline gives the labels of the original
+# per-row classify_priority loop.
+import numpy as np
+import pytest
+from sklearn.datasets import load_breast_cancer
+
+from priority_labels import (PRIORITY_LEVELS, StreamingPercentiles, iter_row_chunks,
+                             label_priorities, write_priority_codes)
+
+
+def classify_all(features):
+    """The labeling predictive_model.py used before the pipeline"""
+    feature_sums = features.sum(axis=1)
+    thresholds = np.percentile(feature_sums, [33, 67])
+
+    def classify_priority(val):
+        if val < thresholds[0]:
+            return "Low"
+        elif val < thresholds[1]:
+            return "Medium"
+        else:
+            return "High"
+
+    return np.array([classify_priority(val) for val in feature_sums])
+
+@pytest.mark.parametrize('chunk_rows', [1, 100, 1_000_000])
+def test_labels_match_the_original_loop(chunk_rows):
+    features = load_breast_cancer().data
+    labels, _ = label_priorities(lambda: iter_row_chunks(features, chunk_rows))
+    assert np.array_equal(labels, classify_all(features))
+
+def test_codes_on_disk_match_the_labels(tmp_path):
+    features = np.random.default_rng(0).normal(size=(5000, 4))
+    labels, thresholds = label_priorities(lambda: iter_row_chunks(features, 700))
+    path = tmp_path / 'codes.npy'
+    assert np.array_equal(write_priority_codes(lambda: iter_row_chunks(features, 700), path), thresholds)
+    assert np.array_equal(PRIORITY_LEVELS[np.load(path)], labels)
+
+def test_streaming_percentiles_are_exact_until_the_buffer_fills():
+    values = np.random.default_rng(1).normal(size=10_000)
+    estimator = StreamingPercentiles(max_exact=10_000)
+    for chunk in np.array_split(values, 7):
+        estimator.update(chunk)
+    assert estimator.exact
+    assert np.array_equal(estimator.percentiles([33, 67]), np.percentile(values, [33, 67]))
+
+def test_streaming_percentiles_estimate_beyond_the_buffer():
+    values = np.random.default_rng(2).uniform(size=200_000)
+    estimator = StreamingPercentiles(max_exact=20_000)
+    for chunk in np.array_split(values, 9):
+        estimator.update(chunk)
+    assert not estimator.exact
+    np.testing.assert_allclose(estimator.percentiles([33, 67]), [0.33, 0.67], atol=0.01)
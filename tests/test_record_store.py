@@ -0,0 +1,32 @@
+# tests/test_record_store.py
+# The columnar RecordStore against the list-of-dicts code it stands in for.
+import numpy as np
+
+from record_store import RecordStore
+from sorting_comparison import SortKey, generate_test_data, multi_key_sort
+
+KEYS = [SortKey('priority', descending=True), 'value', 'id']
+
+
+def test_store_round_trips_the_dicts():
+    records = generate_test_data(500, seed=3)
+    assert RecordStore.from_records(records).to_dicts() == records
+
+def test_argsort_matches_multi_key_sort():
+    store = RecordStore.generate(2000, seed=4)
+    expected = multi_key_sort(store.to_dicts(), KEYS)
+    assert store.take(store.argsort(KEYS)).to_dicts() == expected
+
+def test_sorting_a_slice_sorts_that_range_of_the_parent():
+    store = RecordStore.generate(100, seed=5)
+    before = store.to_dicts()
+    store[20:40].sort(KEYS)
+    after = store.to_dicts()
+    assert after[:20] == before[:20] and after[40:] == before[40:]
+    assert after[20:40] == multi_key_sort(before[20:40], KEYS)
+
+def test_take_detaches_from_the_parent():
+    store = RecordStore.generate(50, seed=6)
+    before = store.to_dicts()
+    store.take(np.arange(10, 30)).sort(KEYS)
+    assert store.to_dicts() == before
@@ -0,0 +1,27 @@
+# tests/test_sorting_demo.py
+# The Space's sorting comparison: which points are measured and which
+# are projected from a sample.
+import sorting_demo
+from sorting_demo import METHODS, compare_sorting
+
+
+def test_small_sizes_are_all_measured():
+    text, rows = compare_sorting(200, 'priority', seed=1)
+    assert not any(row['projected'] for row in rows)
+    assert max(row['size'] for row in rows) == 200
+    assert "(measured)" in text
+
+def test_large_sizes_are_projected_from_the_samples(monkeypatch):
+    monkeypatch.setattr(sorting_demo, 'MANUAL_SAMPLE_MAX', 100)
+    monkeypatch.setattr(sorting_demo, 'TIMSORT_SAMPLE_MAX', 1000)
+    text, rows = compare_sorting(5000, 'value', seed=1)
+    for row in rows:
+        if row['method'] == METHODS['manual']:
+            assert row['projected'] == (row['size'] > 100)
+        elif row['method'] == METHODS['timsort']:
+            assert row['projected'] == (row['size'] > 1000)
+        else:
+            assert not row['projected']
+    sizes = {row['size'] for row in rows}
+    assert {100, 1000, 5000} <= sizes
+    assert "projected from a 1,000-item sample as n log n comparisons" in text
@@ -0,0 +1,12 @@
+# tests/test_vendored.py
+# The Space's copies of the shared modules match their originals.
+import sync_vendored
+
+
+def test_vendored_copies_are_up_to_date():
+    assert sync_vendored.stale() == [], "run python huggingface_space/sync_vendored.py"
+
+def test_vendored_copy_keeps_the_original_code():
+    source = sync_vendored.vendored_source('record_store.py', sync_vendored.VENDORED['record_store.py'])
+    assert source.startswith("# huggingface_space/record_store.py\n")
+    assert "class RecordStore" in source